@@ -160,6 +160,33 @@ def integration(session: nox.Session):
     session.run("coverage", "report", env=env)
 
 
+@nox.session
+def benchmark(session: nox.Session):
+    """
+    Run the benchmarks in tests/benchmarks/.
+
+    Without arguments, all benchmarks are run with their default settings. To run
+    a single benchmark, pass its name (for example ``render`` for
+    ``render_benchmark.py``), followed by the arguments for that benchmark.
+    """
+    scripts = {
+        script.name.removesuffix("_benchmark.py"): script
+        for script in sorted(Path("tests", "benchmarks").glob("*_benchmark.py"))
+    }
+    if session.posargs and session.posargs[0] not in scripts:
+        session.error(
+            f"Unknown benchmark {session.posargs[0]!r}."
+            f" Available benchmarks: {', '.join(scripts)}"
+        )
+    install(session, ".", *other_antsibull(), editable=True)
+    if session.posargs:
+        name, *args = session.posargs
+        session.run("python", str(scripts[name]), *args)
+        return
+    for script in scripts.values():
+        session.run("python", str(script))
+
+
 @nox.session
 def coverage(session: nox.Session):
     install(session, ".[coverage]", *other_antsibull(), editable=True)
@@ -0,0 +1,427 @@
+# Author: Felix Fontein <felix@fontein.de>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or
+# https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-FileCopyrightText: 2026, Ansible Project
+
+"""
+Run ansible-doc, optionally through a persistent worker process.
+"""
+
+from __future__ import annotations
+
+import codecs
+import io
+import json
+import os
+import re
+import shlex
+import shutil
+import subprocess
+import sys
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import IO, Any
+
+from .logger import LOGGER
+
+_WORKER_PATH = os.path.join(os.path.dirname(__file__), "ansible_doc_worker.py")
+
+_CHUNK_SIZE = 1 << 16
+
+
+def _get_interpreter(ansible_doc_path: str) -> list[str] | None:
+    """
+    Determine the command of the Python interpreter used by ansible-doc from its
+    shebang line.
+    """
+    path = shutil.which(ansible_doc_path)
+    if path is None:
+        return None
+    try:
+        with open(path, "rb") as f:
+            first_line = f.readline()
+    except OSError:
+        return None
+    if not first_line.startswith(b"#!"):
+        return None
+    return shlex.split(first_line[2:].decode("utf-8").strip()) or None
+
+
+class _LimitedReader(io.RawIOBase):
+    """
+    Reads a fixed number of bytes from another stream.
+    """
+
+    def __init__(self, stream: IO[bytes], size: int):
+        self._stream = stream
+        self._remaining = size
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        size = min(len(buffer), self._remaining)
+        if size == 0:
+            return 0
+        data = self._stream.read(size)
+        if not data:
+            raise ValueError("ansible-doc worker terminated unexpectedly")
+        buffer[: len(data)] = data
+        self._remaining -= len(data)
+        return len(data)
+
+    def drain(self) -> None:
+        """
+        Skip the bytes that have not been read yet.
+        """
+        while self._remaining:
+            self.read(min(self._remaining, _CHUNK_SIZE))
+
+
+class AnsibleDocWorker:
+    """
+    A helper process that imports ansible once and runs ansible-doc requests in
+    forked child processes.
+
+    Requests are processed one after another.
+    """
+
+    ansible_doc_path: str
+    _process: subprocess.Popen
+    _stdin: IO[bytes]
+    _stdout: IO[bytes]
+    _lock: threading.Lock
+
+    def __init__(self, ansible_doc_path: str):
+        """
+        Start the worker.
+
+        :arg ansible_doc_path: Path to ansible-doc. The worker uses the same Python
+                               interpreter.
+        :raises ValueError: If the worker cannot be started
+        """
+        interpreter = _get_interpreter(ansible_doc_path)
+        if interpreter is None:
+            raise ValueError(
+                f"Cannot determine Python interpreter of {ansible_doc_path}"
+            )
+        self.ansible_doc_path = ansible_doc_path
+        try:
+            self._process = subprocess.Popen(  # pylint: disable=consider-using-with
+                interpreter + [_WORKER_PATH],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+            )
+        except OSError as exc:
+            raise ValueError(f"Cannot start {interpreter[0]}: {exc}") from exc
+        assert self._process.stdin is not None and self._process.stdout is not None
+        self._stdin = self._process.stdin
+        self._stdout = self._process.stdout
+        self._lock = threading.Lock()
+        try:
+            header = self._read_header()
+        except ValueError:
+            self.close()
+            raise
+        if not header.get("ready"):
+            self.close()
+            raise ValueError(f"Cannot import ansible: {header.get('error')}")
+
+    def _read_header(self) -> dict[str, Any]:
+        line = self._stdout.readline()
+        if not line:
+            raise ValueError("ansible-doc worker terminated unexpectedly")
+        return json.loads(line)
+
+    def _read_exactly(self, size: int) -> bytes:
+        data = self._stdout.read(size)
+        if len(data) != size:
+            raise ValueError("ansible-doc worker terminated unexpectedly")
+        return data
+
+    def _forward_stderr(self, size: int) -> bytes:
+        stderr = self._read_exactly(size)
+        if stderr:
+            sys.stderr.buffer.write(stderr)
+            sys.stderr.flush()
+        return stderr
+
+    @contextmanager
+    def stream(self, args: list[str]) -> Iterator[IO[bytes]]:
+        """
+        Run ansible-doc with the given arguments and provide its output as a stream.
+
+        :raises subprocess.CalledProcessError: If ansible-doc fails
+        :raises ValueError: If the worker terminated
+        """
+        with self._lock:
+            try:
+                self._stdin.write(json.dumps(args).encode("utf-8") + b"\n")
+                self._stdin.flush()
+            except OSError as exc:
+                raise ValueError(
+                    f"Cannot send request to ansible-doc worker: {exc}"
+                ) from exc
+            header = self._read_header()
+            if header["rc"] != 0:
+                stdout = self._read_exactly(header["stdout"])
+                stderr = self._forward_stderr(header["stderr"])
+                raise subprocess.CalledProcessError(
+                    header["rc"], [self.ansible_doc_path] + args, stdout, stderr
+                )
+            output = _LimitedReader(self._stdout, header["stdout"])
+            try:
+                yield io.BufferedReader(output)
+            finally:
+                output.drain()
+                self._forward_stderr(header["stderr"])
+
+    def run(self, args: list[str]) -> bytes:
+        """
+        Run ansible-doc with the given arguments and return its output.
+
+        :raises subprocess.CalledProcessError: If ansible-doc fails
+        :raises ValueError: If the worker terminated
+        """
+        with self.stream(args) as output:
+            return output.read()
+
+    def close(self) -> None:
+        """
+        Stop the worker.
+        """
+        try:
+            self._stdin.close()
+        except OSError:
+            pass
+        try:
+            self._process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self._process.kill()
+            self._process.wait()
+        self._stdout.close()
+
+
+class _Session:
+    # pylint: disable=too-few-public-methods
+    """
+    Starts an ansible-doc worker on first use.
+    """
+
+    def __init__(self, ansible_doc_path: str):
+        self.ansible_doc_path = ansible_doc_path
+        self.worker: AnsibleDocWorker | None = None
+        self.failed = False
+        self._lock = threading.Lock()
+
+    def get_worker(self) -> AnsibleDocWorker | None:
+        """
+        Return the worker, or ``None`` if it cannot be started.
+        """
+        with self._lock:
+            if self.worker is None and not self.failed:
+                try:
+                    self.worker = AnsibleDocWorker(self.ansible_doc_path)
+                    LOGGER.debug(
+                        "Started ansible-doc worker for {}", self.ansible_doc_path
+                    )
+                except ValueError as exc:
+                    LOGGER.warning(
+                        "Cannot start ansible-doc worker, running ansible-doc"
+                        " for every request instead: {}",
+                        exc,
+                    )
+                    self.failed = True
+            return self.worker
+
+
+_SESSIONS: dict[str, _Session] = {}
+
+
+@contextmanager
+def ansible_doc_session(ansible_doc_path: str, enabled: bool = True) -> Iterator[None]:
+    """
+    While this context is active, ``check_output()`` sends ansible-doc requests for
+    ``ansible_doc_path`` to a persistent worker process. The worker is started on first
+    use. Nested sessions for the same ansible-doc share the worker, so a session can
+    span several collections.
+
+    :arg ansible_doc_path: Path to ansible-doc
+    :arg enabled: If ``False``, the context does nothing
+    """
+    if not enabled or ansible_doc_path in _SESSIONS:
+        yield
+        return
+    session = _SESSIONS[ansible_doc_path] = _Session(ansible_doc_path)
+    try:
+        yield
+    finally:
+        del _SESSIONS[ansible_doc_path]
+        if session.worker is not None:
+            session.worker.close()
+
+
+def check_output(command: list[str]) -> bytes:
+    """
+    Run a command and return its output. If the command is ansible-doc and an
+    ansible-doc session is active for it, the command is run by the session's worker.
+
+    :raises subprocess.CalledProcessError: If the command fails
+    """
+    session = _SESSIONS.get(command[0])
+    worker = session.get_worker() if session is not None else None
+    if worker is None:
+        return subprocess.check_output(command)
+    return worker.run(command[1:])
+
+
+@contextmanager
+def stream_output(command: list[str]) -> Iterator[IO[bytes]]:
+    """
+    Run a command and provide its output as a stream. Like ``check_output()``, the
+    command is run by a worker if an ansible-doc session is active for it.
+
+    :raises subprocess.CalledProcessError: If the command fails. This happens when the
+                                           context is left
+    """
+    session = _SESSIONS.get(command[0])
+    worker = session.get_worker() if session is not None else None
+    if worker is not None:
+        with worker.stream(command[1:]) as output:
+            yield output
+        return
+    with subprocess.Popen(command, stdout=subprocess.PIPE) as process:
+        assert process.stdout is not None
+        try:
+            yield process.stdout
+            while process.stdout.read(_CHUNK_SIZE):
+                pass
+        except Exception as exc:
+            # Errors while processing the output are often caused by the command
+            # failing, for example because it produced no or partial output. In
+            # that case, report the command's failure instead.
+            while process.stdout.read(_CHUNK_SIZE):
+                pass
+            if process.wait():
+                raise subprocess.CalledProcessError(
+                    process.returncode, command
+                ) from exc
+            raise
+        except BaseException:
+            process.kill()
+            raise
+    if process.returncode:
+        raise subprocess.CalledProcessError(process.returncode, command)
+
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class _JSONStreamReader:
+    """
+    Incrementally parses JSON from a binary stream. Only the parts of the document
+    that are consumed with ``read_value()`` are decoded as a whole.
+    """
+
+    def __init__(self, stream: IO[bytes]):
+        self._stream = stream
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json_decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self, size: int) -> None:
+        chunk = self._stream.read(size)
+        self._eof = not chunk
+        self._buffer = self._buffer[self._pos :] + self._text_decoder.decode(
+            chunk, final=self._eof
+        )
+        self._pos = 0
+
+    def peek(self) -> str:
+        """
+        Skip whitespace and return the next character, or an empty string at the end.
+        """
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()  # type: ignore[union-attr]
+            if self._pos < len(self._buffer) or self._eof:
+                return self._buffer[self._pos : self._pos + 1]
+            self._fill(_CHUNK_SIZE)
+
+    def _expect(self, characters: str) -> str:
+        character = self.peek()
+        if not character or character not in characters:
+            raise ValueError(
+                f"Expected one of {characters!r}, found {character or 'end of data'!r}"
+            )
+        self._pos += 1
+        return character
+
+    def read_value(self) -> Any:
+        """
+        Read and decode the next JSON value.
+        """
+        self.peek()
+        size = _CHUNK_SIZE
+        while True:
+            try:
+                value, end = self._json_decoder.raw_decode(self._buffer, self._pos)
+                # A value ending at the end of the buffer (like a number) might continue
+                if end < len(self._buffer) or self._eof:
+                    self._pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            self._fill(size)
+            size *= 2
+
+    def iter_object(self) -> Iterator[str]:
+        """
+        Iterate over the keys of the next JSON object. The caller must consume the
+        value of every key before continuing the iteration.
+        """
+        self._expect("{")
+        if self.peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self.read_value()
+            if not isinstance(key, str):
+                raise ValueError(f"Expected object key, found {key!r}")
+            self._expect(":")
+            yield key
+            if self._expect(",}") == "}":
+                return
+
+
+def _iter_object_values(reader: _JSONStreamReader) -> Iterator[tuple[str, Any]]:
+    for key in reader.iter_object():
+        yield key, reader.read_value()
+
+
+def iter_metadata_dump(
+    stream: IO[bytes],
+) -> Iterator[tuple[str, Iterator[tuple[str, Any]]]]:
+    """
+    Incrementally parse the output of ``ansible-doc --metadata-dump``.
+
+    Yields tuples ``(plugin_type, plugins)`` for every plugin type in ``all``.
+    ``plugins`` yields tuples ``(plugin_name, data)`` and must be exhausted before
+    continuing with the next plugin type. Only the data of a single plugin is decoded
+    at the same time.
+
+    :raises ValueError: If the output is not valid JSON
+    """
+    reader = _JSONStreamReader(stream)
+    for key in reader.iter_object():
+        if key != "all":
+            reader.read_value()
+            continue
+        for plugin_type in reader.iter_object():
+            yield plugin_type, _iter_object_values(reader)
+    if reader.peek():
+        raise ValueError("Extra data after JSON object")
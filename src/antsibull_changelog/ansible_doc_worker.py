@@ -0,0 +1,150 @@
+# Author: Felix Fontein <felix@fontein.de>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or
+# https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-FileCopyrightText: 2026, Ansible Project
+
+"""
+Long-running helper process that answers ansible-doc requests without importing
+ansible again for every request.
+
+This script is run with the Python interpreter of ansible-doc, and must therefore
+not import anything from antsibull_changelog.
+
+Responses are written to the stdout the worker was started with. Before importing
+ansible, the worker redirects its own stdout to stderr, so that output while
+importing ansible or outside of requests cannot corrupt the responses.
+
+After importing ansible, a JSON header ``{"ready": true}`` (or ``{"ready": false,
+"error": ...}``) is written, followed by a newline. Afterwards, every line
+read from stdin must contain a JSON list of ansible-doc arguments. For every request,
+a child process is forked which runs ansible-doc with these arguments. Once it is
+done, a JSON header ``{"rc": ..., "stdout": ..., "stderr": ...}`` with the return
+code and the sizes of stdout and stderr in bytes is written, followed by a newline,
+the content of stdout, and the content of stderr.
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import traceback
+
+
+def _load_ansible_doc_main():
+    # The directory of this script contains antsibull_changelog's ansible module,
+    # which would shadow the ansible package.
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    sys.path[:] = [
+        path for path in sys.path if os.path.abspath(path or ".") != script_dir
+    ]
+    try:
+        # pylint: disable-next=import-outside-toplevel
+        from ansible.cli.doc import main  # type: ignore[import-not-found]
+
+        return main
+    except ImportError:
+        # ansible-base 2.10 and older do not have main()
+        # pylint: disable-next=import-outside-toplevel
+        from ansible.cli.doc import DocCLI  # type: ignore[import-not-found]
+
+        def main(args):
+            sys.exit(DocCLI(args).run())
+
+        return main
+
+
+def _get_exit_code(exc):
+    if exc.code is None:
+        return 0
+    if isinstance(exc.code, int):
+        return exc.code
+    sys.stderr.write("{0}\n".format(exc.code))
+    return 1
+
+
+def _run_child(main, args, stdout, stderr):
+    rc = 0
+    try:
+        os.dup2(stdout.fileno(), 1)
+        os.dup2(stderr.fileno(), 2)
+        try:
+            main(["ansible-doc"] + args)
+        except SystemExit as exc:
+            rc = _get_exit_code(exc)
+    except BaseException:  # pylint: disable=broad-exception-caught
+        traceback.print_exc()
+        rc = 1
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(rc)  # pylint: disable=protected-access
+
+
+def _run(main, args, stdout, stderr):
+    pid = os.fork()
+    if pid == 0:
+        _run_child(main, args, stdout, stderr)
+    _, status = os.waitpid(pid, 0)
+    if os.WIFEXITED(status):
+        return os.WEXITSTATUS(status)
+    return 1
+
+
+def _open_output():
+    """
+    Return a binary stream for the responses, and redirect stdout to stderr.
+    """
+    sys.stdout.flush()
+    output = os.fdopen(os.dup(1), "wb")
+    os.dup2(2, 1)
+    return output
+
+
+def _write_header(output, header):
+    output.write(json.dumps(header).encode("utf-8") + b"\n")
+    output.flush()
+
+
+def main():
+    """
+    Main entrypoint of the worker.
+    """
+    output = _open_output()
+    if not hasattr(os, "fork"):
+        _write_header(output, {"ready": False, "error": "fork() is not supported"})
+        return 1
+    try:
+        ansible_doc_main = _load_ansible_doc_main()
+    except Exception as exc:  # pylint: disable=broad-exception-caught
+        _write_header(output, {"ready": False, "error": str(exc)})
+        return 1
+    _write_header(output, {"ready": True})
+
+    while True:
+        line = sys.stdin.buffer.readline()
+        if not line:
+            return 0
+        args = json.loads(line)
+        # Buffered output must not be written again by the forked child
+        sys.stdout.flush()
+        sys.stderr.flush()
+        with tempfile.TemporaryFile() as stdout, tempfile.TemporaryFile() as stderr:
+            rc = _run(ansible_doc_main, args, stdout, stderr)
+            _write_header(
+                output,
+                {
+                    "rc": rc,
+                    "stdout": os.fstat(stdout.fileno()).st_size,
+                    "stderr": os.fstat(stderr.fileno()).st_size,
+                },
+            )
+            for f in (stdout, stderr):
+                f.seek(0)
+                shutil.copyfileobj(f, output)
+            output.flush()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
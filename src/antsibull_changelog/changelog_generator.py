@@ -12,8 +12,7 @@ Generate reStructuredText changelog from ChangesData instance.
 from __future__ import annotations
 
 import abc
-import collections
-from collections.abc import MutableMapping
+from collections.abc import Iterator, MutableMapping
 from typing import Any, cast
 
 from .changes import ChangesData, FragmentResolver, PluginResolver
@@ -180,33 +179,62 @@ class ChangelogGeneratorBase(abc.ABC):
 
             self._update_modules_plugins_objects(entry_config, release)
 
-    def collect(
+    def iter_entries(
         self,
         squash: bool = False,
         after_version: str | None = None,
         until_version: str | None = None,
-    ) -> list[ChangelogEntry]:
+        only_latest: bool = False,
+    ) -> Iterator[ChangelogEntry]:
         """
-        Collect release entries.
+        Iterate over release entries, from latest to earliest.
+
+        Every entry is collected only when it is requested, so the caller does not need
+        to keep all entries in memory at the same time.
 
         :arg squash: Squash all releases into one entry
         :arg after_version: If given, only consider versions after this one
         :arg until_version: If given, do not consider versions following this one
-        :return: An ordered mapping of versions to release entries
+        :arg only_latest: If set to ``True``, only collect the latest entry. Only the
+                          releases that are part of that entry are resolved.
         """
-        release_entries: MutableMapping[str, ChangelogEntry] = collections.OrderedDict()
-
         for entry_version, versions in collect_versions(
             self.changes.releases,
             self.config,
             after_version=after_version,
             until_version=until_version,
             squash=squash,
+            only_latest=only_latest,
         ):
-            entry_config = get_entry_config(release_entries, entry_version)
+            entry_config = ChangelogEntry(entry_version)
             self._collect_entry(entry_config, entry_version, versions)
+            yield entry_config
 
-        return list(release_entries.values())
+    def collect(
+        self,
+        squash: bool = False,
+        after_version: str | None = None,
+        until_version: str | None = None,
+        only_latest: bool = False,
+    ) -> list[ChangelogEntry]:
+        """
+        Collect release entries.
+
+        :arg squash: Squash all releases into one entry
+        :arg after_version: If given, only consider versions after this one
+        :arg until_version: If given, do not consider versions following this one
+        :arg only_latest: If set to ``True``, only collect the latest entry. Only the
+                          releases that are part of that entry are resolved.
+        :return: An ordered list of release entries
+        """
+        return list(
+            self.iter_entries(
+                squash=squash,
+                after_version=after_version,
+                until_version=until_version,
+                only_latest=only_latest,
+            )
+        )
 
     def get_fqcn_prefix(self) -> str | None:
         """
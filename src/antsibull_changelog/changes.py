@@ -11,13 +11,12 @@ Classes handling ``changelog.yaml`` (new Ansible and collections)
 
 from __future__ import annotations
 
-import collections
 import datetime
 import os
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from typing import Any, Mapping, Sequence, cast
 
-from antsibull_fileutils.yaml import load_yaml_file, store_yaml_file
+from antsibull_fileutils.yaml import load_yaml_file, store_yaml_stream
 
 from .changes_resolvers import (
     ChangesDataFragmentResolver,
@@ -29,6 +28,7 @@ from .changes_resolvers import (
 from .config import ChangelogConfig
 from .fragment import ChangelogFragment
 from .logger import LOGGER
+from .output_file import OutputFile
 from .plugins import PluginDescription
 from .sanitize import sanitize_changes
 from .utils import get_version_constructor, is_release_version
@@ -46,6 +46,83 @@ def _sort_modules_plugins_objects(
     )
 
 
+def _iterate_release_plugins(release: Mapping[str, Any]) -> Iterator[tuple[str, str]]:
+    """
+    Iterate over the types and names of all plugins and modules of a release.
+    """
+    for module in release.get("modules", []):
+        yield "module", module["name"]
+    for plugin_type, plugins in release.get("plugins", {}).items():
+        for plugin in plugins:
+            yield plugin_type, plugin["name"]
+
+
+def _iterate_release_objects(release: Mapping[str, Any]) -> Iterator[tuple[str, str]]:
+    """
+    Iterate over the types and names of all objects of a release.
+    """
+    for object_type, objects in release.get("objects", {}).items():
+        for ansible_object in objects:
+            yield object_type, ansible_object["name"]
+
+
+def _get_release_plugin_entries(
+    release: Mapping[str, Any], plugin_type: str
+) -> list[dict[str, Any]] | None:
+    if plugin_type == "module":
+        return release.get("modules")
+    return release.get("plugins", {}).get(plugin_type)
+
+
+def _get_release_object_entries(
+    release: Mapping[str, Any], object_type: str
+) -> list[dict[str, Any]] | None:
+    return release.get("objects", {}).get(object_type)
+
+
+class _ReleaseIndex:
+    """
+    Maps names to the versions of the releases that contain them.
+    """
+
+    def __init__(self):
+        self._versions: dict[str, set[str]] = {}
+
+    def add(self, name: str, version: str) -> None:
+        """
+        Record that the release ``version`` contains ``name``.
+        """
+        self._versions.setdefault(name, set()).add(version)
+
+    def discard(self, name: str, version: str) -> None:
+        """
+        Record that the release ``version`` no longer contains ``name``.
+        """
+        versions = self._versions.get(name)
+        if versions is not None:
+            versions.discard(version)
+            if not versions:
+                del self._versions[name]
+
+    def pop(self, name: str) -> set[str]:
+        """
+        Remove ``name`` and return the versions of the releases that contained it.
+        """
+        return self._versions.pop(name, set())
+
+    def get(self, name: str) -> set[str]:
+        """
+        Return the versions of the releases that contain ``name``.
+        """
+        return self._versions.get(name, set())
+
+    def names(self) -> list[str]:
+        """
+        Return all names contained in any release.
+        """
+        return list(self._versions)
+
+
 class ChangesData:  # pylint: disable=too-many-public-methods
     """
     Read, write and manage modern change metadata.
@@ -60,6 +137,8 @@ class ChangesData:  # pylint: disable=too-many-public-methods
     known_objects: set[str]
     known_fragments: set[str]
     ancestor: str | None
+    _plugin_index: _ReleaseIndex
+    _object_index: _ReleaseIndex
 
     def __init__(
         self,
@@ -86,6 +165,8 @@ class ChangesData:  # pylint: disable=too-many-public-methods
         self.known_plugins = set()
         self.known_objects = set()
         self.ancestor = None
+        self._plugin_index = _ReleaseIndex()
+        self._object_index = _ReleaseIndex()
         self.config = config
         self.load(
             data_override=data_override, extra_data_extractor=extra_data_extractor
@@ -125,31 +206,43 @@ class ChangesData:  # pylint: disable=too-many-public-methods
         self.data = sanitize_changes(data, config=self.config)
         self.ancestor = self.data.get("ancestor")
 
-        for _, config in self.releases.items():
-            for plugin_type, plugins in config.get("plugins", {}).items():
-                self.known_plugins |= set(
-                    "%s/%s" % (plugin_type, plugin["name"]) for plugin in plugins
-                )
-
-            for object_type, objects in config.get("objects", {}).items():
-                self.known_objects |= set(
-                    "%s/%s" % (object_type, ansible_object["name"])
-                    for ansible_object in objects
-                )
+        self._plugin_index = _ReleaseIndex()
+        self._object_index = _ReleaseIndex()
+        for version, config in self.releases.items():
+            self._index_release(version, config)
+            self.known_fragments.update(config.get("fragments", []))
 
-            modules = config.get("modules", [])
+        self.known_plugins.update(self._plugin_index.names())
+        self.known_objects.update(self._object_index.names())
 
-            self.known_plugins |= set(
-                "module/%s" % module["name"] for module in modules
-            )
+    def _index_release(self, version: str, release: Mapping[str, Any]) -> None:
+        """
+        Add the plugins and objects of a release to the indexes.
+        """
+        for plugin_type, name in _iterate_release_plugins(release):
+            self._plugin_index.add("%s/%s" % (plugin_type, name), version)
+        for object_type, name in _iterate_release_objects(release):
+            self._object_index.add("%s/%s" % (object_type, name), version)
 
-            self.known_fragments |= set(config.get("fragments", []))
+    def _unindex_release(self, version: str) -> None:
+        """
+        Remove the plugins and objects of a release from the indexes.
+        """
+        release = self.releases.get(version, {})
+        for plugin_type, name in _iterate_release_plugins(release):
+            self._plugin_index.discard("%s/%s" % (plugin_type, name), version)
+        for object_type, name in _iterate_release_objects(release):
+            self._object_index.discard("%s/%s" % (object_type, name), version)
 
-    def save(self, *, extra_data: dict | None = None) -> None:
+    def save(self, *, extra_data: dict | None = None) -> bool:
         """
         Save the change metadata to disk.
 
+        If ``compare_before_write`` is enabled in the configuration, the file is left
+        alone if its content would not change.
+
         :kwarg extra_data: Additional data to store into the file.
+        :return: Whether the file was written.
         """
         if not self.path:
             raise ValueError(
@@ -161,12 +254,19 @@ class ChangesData:  # pylint: disable=too-many-public-methods
         data = self.data.copy()
         if extra_data:
             data.update(extra_data)
-        store_yaml_file(
-            self.path,
-            data,
-            nice=self.config.changelog_nice_yaml,
-            sort_keys=sort_keys,
+        output_file = OutputFile(
+            self.path, encoding=None, compare=self.config.compare_before_write
         )
+        with output_file as stream:
+            store_yaml_stream(
+                stream,
+                data,
+                nice=self.config.changelog_nice_yaml,
+                sort_keys=sort_keys,
+            )
+        if not output_file.changed:
+            LOGGER.info("{} is unchanged", self.path)
+        return output_file.changed
 
     def version_constructor(self, version: str) -> Any:
         """
@@ -181,7 +281,7 @@ class ChangesData:  # pylint: disable=too-many-public-methods
 
         Must only be called if ``has_release`` is ``True``.
         """
-        return sorted(self.releases, reverse=True, key=self.version_constructor)[0]
+        return max(self.releases, key=self.version_constructor)
 
     @property
     def has_release(self) -> bool:
@@ -197,6 +297,54 @@ class ChangesData:  # pylint: disable=too-many-public-methods
         """
         return cast(dict[str, dict[str, Any]], self.data["releases"])
 
+    @staticmethod
+    def _remove_entries(
+        index: _ReleaseIndex,
+        releases: dict[str, dict[str, Any]],
+        get_entries: Callable[[Mapping[str, Any], str], list[dict[str, Any]] | None],
+        valid: dict[str, PluginDescription],
+    ) -> set[str]:
+        """
+        Remove plugin or object entries that are not in ``valid`` from all releases
+        that contain them.
+
+        :return: The composite names of the removed plugins or objects
+        """
+        removed = set()
+        for composite_name in index.names():
+            if composite_name in valid:
+                continue
+            entry_type, name = composite_name.split("/", 1)
+            for version in index.pop(composite_name):
+                entries = get_entries(releases.get(version, {}), entry_type)
+                if entries:
+                    entries[:] = [entry for entry in entries if entry["name"] != name]
+            removed.add(composite_name)
+        return removed
+
+    @staticmethod
+    def _refresh_entries(
+        index: _ReleaseIndex,
+        releases: dict[str, dict[str, Any]],
+        get_entries: Callable[[Mapping[str, Any], str], list[dict[str, Any]] | None],
+        valid: dict[str, PluginDescription],
+    ) -> None:
+        """
+        Update the plugin or object entries of ``valid`` in all releases that contain
+        them. Entries that did not change are not touched.
+        """
+        for composite_name, plugin in valid.items():
+            new_entry: dict | None = None
+            for version in index.get(composite_name):
+                entries = get_entries(releases.get(version, {}), plugin.type) or []
+                for position, entry in enumerate(entries):
+                    if entry["name"] != plugin.name:
+                        continue
+                    if new_entry is None:
+                        new_entry = ChangesData._create_plugin_entry(plugin)
+                    if entry != new_entry:
+                        entries[position] = dict(new_entry)
+
     def update_plugins(
         self, plugins: list[PluginDescription], allow_removals: bool | None
     ) -> None:
@@ -204,76 +352,25 @@ class ChangesData:  # pylint: disable=too-many-public-methods
         Update plugin descriptions, and remove plugins which are not in the provided list
         of plugins.
         """
-        valid_plugins: dict[str, dict[str, PluginDescription]] = (
-            collections.defaultdict(dict)
+        valid_plugins = {
+            "%s/%s" % (plugin.type, plugin.name): plugin
+            for plugin in plugins
+            if plugin.category == "plugin"
+        }
+        if allow_removals:
+            self.known_plugins -= self._remove_entries(
+                self._plugin_index,
+                self.releases,
+                _get_release_plugin_entries,
+                valid_plugins,
+            )
+        self._refresh_entries(
+            self._plugin_index,
+            self.releases,
+            _get_release_plugin_entries,
+            valid_plugins,
         )
 
-        for plugin in plugins:
-            if plugin.category == "plugin":
-                valid_plugins[plugin.type][plugin.name] = plugin
-
-        for _, config in self.releases.items():
-            if "modules" in config:
-                invalid_module_names = set(
-                    module["name"]
-                    for module in config["modules"]
-                    if module["name"] not in valid_plugins["module"]
-                )
-                if allow_removals:
-                    config["modules"] = [
-                        self._create_plugin_entry(
-                            valid_plugins["module"][module["name"]]
-                        )
-                        for module in config["modules"]
-                        if module["name"] not in invalid_module_names
-                    ]
-                    self.known_plugins -= set(
-                        "module/%s" % module_name
-                        for module_name in invalid_module_names
-                    )
-                else:
-                    config["modules"] = [
-                        (
-                            self._create_plugin_entry(
-                                valid_plugins["module"][module["name"]]
-                            )
-                            if module["name"] not in invalid_module_names
-                            else module
-                        )
-                        for module in config["modules"]
-                    ]
-
-            if "plugins" in config:
-                for plugin_type in config["plugins"]:
-                    invalid_plugin_names = set(
-                        plugin["name"]
-                        for plugin in config["plugins"][plugin_type]
-                        if plugin["name"] not in valid_plugins[plugin_type]
-                    )
-                    if allow_removals:
-                        config["plugins"][plugin_type] = [
-                            self._create_plugin_entry(
-                                valid_plugins[plugin_type][plugin["name"]]
-                            )
-                            for plugin in config["plugins"][plugin_type]
-                            if plugin["name"] not in invalid_plugin_names
-                        ]
-                        self.known_plugins -= set(
-                            "%s/%s" % (plugin_type, plugin_name)
-                            for plugin_name in invalid_plugin_names
-                        )
-                    else:
-                        config["plugins"][plugin_type] = [
-                            (
-                                self._create_plugin_entry(
-                                    valid_plugins[plugin_type][plugin["name"]]
-                                )
-                                if plugin["name"] not in invalid_plugin_names
-                                else plugin
-                            )
-                            for plugin in config["plugins"][plugin_type]
-                        ]
-
     def update_objects(
         self, objects: list[PluginDescription], allow_removals: bool | None
     ) -> None:
@@ -281,46 +378,25 @@ class ChangesData:  # pylint: disable=too-many-public-methods
         Update object descriptions, and remove objects which are not in the provided list
         of objects.
         """
-        valid_objects: dict[str, dict[str, PluginDescription]] = (
-            collections.defaultdict(dict)
+        valid_objects = {
+            "%s/%s" % (ansible_object.type, ansible_object.name): ansible_object
+            for ansible_object in objects
+            if ansible_object.category == "object"
+        }
+        if allow_removals:
+            self.known_objects -= self._remove_entries(
+                self._object_index,
+                self.releases,
+                _get_release_object_entries,
+                valid_objects,
+            )
+        self._refresh_entries(
+            self._object_index,
+            self.releases,
+            _get_release_object_entries,
+            valid_objects,
         )
 
-        for ansible_object in objects:
-            if ansible_object.category == "object":
-                valid_objects[ansible_object.type][ansible_object.name] = ansible_object
-
-        for _, config in self.releases.items():
-            if "objects" in config:
-                for object_type in config["objects"]:
-                    invalid_object_names = set(
-                        ansible_object["name"]
-                        for ansible_object in config["objects"][object_type]
-                        if ansible_object["name"] not in valid_objects[object_type]
-                    )
-                    if allow_removals:
-                        config["objects"][object_type] = [
-                            self._create_plugin_entry(
-                                valid_objects[object_type][ansible_object["name"]]
-                            )
-                            for ansible_object in config["objects"][object_type]
-                            if ansible_object["name"] not in invalid_object_names
-                        ]
-                        self.known_objects -= set(
-                            "%s/%s" % (object_type, object_name)
-                            for object_name in invalid_object_names
-                        )
-                    else:
-                        config["objects"][object_type] = [
-                            (
-                                self._create_plugin_entry(
-                                    valid_objects[object_type][ansible_object["name"]]
-                                )
-                                if ansible_object["name"] not in invalid_object_names
-                                else ansible_object
-                            )
-                            for ansible_object in config["objects"][object_type]
-                        ]
-
     def update_fragments(
         self,
         fragments: list[ChangelogFragment],
@@ -423,6 +499,7 @@ class ChangesData:  # pylint: disable=too-many-public-methods
                 )
                 return
             self.known_objects.add(composite_name)
+            self._object_index.add(composite_name, version)
             toplevel_type = "objects"
             has_categories = True
         elif obj_class == "plugin":
@@ -434,6 +511,7 @@ class ChangesData:  # pylint: disable=too-many-public-methods
                 )
                 return
             self.known_plugins.add(composite_name)
+            self._plugin_index.add(composite_name, version)
             if obj_type == "module":
                 toplevel_type = "modules"
                 has_categories = False
@@ -555,6 +633,7 @@ class ChangesData:  # pylint: disable=too-many-public-methods
         for version in list(self.data["releases"]):
             version_obj = self.version_constructor(version)
             if versions_after is not None and version_obj <= versions_after:
+                self._unindex_release(version)
                 del self.data["releases"][version]
                 current_ancestor = self.ancestor
                 if current_ancestor is None:
@@ -565,6 +644,7 @@ class ChangesData:  # pylint: disable=too-many-public-methods
                     self.ancestor = version
                 continue
             if versions_until is not None and version_obj > versions_until:
+                self._unindex_release(version)
                 del self.data["releases"][version]
                 continue
 
@@ -597,6 +677,7 @@ class ChangesData:  # pylint: disable=too-many-public-methods
             raise ValueError(f"Unknown version {version}")
         for a_version in list(self.releases):
             if self.version_constructor(a_version) > version_obj:
+                self._unindex_release(a_version)
                 del self.releases[a_version]
 
     def add_plugin(self, plugin: PluginDescription, version: str):
@@ -617,6 +698,7 @@ class ChangesData:  # pylint: disable=too-many-public-methods
             return False
 
         self.known_plugins.add(composite_name)
+        self._plugin_index.add(composite_name, version)
 
         if plugin.type == "module":
             if "modules" not in self.releases[version]:
@@ -655,6 +737,7 @@ class ChangesData:  # pylint: disable=too-many-public-methods
             return False
 
         self.known_objects.add(composite_name)
+        self._object_index.add(composite_name, version)
 
         if "objects" not in self.releases[version]:
             self.releases[version]["objects"] = {}
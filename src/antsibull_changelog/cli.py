@@ -43,10 +43,12 @@ from .config import (
 )
 from .errors import ChangelogError
 from .fragment import ChangelogFragment, ChangelogFragmentLinter, load_fragments
+from .fragment_cache import FragmentLintCache, get_lint_cache_path
 from .lint import lint_changelog_yaml
 from .logger import LOGGER, setup_logger
 from .plugins import PluginDescription, load_plugins
-from .rendering.changelog import generate_changelog
+from .rendering.block_cache import BlockCache, get_block_cache_path
+from .rendering.changelog import generate_changelogs
 from .toml import has_toml_loader_available, load_toml
 
 
@@ -157,6 +159,27 @@ def create_argparser(program_name: str) -> argparse.ArgumentParser:
         "(needed when galaxy.yml does not exist)",
     )
 
+    fragment_loading = argparse.ArgumentParser(add_help=False)
+    fragment_loading.add_argument(
+        "--fragment-load-jobs",
+        type=int,
+        metavar="N",
+        help="number of workers used to load changelog fragments"
+        " (overrides fragment_load_jobs from the config)",
+    )
+    fragment_loading.add_argument(
+        "--fragment-load-executor",
+        choices=["thread", "process"],
+        help="type of workers used to load changelog fragments"
+        " (overrides fragment_load_executor from the config)",
+    )
+    fragment_loading.add_argument(
+        "--no-fragment-cache",
+        action="store_true",
+        help="do not use the fragment cache, even if fragment_cache is enabled"
+        " in the config",
+    )
+
     subparsers = parser.add_subparsers(metavar="COMMAND")
 
     init_parser = subparsers.add_parser(
@@ -176,12 +199,28 @@ def create_argparser(program_name: str) -> argparse.ArgumentParser:
     )
 
     lint_parser = subparsers.add_parser(
-        "lint", parents=[common], help="check changelog fragments for syntax errors"
+        "lint",
+        parents=[common, fragment_loading],
+        help="check changelog fragments for syntax errors",
     )
     lint_parser.set_defaults(func=command_lint)
     lint_parser.add_argument(
         "fragments", metavar="FRAGMENT", nargs="*", help="path to fragment to test"
     )
+    lint_parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="only lint fragments whose content or the relevant configuration changed"
+        " since they have been linted before; lint results are stored in"
+        " changelogs/.lint-cache.json",
+    )
+    lint_parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="number of worker processes to lint fragments with (default: 1)",
+    )
 
     lint_changelog_yaml_parser = subparsers.add_parser(
         "lint-changelog-yaml",
@@ -221,6 +260,21 @@ def create_argparser(program_name: str) -> argparse.ArgumentParser:
         action="store_true",
         help="always use ansible-doc to find plugins",
     )
+    common_build.add_argument(
+        "--plugin-load-jobs",
+        type=int,
+        metavar="N",
+        help="number of plugin types to run ansible-doc for at the same time"
+        " with ansible-core 2.12 and older (overrides plugin_load_jobs from the"
+        " config)",
+    )
+    common_build.add_argument(
+        "--render-jobs",
+        type=int,
+        metavar="N",
+        help="number of worker processes used to render MarkDown changelogs when"
+        " more than one output is configured (overrides render_jobs from the config)",
+    )
     common_build.add_argument(
         "--refresh",
         action="store_true",
@@ -251,7 +305,13 @@ def create_argparser(program_name: str) -> argparse.ArgumentParser:
 
     release_parser = subparsers.add_parser(
         "release",
-        parents=[common, common_build, is_collection, collection_details],
+        parents=[
+            common,
+            common_build,
+            fragment_loading,
+            is_collection,
+            collection_details,
+        ],
         help="add a new release to the change metadata",
     )
     release_parser.set_defaults(func=command_release)
@@ -275,7 +335,13 @@ def create_argparser(program_name: str) -> argparse.ArgumentParser:
 
     generate_parser = subparsers.add_parser(
         "generate",
-        parents=[common, common_build, is_collection, collection_details],
+        parents=[
+            common,
+            common_build,
+            fragment_loading,
+            is_collection,
+            collection_details,
+        ],
         help="generate the changelog",
     )
     generate_parser.set_defaults(func=command_generate)
@@ -413,6 +479,42 @@ def command_init(args: Any) -> int:
     return C.RC_SUCCESS
 
 
+def _get_fragment_loading_options(args: Any) -> dict[str, Any]:
+    """
+    Extract fragment loading overrides from CLI args, to be passed to ``load_fragments()``.
+    """
+    jobs: int | None = args.fragment_load_jobs
+    if jobs is not None and jobs < 1:
+        raise ChangelogError("--fragment-load-jobs must be at least 1")
+    return {
+        "jobs": jobs,
+        "executor": args.fragment_load_executor,
+        "use_cache": False if args.no_fragment_cache else None,
+    }
+
+
+def _get_plugin_load_jobs(args: Any) -> int | None:
+    """
+    Extract the plugin loading job count override from CLI args.
+    """
+    jobs: int | None = args.plugin_load_jobs
+    if jobs is not None and jobs < 1:
+        raise ChangelogError("--plugin-load-jobs must be at least 1")
+    return jobs
+
+
+def _get_render_jobs(args: Any, config: ChangelogConfig) -> int:
+    """
+    Determine the number of worker processes used to render changelogs.
+    """
+    jobs: int | None = args.render_jobs
+    if jobs is None:
+        return config.render_jobs
+    if jobs < 1:
+        raise ChangelogError("--render-jobs must be at least 1")
+    return jobs
+
+
 def _determine_flatmap(
     collection_details: CollectionDetails, config: ChangelogConfig
 ) -> bool:
@@ -462,13 +564,18 @@ def _get_refresh_config(
 
 
 def _get_archive_loader(
-    archive_path_template: str, paths: PathsConfig, config: ChangelogConfig
+    archive_path_template: str,
+    paths: PathsConfig,
+    config: ChangelogConfig,
+    loading_options: dict[str, Any] | None = None,
 ) -> Callable[[str], list[ChangelogFragment]]:
     def load_extra_fragments(version: str) -> list[ChangelogFragment]:
         archive_path = os.path.join(
             paths.base_dir, archive_path_template.format(version=version)
         )
-        return load_fragments(paths, config, fragments_dir=archive_path)
+        return load_fragments(
+            paths, config, fragments_dir=archive_path, **(loading_options or {})
+        )
 
     return load_extra_fragments
 
@@ -494,6 +601,7 @@ def _do_refresh(  # pylint: disable=too-many-arguments
                 force_reload=args.reload_plugins,
                 use_ansible_doc=args.use_ansible_doc,
                 add_plugin_period=config.add_plugin_period,
+                jobs=_get_plugin_load_jobs(args),
             )
         allow_removals = refresh_plugins == "allow-removal"
 
@@ -501,8 +609,9 @@ def _do_refresh(  # pylint: disable=too-many-arguments
         changes.update_objects(plugins, allow_removals=allow_removals)
 
     if refresh_fragments:
+        loading_options = _get_fragment_loading_options(args)
         if fragments is None:
-            fragments = load_fragments(paths, config)
+            fragments = load_fragments(paths, config, **loading_options)
         archive_path_template = config.archive_path_template
         has_archives = archive_path_template is not None
         with_archives = refresh_fragments == "with-archives"
@@ -512,7 +621,7 @@ def _do_refresh(  # pylint: disable=too-many-arguments
             load_extra_fragments = None
             if with_archives and archive_path_template is not None:
                 load_extra_fragments = _get_archive_loader(
-                    archive_path_template, paths, config
+                    archive_path_template, paths, config, loading_options
                 )
 
             changes.update_fragments(
@@ -679,8 +788,9 @@ def command_release(args: Any) -> int:
         force_reload=args.reload_plugins,
         use_ansible_doc=args.use_ansible_doc,
         add_plugin_period=config.add_plugin_period,
+        jobs=_get_plugin_load_jobs(args),
     )
-    fragments = load_fragments(paths, config)
+    fragments = load_fragments(paths, config, **_get_fragment_loading_options(args))
     lint_rc = lint_fragments(config, fragments, [])
     if lint_rc != 0:
         LOGGER.error(
@@ -706,18 +816,28 @@ def command_release(args: Any) -> int:
         prev_version=prev_version,
         objects=cast(list[PluginDescription], plugins),
     )
-    for output in config.output:
-        generate_changelog(
-            paths,
-            config,
-            changes,
-            output,
-            flatmap=flatmap,
-        )
+    block_cache = _load_block_cache(paths, config)
+    generate_changelogs(
+        paths,
+        config,
+        changes,
+        config.output,
+        flatmap=flatmap,
+        block_cache=block_cache,
+        jobs=_get_render_jobs(args, config),
+    )
+    if block_cache is not None:
+        block_cache.save()
 
     return C.RC_SUCCESS
 
 
+def _load_block_cache(paths: PathsConfig, config: ChangelogConfig) -> BlockCache | None:
+    if not config.render_cache:
+        return None
+    return BlockCache.load(get_block_cache_path(paths))
+
+
 def _get_outputs(
     config: ChangelogConfig, *, output: str | None, output_format: str | None
 ):
@@ -785,18 +905,24 @@ def command_generate(args: Any) -> int:
             config=config,
             version=changes.latest_version,
             force_reload=args.reload_plugins,
+            use_ansible_doc=args.use_ansible_doc,
             add_plugin_period=config.add_plugin_period,
+            jobs=_get_plugin_load_jobs(args),
         )
     doc_outputs = _get_outputs(config, output=output, output_format=output_format)
-    for doc_output in doc_outputs:
-        generate_changelog(
-            paths,
-            config,
-            changes,
-            doc_output,
-            flatmap=flatmap,
-            only_latest=only_latest,
-        )
+    block_cache = _load_block_cache(paths, config)
+    generate_changelogs(
+        paths,
+        config,
+        changes,
+        doc_outputs,
+        flatmap=flatmap,
+        only_latest=only_latest,
+        block_cache=block_cache,
+        jobs=_get_render_jobs(args, config),
+    )
+    if block_cache is not None:
+        block_cache.save()
 
     return C.RC_SUCCESS
 
@@ -818,15 +944,35 @@ def command_lint(args: Any) -> int:
         paths, collection_details, ignore_is_other_project=True
     )
 
+    jobs: int = args.jobs
+    if jobs < 1:
+        raise ChangelogError("--jobs must be at least 1")
+
     exceptions: list[tuple[str, Exception]] = []
-    fragments = load_fragments(paths, config, fragment_paths, exceptions)
-    return lint_fragments(config, fragments, exceptions)
+    fragments = load_fragments(
+        paths,
+        config,
+        fragment_paths,
+        exceptions,
+        **_get_fragment_loading_options(args),
+    )
+
+    lint_cache: FragmentLintCache | None = None
+    if args.incremental:
+        lint_cache = FragmentLintCache.load(get_lint_cache_path(paths), config)
+
+    return lint_fragments(
+        config, fragments, exceptions, lint_cache=lint_cache, jobs=jobs
+    )
 
 
 def lint_fragments(
     config: ChangelogConfig,
     fragments: list[ChangelogFragment],
     exceptions: list[tuple[str, Exception]],
+    *,
+    lint_cache: FragmentLintCache | None = None,
+    jobs: int = 1,
 ) -> int:
     """
     Lint a given set of changelog fragment objects.
@@ -834,13 +980,33 @@ def lint_fragments(
     :arg config: The configuration
     :arg fragments: The loaded fragments
     :arg exceptions: Exceptions from loading the fragments
+    :kwarg lint_cache: If provided, fragments whose lint results are cached are not
+        linted again, and new lint results are stored in the cache.
+    :kwarg jobs: The number of worker processes to lint fragments with
     """
     linter = ChangelogFragmentLinter(config)
 
     errors = [(ex[0], 0, 0, "yaml parsing error") for ex in exceptions]
 
+    fragments_to_lint = []
     for fragment in fragments:
-        errors += linter.lint(fragment)
+        fragment_errors = (
+            lint_cache.get(fragment.path) if lint_cache is not None else None
+        )
+        if fragment_errors is None:
+            fragments_to_lint.append(fragment)
+        else:
+            errors += fragment_errors
+
+    for fragment, fragment_errors in zip(
+        fragments_to_lint, linter.lint_many(fragments_to_lint, jobs=jobs)
+    ):
+        if lint_cache is not None:
+            lint_cache.put(fragment.path, fragment_errors)
+        errors += fragment_errors
+
+    if lint_cache is not None:
+        lint_cache.save()
 
     messages = sorted(
         set(
@@ -13,6 +13,7 @@ from __future__ import annotations
 
 import enum
 import os
+import re
 import typing as t
 from collections.abc import Mapping
 from collections.abc import Sequence as _Sequence
@@ -539,6 +540,12 @@ class ChangelogConfig(p.BaseModel):
     )
     always_refresh: str = "none"
     ignore_other_fragment_extensions: bool = False
+    fragment_cache: bool = False
+    fragment_load_jobs: p.PositiveInt = 1
+    fragment_load_executor: t.Literal["thread", "process"] = "thread"
+    plugin_load_jobs: p.PositiveInt = 1
+    incremental_plugin_refresh: bool = False
+    static_plugin_docs: bool = False
     sanitize_changelog: bool = False
     flatmap: t.Optional[bool] = None
     use_semantic_versioning: bool = (
@@ -555,8 +562,39 @@ class ChangelogConfig(p.BaseModel):
         "alphanumerical",
     ] = "alphanumerical"
     vcs: t.Literal["none", "auto", "git"] = "none"
+    collection_staging: t.Literal["copy", "selective", "symlink"] = "copy"
+    ansible_doc_worker: bool = False
+    plugin_cache_format: t.Literal["yaml", "json"] = "yaml"
+    render_cache: bool = False
+    render_jobs: p.PositiveInt = 1
+    compare_before_write: bool = False
     output: t.Annotated[list[ChangelogOutput], at.Len(min_length=1)]
 
+    _compiled_patterns: dict[str, re.Pattern[str]] = p.PrivateAttr(default_factory=dict)
+    _release_versions: dict[tuple[bool, str, str, str], bool] = p.PrivateAttr(
+        default_factory=dict
+    )
+
+    def _compile_pattern(self, pattern: str) -> re.Pattern[str]:
+        compiled = self._compiled_patterns.get(pattern)
+        if compiled is None:
+            compiled = self._compiled_patterns[pattern] = re.compile(pattern)
+        return compiled
+
+    @property
+    def release_tag_pattern(self) -> re.Pattern[str]:
+        """
+        The compiled ``release_tag_re``.
+        """
+        return self._compile_pattern(self.release_tag_re)
+
+    @property
+    def pre_release_tag_pattern(self) -> re.Pattern[str]:
+        """
+        The compiled ``pre_release_tag_re``.
+        """
+        return self._compile_pattern(self.pre_release_tag_re)
+
     @p.field_validator("always_refresh", mode="before")
     @classmethod
     def fix_always_refresh(cls, value: t.Any) -> str:
@@ -785,6 +823,30 @@ class ChangelogConfig(p.BaseModel):
             config["archive_path_template"] = self.archive_path_template
         if self.is_other_project:
             config["is_other_project"] = self.is_other_project
+        if self.fragment_cache:
+            config["fragment_cache"] = self.fragment_cache
+        if self.fragment_load_jobs != 1:
+            config["fragment_load_jobs"] = self.fragment_load_jobs
+        if self.fragment_load_executor != "thread":
+            config["fragment_load_executor"] = self.fragment_load_executor
+        if self.plugin_load_jobs != 1:
+            config["plugin_load_jobs"] = self.plugin_load_jobs
+        if self.incremental_plugin_refresh:
+            config["incremental_plugin_refresh"] = self.incremental_plugin_refresh
+        if self.static_plugin_docs:
+            config["static_plugin_docs"] = self.static_plugin_docs
+        if self.collection_staging != "copy":
+            config["collection_staging"] = self.collection_staging
+        if self.ansible_doc_worker:
+            config["ansible_doc_worker"] = self.ansible_doc_worker
+        if self.plugin_cache_format != "yaml":
+            config["plugin_cache_format"] = self.plugin_cache_format
+        if self.render_cache:
+            config["render_cache"] = self.render_cache
+        if self.render_jobs != 1:
+            config["render_jobs"] = self.render_jobs
+        if self.compare_before_write:
+            config["compare_before_write"] = self.compare_before_write
 
         sections = []
         for key, value in self.sections.items():
@@ -12,6 +12,8 @@ Changelog fragment loading, modification and linting.
 from __future__ import annotations
 
 import os
+from collections.abc import Iterator, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from typing import Any
 
 from antsibull_fileutils.yaml import load_yaml_file
@@ -19,8 +21,9 @@ from antsibull_fileutils.yaml import load_yaml_file
 from .ansible import OBJECT_TYPES, OTHER_PLUGIN_TYPES, get_documentable_plugins
 from .config import ChangelogConfig, PathsConfig, TextFormat
 from .errors import ChangelogError
+from .fragment_cache import FragmentCache, get_fragment_cache_path
 from .logger import LOGGER
-from .rstcheck import check_rst_content
+from .rstcheck import check_rst_contents
 
 
 class ChangelogFragment:
@@ -339,11 +342,20 @@ class ChangelogFragmentLinter:
                 errors.append((fragment.path, 0, 0, "invalid section: %s" % section))
 
     @staticmethod
-    def _check_content(text: str, text_format: TextFormat, filename: str) -> list[str]:
-        if text_format == TextFormat.RESTRUCTURED_TEXT:
-            results = check_rst_content(text, filename=filename)
-            return [result[2] for result in results]
-        raise ValueError("No validation possible for MarkDown fragments")
+    def _run_content_checks(checks: list[_ContentCheck]) -> None:
+        """
+        Validate the text of all content checks, and insert the results into the
+        error lists at the recorded positions.
+        """
+        for check in checks:
+            if check.text_format != TextFormat.RESTRUCTURED_TEXT:
+                raise ValueError("No validation possible for MarkDown fragments")
+        all_results = check_rst_contents([check.text for check in checks])
+        # Insert from the back, so that the recorded positions stay valid
+        for check, results in reversed(list(zip(checks, all_results))):
+            check.errors[check.position : check.position] = [
+                (check.path, 0, 0, result[2]) for result in results
+            ]
 
     @staticmethod
     def _lint_lines(
@@ -351,9 +363,13 @@ class ChangelogFragmentLinter:
         fragment: ChangelogFragment,
         section: str,
         lines: Any,
+        checks: list[_ContentCheck],
     ) -> None:
         """
         Lint lines of a changelog fragment.
+
+        The content of the lines is not validated directly; instead, content checks
+        are added to ``checks``.
         """
         if isinstance(lines, list) and not (
             section.startswith("add ") and "." in section
@@ -371,29 +387,19 @@ class ChangelogFragmentLinter:
                     )
                     continue
 
-                results = ChangelogFragmentLinter._check_content(
-                    line, fragment.fragment_format, fragment.path
-                )
-                errors += [(fragment.path, 0, 0, result) for result in results]
+                checks.append(_ContentCheck(errors, fragment, line))
         elif isinstance(lines, str):
-            results = ChangelogFragmentLinter._check_content(
-                lines, fragment.fragment_format, fragment.path
-            )
-            errors += [(fragment.path, 0, 0, result) for result in results]
+            checks.append(_ContentCheck(errors, fragment, lines))
 
-    def lint(self, fragment: ChangelogFragment) -> list[tuple[str, int, int, str]]:
-        """
-        Lint a ``ChangelogFragment``.
-
-        :arg fragment: The changelog fragment to lint
-        :return: A list of errors. If empty, the changelog fragment is valid.
-        """
+    def _lint_fragment(
+        self, fragment: ChangelogFragment, checks: list[_ContentCheck]
+    ) -> list[tuple[str, int, int, str]]:
         errors: list[tuple[str, int, int, str]] = []
 
         if isinstance(fragment.content, dict):  # type: ignore
             for section, lines in fragment.content.items():
                 self._lint_section(errors, fragment, section, lines)
-                self._lint_lines(errors, fragment, section, lines)
+                self._lint_lines(errors, fragment, section, lines, checks)
 
         else:
             errors.append(
@@ -408,13 +414,241 @@ class ChangelogFragmentLinter:
 
         return errors
 
+    def lint(self, fragment: ChangelogFragment) -> list[tuple[str, int, int, str]]:
+        """
+        Lint a ``ChangelogFragment``.
+
+        :arg fragment: The changelog fragment to lint
+        :return: A list of errors. If empty, the changelog fragment is valid.
+        """
+        return self.lint_many([fragment])[0]
+
+    def lint_many(
+        self, fragments: Sequence[ChangelogFragment], jobs: int = 1
+    ) -> list[list[tuple[str, int, int, str]]]:
+        """
+        Lint several ``ChangelogFragment`` objects. This is faster than calling
+        ``lint()`` for every fragment, since the content of all fragments is
+        validated together.
+
+        :arg fragments: The changelog fragments to lint
+        :arg jobs: The number of worker processes to lint the fragments with
+        :return: A list of errors for every fragment, in the same order as ``fragments``.
+        """
+        if jobs > 1 and len(fragments) > 1:
+            return self._lint_many_parallel(fragments, jobs)
+        checks: list[_ContentCheck] = []
+        all_errors = [self._lint_fragment(fragment, checks) for fragment in fragments]
+        self._run_content_checks(checks)
+        return all_errors
+
+    def _lint_many_parallel(
+        self, fragments: Sequence[ChangelogFragment], jobs: int
+    ) -> list[list[tuple[str, int, int, str]]]:
+        """
+        Lint fragments in chunks with a pool of worker processes. Every worker
+        receives the configuration once when it is started.
+        """
+        # Use a few chunks per worker to balance the load, while keeping the chunks
+        # large enough so that the content checks of every chunk can be batched
+        chunk_count = min(len(fragments), jobs * LINT_CHUNKS_PER_JOB)
+        chunk_size = -(-len(fragments) // chunk_count)
+        chunks = [
+            list(fragments[offset : offset + chunk_size])
+            for offset in range(0, len(fragments), chunk_size)
+        ]
+        with ProcessPoolExecutor(
+            max_workers=min(jobs, len(chunks)),
+            initializer=_init_lint_worker,
+            initargs=(self.config,),
+        ) as pool:
+            return [
+                errors
+                for chunk_errors in pool.map(_lint_in_worker, chunks)
+                for errors in chunk_errors
+            ]
+
+
+class _ContentCheck:
+    # pylint: disable=too-few-public-methods
+    """
+    Text of a changelog fragment whose validation results have to be inserted
+    into an error list at a specific position.
+    """
+
+    def __init__(
+        self,
+        errors: list[tuple[str, int, int, str]],
+        fragment: ChangelogFragment,
+        text: str,
+    ):
+        self.errors = errors
+        self.position = len(errors)
+        self.path = fragment.path
+        self.text_format = fragment.fragment_format
+        self.text = text
+
 
-def load_fragments(
+# Number of chunks per worker process when linting fragments in parallel.
+LINT_CHUNKS_PER_JOB = 4
+
+_LINT_WORKER_LINTER: ChangelogFragmentLinter | None = None
+
+
+def _init_lint_worker(config: ChangelogConfig) -> None:
+    """
+    Initialize a worker process for linting fragments.
+    """
+    global _LINT_WORKER_LINTER  # pylint: disable=global-statement
+    _LINT_WORKER_LINTER = ChangelogFragmentLinter(config)
+
+
+def _lint_in_worker(
+    fragments: list[ChangelogFragment],
+) -> list[list[tuple[str, int, int, str]]]:
+    """
+    Lint a chunk of fragments in a worker process.
+    """
+    if _LINT_WORKER_LINTER is None:
+        raise ValueError("Lint worker has not been initialized")
+    return _LINT_WORKER_LINTER.lint_many(fragments)
+
+
+# Directories with fewer fragments than this are always loaded serially, since
+# starting a worker pool costs more than it saves.
+PARALLEL_LOAD_THRESHOLD = 64
+
+
+def _load_fragment_content(path: str) -> Any:
+    """
+    Load the raw content of a changelog fragment. Used by the worker pool.
+    """
+    return load_yaml_file(path)
+
+
+def _create_executor(executor: str, jobs: int) -> Executor:
+    if executor == "thread":
+        return ThreadPoolExecutor(max_workers=jobs)
+    if executor == "process":
+        return ProcessPoolExecutor(max_workers=jobs)
+    raise ValueError(f"Unknown executor {executor!r}")
+
+
+def _load_fragments_serial(
+    fragment_paths: list[str],
+) -> Iterator[tuple[str, Any, Exception | None]]:
+    """
+    Load the contents of changelog fragments one after another.
+    """
+    for path in fragment_paths:
+        try:
+            yield path, _load_fragment_content(path), None
+        except Exception as ex:  # pylint: disable=broad-except
+            yield path, None, ex
+
+
+def _load_fragments_parallel(
+    fragment_paths: list[str],
+    jobs: int,
+    executor: str,
+) -> list[tuple[str, Any, Exception | None]]:
+    """
+    Load the contents of changelog fragments with a bounded worker pool.
+
+    The result has the same order as ``fragment_paths``.
+    """
+    result: list[tuple[str, Any, Exception | None]] = []
+    with _create_executor(executor, jobs) as pool:
+        futures = [
+            (path, pool.submit(_load_fragment_content, path)) for path in fragment_paths
+        ]
+        for path, future in futures:
+            try:
+                result.append((path, future.result(), None))
+            except Exception as ex:  # pylint: disable=broad-except
+                result.append((path, None, ex))
+    return result
+
+
+def _list_fragment_paths(
+    paths: PathsConfig, config: ChangelogConfig, fragments_dir: str | None
+) -> list[str]:
+    """
+    List all changelog fragment paths in a fragments directory.
+    """
+    if fragments_dir is None:
+        fragments_dir = os.path.join(paths.changelog_dir, config.notes_dir)
+    if not os.path.isdir(fragments_dir):
+        return []
+    fragment_paths = [
+        os.path.join(fragments_dir, path)
+        for path in os.listdir(fragments_dir)
+        if not path.startswith(".")
+    ]
+    if config.ignore_other_fragment_extensions:
+        fragment_paths = [
+            path
+            for path in fragment_paths
+            if any(path.endswith(ext) for ext in (".yml", ".yaml"))
+        ]
+    return fragment_paths
+
+
+def _load_fragment_contents(
+    fragment_paths: list[str],
+    jobs: int,
+    executor: str,
+    cache: FragmentCache | None,
+) -> Iterator[tuple[str, Any, Exception | None]]:
+    """
+    Load the contents of changelog fragments, using the cache if provided.
+
+    The result has the same order as ``fragment_paths``.
+    """
+    cached: dict[str, Any] = {}
+    missing = fragment_paths
+    if cache is not None:
+        missing = []
+        for path in fragment_paths:
+            found, content = cache.get(path)
+            if found:
+                cached[path] = content
+            else:
+                missing.append(path)
+        LOGGER.debug(
+            "Found {} of {} fragments in fragment cache",
+            len(fragment_paths) - len(missing),
+            len(fragment_paths),
+        )
+
+    loaded: Iterator[tuple[str, Any, Exception | None]]
+    if jobs > 1 and len(missing) >= PARALLEL_LOAD_THRESHOLD:
+        LOGGER.debug(
+            "Loading {} fragments with {} {} workers", len(missing), jobs, executor
+        )
+        loaded = iter(_load_fragments_parallel(missing, jobs, executor))
+    else:
+        loaded = _load_fragments_serial(missing)
+
+    for path in fragment_paths:
+        if path in cached:
+            yield path, cached[path], None
+            continue
+        result = next(loaded)
+        if cache is not None and result[2] is None:
+            cache.put(path, result[1])
+        yield result
+
+
+def load_fragments(  # pylint: disable=too-many-arguments
     paths: PathsConfig,
     config: ChangelogConfig,
     fragment_paths: list[str] | None = None,
     exceptions: list[tuple[str, Exception]] | None = None,
     fragments_dir: str | None = None,
+    jobs: int | None = None,
+    executor: str | None = None,
+    use_cache: bool | None = None,
 ) -> list[ChangelogFragment]:
     """
     Load changelog fragments from disk.
@@ -426,34 +660,40 @@ def load_fragments(
                         path will be used.
     :arg exceptions: If given, exceptions during loading will be stored in this list instead
                      of being propagated
+    :arg jobs: Number of workers to use for loading fragments. If not given, the value of
+               ``fragment_load_jobs`` from the configuration is used.
+    :arg executor: Type of workers (``thread`` or ``process``). If not given, the value of
+                   ``fragment_load_executor`` from the configuration is used.
+    :arg use_cache: Whether to use the on-disk fragment cache. If not given, the value of
+                    ``fragment_cache`` from the configuration is used.
     """
     if not fragment_paths:
-        if fragments_dir is None:
-            fragments_dir = os.path.join(paths.changelog_dir, config.notes_dir)
-        if os.path.isdir(fragments_dir):
-            fragment_paths = [
-                os.path.join(fragments_dir, path)
-                for path in os.listdir(fragments_dir)
-                if not path.startswith(".")
-            ]
-            if config.ignore_other_fragment_extensions:
-                fragment_paths = [
-                    path
-                    for path in fragment_paths
-                    if any(path.endswith(ext) for ext in (".yml", ".yaml"))
-                ]
-        else:
-            fragment_paths = []
+        fragment_paths = _list_fragment_paths(paths, config, fragments_dir)
 
-    fragments: list[ChangelogFragment] = []
+    if jobs is None:
+        jobs = config.fragment_load_jobs
+    if executor is None:
+        executor = config.fragment_load_executor
 
-    for path in fragment_paths:
-        try:
-            fragments.append(ChangelogFragment.load(path))
-        except Exception as ex:  # pylint: disable=broad-except
-            if exceptions is not None:
+    cache: FragmentCache | None = None
+    if use_cache is None:
+        use_cache = config.fragment_cache
+    if use_cache:
+        cache = FragmentCache.load(get_fragment_cache_path(paths))
+
+    fragments: list[ChangelogFragment] = []
+    try:
+        for path, content, ex in _load_fragment_contents(
+            fragment_paths, jobs, executor, cache
+        ):
+            if ex is None:
+                fragments.append(ChangelogFragment(content, path))
+            elif exceptions is not None:
                 exceptions.append((path, ex))
             else:
                 raise ChangelogError(str(ex)) from ex
+    finally:
+        if cache is not None:
+            cache.save()
 
     return fragments
@@ -0,0 +1,269 @@
+# Author: Felix Fontein <felix@fontein.de>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or
+# https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-FileCopyrightText: 2026, Ansible Project
+
+"""
+On-disk caches for parsing and linting changelog fragments.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from typing import Any
+
+from . import __version__ as _version
+from .ansible import OBJECT_TYPES, OTHER_PLUGIN_TYPES, get_documentable_plugins
+from .config import ChangelogConfig, PathsConfig
+from .json_cache import DEFAULT_MAX_ENTRIES, JSONLRUCache, get_package_versions
+from .logger import LOGGER
+
+FRAGMENT_CACHE_FILENAME = ".fragment-cache.json"
+
+FRAGMENT_CACHE_VERSION = 1
+
+LINT_CACHE_FILENAME = ".lint-cache.json"
+
+LINT_CACHE_VERSION = 1
+
+
+def get_fragment_cache_path(paths: PathsConfig) -> str:
+    """
+    Return the path of the fragment cache.
+    """
+    return os.path.join(paths.changelog_dir, FRAGMENT_CACHE_FILENAME)
+
+
+def get_lint_cache_path(paths: PathsConfig) -> str:
+    """
+    Return the path of the fragment lint result cache.
+    """
+    return os.path.join(paths.changelog_dir, LINT_CACHE_FILENAME)
+
+
+def _hash_file(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _is_json_roundtrippable(content: Any) -> bool:
+    try:
+        return json.loads(json.dumps(content)) == content
+    except (TypeError, ValueError):
+        return False
+
+
+class FragmentCache(JSONLRUCache):
+    """
+    Stores the parsed content of changelog fragments, keyed by the fragment's path.
+
+    An entry is valid if the fragment's modification time and size did not change,
+    or if the SHA-256 hash of the fragment's content did not change.
+    """
+
+    CACHE_VERSION = FRAGMENT_CACHE_VERSION
+    ENTRIES_KEY = "fragments"
+    NAME = "fragment cache"
+
+    _fingerprints: dict[str, tuple[int, int, str]]
+
+    def __init__(self, path: str, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Create an empty fragment cache.
+
+        :arg path: Path of the cache file.
+        :arg max_entries: Maximal number of entries to keep when saving the cache.
+        """
+        super().__init__(path, max_entries=max_entries)
+        self._fingerprints = {}
+
+    @staticmethod
+    def load(path: str, max_entries: int = DEFAULT_MAX_ENTRIES) -> FragmentCache:
+        """
+        Load the fragment cache from disk. Missing or invalid caches result in an empty cache.
+        """
+        cache = FragmentCache(path, max_entries=max_entries)
+        cache._load()  # pylint: disable=protected-access
+        return cache
+
+    def get(self, fragment_path: str) -> tuple[bool, Any]:
+        """
+        Look up a fragment.
+
+        :return: A tuple ``(True, content)`` if the fragment was found in the cache,
+                 and ``(False, None)`` otherwise.
+        """
+        key = os.path.abspath(fragment_path)
+        try:
+            stat = os.stat(key)
+        except OSError:
+            return False, None
+        entry = self.entries.get(key)
+        if (
+            entry is not None
+            and entry["mtime_ns"] == stat.st_mtime_ns
+            and entry["size"] == stat.st_size
+        ):
+            self._touch(entry)
+            return True, entry["content"]
+        try:
+            digest = _hash_file(key)
+        except OSError:
+            return False, None
+        if entry is not None and entry["sha256"] == digest:
+            entry["mtime_ns"] = stat.st_mtime_ns
+            entry["size"] = stat.st_size
+            self._touch(entry)
+            return True, entry["content"]
+        self._fingerprints[key] = (stat.st_mtime_ns, stat.st_size, digest)
+        return False, None
+
+    def put(self, fragment_path: str, content: Any) -> None:
+        """
+        Store the parsed content of a fragment. Should be called after ``get()`` reported
+        a cache miss for this fragment.
+
+        Content that cannot be represented exactly in JSON is not stored.
+        """
+        key = os.path.abspath(fragment_path)
+        fingerprint = self._fingerprints.pop(key, None)
+        if fingerprint is None or not _is_json_roundtrippable(content):
+            return
+        mtime_ns, size, digest = fingerprint
+        self.entries[key] = {
+            "mtime_ns": mtime_ns,
+            "size": size,
+            "sha256": digest,
+            "generation": self.generation,
+            "content": content,
+        }
+        self._dirty = True
+
+    def _evict(self) -> None:
+        """
+        Remove entries of fragments that no longer exist, and the least recently used
+        entries if there are more than ``max_entries`` entries.
+        """
+        for key in list(self.entries):
+            if not os.path.exists(key):
+                del self.entries[key]
+                self._dirty = True
+        super()._evict()
+
+
+# Packages whose versions influence the result of checking RST
+_LINT_DEPENDENCIES = ("docutils", "rstcheck", "rstcheck-core")
+
+
+def get_lint_config_fingerprint(config: ChangelogConfig) -> str:
+    """
+    Compute a fingerprint of everything besides a fragment's content that
+    influences the result of linting that fragment.
+    """
+    data = {
+        "antsibull_changelog": _version,
+        "dependencies": get_package_versions(_LINT_DEPENDENCIES),
+        "sections": list(config.sections),
+        "prelude_name": config.prelude_name,
+        "trivial_section_name": config.trivial_section_name,
+        "object_types": list(OBJECT_TYPES),
+        "plugin_types": list(get_documentable_plugins()) + list(OTHER_PLUGIN_TYPES),
+    }
+    return hashlib.sha256(json.dumps(data, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class FragmentLintCache(JSONLRUCache):
+    """
+    Stores lint results of changelog fragments, keyed by the SHA-256 hash of the
+    fragment's content.
+
+    All results are discarded when the lint configuration fingerprint changes.
+    """
+
+    CACHE_VERSION = LINT_CACHE_VERSION
+    ENTRIES_KEY = "results"
+    NAME = "lint cache"
+
+    config_fingerprint: str
+
+    def __init__(
+        self,
+        path: str,
+        config_fingerprint: str,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        """
+        Create an empty lint result cache.
+
+        :arg path: Path of the cache file.
+        :arg config_fingerprint: Fingerprint of the lint configuration.
+        :arg max_entries: Maximal number of entries to keep when saving the cache.
+        """
+        super().__init__(path, max_entries=max_entries)
+        self.config_fingerprint = config_fingerprint
+
+    @staticmethod
+    def load(
+        path: str, config: ChangelogConfig, max_entries: int = DEFAULT_MAX_ENTRIES
+    ) -> FragmentLintCache:
+        """
+        Load the lint result cache from disk. Missing or invalid caches, or caches for
+        another lint configuration, result in an empty cache.
+        """
+        cache = FragmentLintCache(
+            path, get_lint_config_fingerprint(config), max_entries=max_entries
+        )
+        cache._load()  # pylint: disable=protected-access
+        return cache
+
+    def _load_data(self, data: dict[str, Any]) -> None:
+        if data["config"] != self.config_fingerprint:
+            LOGGER.debug("Lint configuration changed, ignoring lint cache")
+            self._dirty = True
+        else:
+            super()._load_data(data)
+
+    def _dump_data(self) -> dict[str, Any]:
+        data = super()._dump_data()
+        data["config"] = self.config_fingerprint
+        return data
+
+    @staticmethod
+    def _get_key(fragment_path: str) -> str | None:
+        try:
+            return _hash_file(fragment_path)
+        except OSError:
+            return None
+
+    def get(self, fragment_path: str) -> list[tuple[str, int, int, str]] | None:
+        """
+        Look up the lint result for a fragment.
+
+        :return: The list of errors, or ``None`` if the fragment's content has not
+                 been linted with the current configuration before.
+        """
+        key = self._get_key(fragment_path)
+        entry = self.entries.get(key) if key is not None else None
+        if entry is None:
+            return None
+        self._touch(entry)
+        return [
+            (fragment_path, line, column, message)
+            for line, column, message in entry["errors"]
+        ]
+
+    def put(self, fragment_path: str, errors: list[tuple[str, int, int, str]]) -> None:
+        """
+        Store the lint result for a fragment.
+        """
+        key = self._get_key(fragment_path)
+        if key is None:
+            return
+        self.entries[key] = {
+            "generation": self.generation,
+            "errors": [[line, column, message] for _, line, column, message in errors],
+        }
+        self._dirty = True
@@ -0,0 +1,149 @@
+# Author: Felix Fontein <felix@fontein.de>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or
+# https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-FileCopyrightText: 2026, Ansible Project
+
+"""
+Base class for on-disk caches stored as JSON.
+"""
+
+from __future__ import annotations
+
+import importlib.metadata
+import json
+import os
+from collections.abc import Iterable
+from typing import Any
+
+from .logger import LOGGER
+
+DEFAULT_MAX_ENTRIES = 5000
+
+
+def get_package_versions(names: Iterable[str]) -> dict[str, str | None]:
+    """
+    Return the installed versions of the given packages, for use in cache keys or
+    fingerprints. Packages that are not installed have version ``None``.
+    """
+    result: dict[str, str | None] = {}
+    for name in names:
+        try:
+            result[name] = importlib.metadata.version(name)
+        except importlib.metadata.PackageNotFoundError:
+            result[name] = None
+    return result
+
+
+def _evict_least_recently_used(
+    entries: dict[str, dict[str, Any]], max_entries: int
+) -> bool:
+    """
+    Remove the entries with the oldest ``generation`` until at most ``max_entries``
+    entries are left. Return whether entries have been removed.
+    """
+    excess = len(entries) - max_entries
+    if excess <= 0:
+        return False
+    oldest = sorted(entries, key=lambda key: entries[key]["generation"])
+    for key in oldest[:excess]:
+        del entries[key]
+    return True
+
+
+class JSONLRUCache:
+    """
+    Cache whose entries are stored in a JSON file.
+
+    Every time the cache is loaded, its generation is increased. Every entry records
+    the generation it was last used in. When saving the cache, the least recently
+    used entries are removed if there are more than ``max_entries`` entries.
+
+    Subclasses must set ``CACHE_VERSION``, ``ENTRIES_KEY`` (the key the entries are
+    stored under in the JSON file), and ``NAME`` (used in log messages).
+    """
+
+    CACHE_VERSION: int
+    ENTRIES_KEY: str
+    NAME: str
+
+    path: str | None
+    max_entries: int
+    generation: int
+    entries: dict[str, dict[str, Any]]
+    _dirty: bool
+
+    def __init__(self, path: str | None, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Create an empty cache.
+
+        :arg path: Path of the cache file. If ``None``, the cache is only kept
+                   in memory.
+        :arg max_entries: Maximal number of entries to keep when saving the cache.
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.generation = 0
+        self.entries = {}
+        self._dirty = False
+
+    def _load(self) -> None:
+        """
+        Load the cache file, if it exists. Invalid caches are ignored.
+        """
+        if self.path is None or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != self.CACHE_VERSION:
+                raise ValueError(f"unsupported version {data.get('version')!r}")
+            self.generation = int(data["generation"]) + 1
+            self._load_data(data)
+        except Exception as exc:  # pylint: disable=broad-except
+            LOGGER.debug("Ignoring invalid {} {}: {}", self.NAME, self.path, exc)
+
+    def _load_data(self, data: dict[str, Any]) -> None:
+        """
+        Load the entries from the cache file's content.
+        """
+        self.entries = dict(data[self.ENTRIES_KEY])
+
+    def _dump_data(self) -> dict[str, Any]:
+        """
+        Return the content of the cache file.
+        """
+        return {
+            "version": self.CACHE_VERSION,
+            "generation": self.generation,
+            self.ENTRIES_KEY: self.entries,
+        }
+
+    def _touch(self, entry: dict[str, Any]) -> None:
+        """
+        Mark an entry as used in the current generation.
+        """
+        if entry["generation"] != self.generation:
+            entry["generation"] = self.generation
+            self._dirty = True
+
+    def _evict(self) -> None:
+        """
+        Remove the least recently used entries if there are more than ``max_entries``.
+        """
+        if _evict_least_recently_used(self.entries, self.max_entries):
+            self._dirty = True
+
+    def save(self) -> None:
+        """
+        Evict old entries and write the cache to disk, if it changed.
+        """
+        self._evict()
+        if not self._dirty or self.path is None:
+            return
+        try:
+            with open(self.path, "w", encoding="utf-8") as f:
+                json.dump(self._dump_data(), f)
+            self._dirty = False
+        except OSError as exc:
+            LOGGER.warning("Cannot write {} {}: {}", self.NAME, self.path, exc)
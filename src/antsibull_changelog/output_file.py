@@ -0,0 +1,159 @@
+# Author: Felix Fontein <felix@fontein.de>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or
+# https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-FileCopyrightText: 2026, Ansible Project
+
+"""
+Writing files only if their content changed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import os
+import shutil
+import tempfile
+from functools import cache
+from types import TracebackType
+from typing import IO, Any
+
+_CHUNK_SIZE = 1 << 16
+
+
+class _HashingWriter(io.RawIOBase):
+    """
+    Writes to a binary file while computing the size and hash of the written data.
+    """
+
+    def __init__(self, raw: IO[bytes]):
+        self._raw = raw
+        self.size = 0
+        self.hash = hashlib.sha256()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b: Any) -> int:
+        data = bytes(b)
+        self._raw.write(data)
+        self.size += len(data)
+        self.hash.update(data)
+        return len(data)
+
+    def close(self) -> None:
+        if not self.closed:
+            self._raw.close()
+        super().close()
+
+
+@cache
+def _get_umask() -> int:
+    # The umask can only be read by setting it
+    umask = os.umask(0o022)
+    os.umask(umask)
+    return umask
+
+
+def _hash_file(path: str) -> bytes:
+    file_hash = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(_CHUNK_SIZE):
+            file_hash.update(chunk)
+    return file_hash.digest()
+
+
+class OutputFile:
+    """
+    Context manager for writing a file that leaves the existing file alone if the new
+    content is identical.
+
+    The content is written to a temporary file next to the file, which replaces the
+    file once all content has been written. If an error happens while writing, the
+    existing file is not modified.
+
+    If ``compare`` is set and the file exists, the sizes of both files are compared
+    first, and if they are equal, their hashes. The existing file is only replaced if
+    the content differs. This preserves the modification time of unchanged files.
+
+    After the context manager exits, ``changed`` tells whether the file was written.
+    """
+
+    path: str
+    encoding: str | None
+    compare: bool
+    changed: bool
+
+    def __init__(
+        self, path: str, *, encoding: str | None = "utf-8", compare: bool = True
+    ):
+        """
+        :arg path: The path of the file to write.
+        :kwarg encoding: The encoding of the file. If ``None``, a binary stream is
+                         provided instead of a text stream.
+        :kwarg compare: Whether to compare the new content to the existing file. If
+                        ``False``, the file is always replaced.
+        """
+        self.path = path
+        self.encoding = encoding
+        self.compare = compare
+        self.changed = True
+        self._stream: IO[Any] | None = None
+        self._writer: _HashingWriter | None = None
+        self._temp_path: str | None = None
+
+    def __enter__(self) -> IO[Any]:
+        target = os.path.realpath(self.path)
+        directory, filename = os.path.split(target)
+        fd, self._temp_path = tempfile.mkstemp(
+            prefix=f".{filename}.", suffix=".tmp", dir=directory
+        )
+        self._writer = _HashingWriter(os.fdopen(fd, "wb"))
+        buffered = io.BufferedWriter(self._writer)
+        if self.encoding is None:
+            self._stream = buffered
+        else:
+            self._stream = io.TextIOWrapper(buffered, encoding=self.encoding)
+        return self._stream
+
+    def _is_unchanged(self, target: str) -> bool:
+        assert self._writer is not None
+        if not self.compare or not os.path.isfile(target):
+            return False
+        if os.path.getsize(target) != self._writer.size:
+            return False
+        return _hash_file(target) == self._writer.hash.digest()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        assert self._stream is not None
+        try:
+            self._stream.close()
+        finally:
+            if self._temp_path is not None:
+                self._finish_temp_file(exc_type is None)
+
+    def _finish_temp_file(self, success: bool) -> None:
+        assert self._temp_path is not None
+        target = os.path.realpath(self.path)
+        try:
+            if success:
+                self.changed = not self._is_unchanged(target)
+                if self.changed:
+                    if os.path.exists(target):
+                        shutil.copymode(target, self._temp_path)
+                    else:
+                        os.chmod(self._temp_path, 0o666 & ~_get_umask())
+                    os.replace(self._temp_path, target)
+        finally:
+            if os.path.exists(self._temp_path):
+                os.remove(self._temp_path)
+            self._temp_path = None
+
+
+__all__ = ("OutputFile",)
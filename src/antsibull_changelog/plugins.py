@@ -11,10 +11,14 @@ Collect and store information on Ansible plugins and modules.
 
 from __future__ import annotations
 
+import ast
+import hashlib
+import importlib.metadata
 import json
 import os
 import re
-import subprocess
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from typing import Any, Generator
 
@@ -29,15 +33,23 @@ from antsibull_docs_parser.rst import (
 from antsibull_docs_parser.rst import rst_escape as _ansible_markup_rst_escape
 from antsibull_docs_parser.rst import to_rst_plain as _ansible_markup_to_rst
 from antsibull_fileutils.copier import CollectionCopier, Copier, GitCopier
-from antsibull_fileutils.vcs import detect_vcs
-from antsibull_fileutils.yaml import load_yaml_file, store_yaml_file
+from antsibull_fileutils.tempfile import ansible_mkdtemp
+from antsibull_fileutils.vcs import detect_vcs, list_git_files
+from antsibull_fileutils.yaml import load_yaml_bytes, store_yaml_file
 
+from . import __version__ as _version
 from .ansible import (
     PLUGIN_EXCEPTIONS,
     get_ansible_release,
     get_documentable_objects,
     get_documentable_plugins,
 )
+from .ansible_doc import (
+    ansible_doc_session,
+    check_output,
+    iter_metadata_dump,
+    stream_output,
+)
 from .config import ChangelogConfig, CollectionDetails, PathsConfig
 from .logger import LOGGER
 
@@ -115,42 +127,36 @@ class PluginDescription:
         data: dict[str, dict[str, dict[str, Any]]],
         category: str = "plugin",
         add_plugin_period: bool = False,
+        markup_cache: dict[tuple[str, bool], str] | None = None,
     ) -> list[PluginDescription]:
         """
         Return a list of ``PluginDescription`` objects from the given data.
 
         :arg data: A dictionary mapping plugin types to a dictionary of plugins.
+        :arg markup_cache: Memoizes the conversion of descriptions to RST. Maps
+                           tuples ``(description, add_plugin_period)`` to the
+                           converted description. If not provided, a cache that
+                           is only used for this call is used.
         :return: A list of plugin descriptions.
         """
+        if markup_cache is None:
+            markup_cache = {}
         plugins = []
 
         for plugin_type, plugin_data in data.items():
             for plugin_name, plugin_details in plugin_data.items():
-                description = plugin_details["description"]
-                if (
-                    add_plugin_period
-                    and description
-                    and not description.endswith((".", ",", "!", "?"))
-                ):
-                    description += "."
-                # Process Ansible markup
-                try:
-                    markup = _parse_ansible_markup(
-                        description or "",
-                        _AnsibleMarkupContext(),
-                        errors="exception",
-                        whitespace=_AnsibleMarkupWhitespace.STRIP,
-                    )
-                    description = _ansible_markup_to_rst(
-                        markup, formatter=_AnsibleMarkupRSTFormatter()
-                    )
-                except Exception as exc:  # pylint: disable=broad-exception-caught
-                    LOGGER.warning(
-                        "Error while parsing description of {0} {1}: {2}",
-                        plugin_type,
-                        plugin_name,
-                        str(exc),
+                raw_description = plugin_details["description"] or ""
+                # Only descriptions that are strings can be used as cache keys
+                cacheable = isinstance(raw_description, str)
+                description = None
+                if cacheable:
+                    description = markup_cache.get((raw_description, add_plugin_period))
+                if description is None:
+                    description, converted = _convert_description(
+                        plugin_type, plugin_name, raw_description, add_plugin_period
                     )
+                    if converted and cacheable:
+                        markup_cache[(raw_description, add_plugin_period)] = description
                 plugins.append(
                     PluginDescription(
                         plugin_type=plugin_type,
@@ -165,6 +171,42 @@ class PluginDescription:
         return plugins
 
 
+def _convert_description(
+    plugin_type: str, plugin_name: str, description: str, add_plugin_period: bool
+) -> tuple[str, bool]:
+    """
+    Convert a plugin's description to RST. Returns the description and whether it
+    has been converted.
+    """
+    if (
+        add_plugin_period
+        and isinstance(description, str)
+        and description
+        and not description.endswith((".", ",", "!", "?"))
+    ):
+        description += "."
+    # Process Ansible markup
+    try:
+        markup = _parse_ansible_markup(
+            description,
+            _AnsibleMarkupContext(),
+            errors="exception",
+            whitespace=_AnsibleMarkupWhitespace.STRIP,
+        )
+        return (
+            _ansible_markup_to_rst(markup, formatter=_AnsibleMarkupRSTFormatter()),
+            True,
+        )
+    except Exception as exc:  # pylint: disable=broad-exception-caught
+        LOGGER.warning(
+            "Error while parsing description of {0} {1}: {2}",
+            plugin_type,
+            plugin_name,
+            str(exc),
+        )
+        return description, False
+
+
 def extract_namespace(
     paths: PathsConfig, collection_name: str | None, filename: str
 ) -> str:
@@ -262,43 +304,58 @@ def get_plugins_path(
     return os.path.join(lib_ansible, "plugins", plugin_type)
 
 
-def list_plugins_walk(
+# Extensions of files that can make up a plugin, in order of preference. Besides
+# Python files, this includes PowerShell modules and sidecar documentation.
+_PLUGIN_FILE_EXTENSIONS = (".py", ".ps1", ".yml", ".yaml")
+
+
+def _filter_plugin_files(
+    filenames: list[str], extensions: tuple[str, ...]
+) -> list[str]:
+    """
+    Return the filenames with one of the given extensions, ordered by the extensions.
+    """
+    result = [
+        filename
+        for filename in filenames
+        if filename != "__init__.py" and os.path.splitext(filename)[1] in extensions
+    ]
+    result.sort(key=lambda filename: extensions.index(os.path.splitext(filename)[1]))
+    return result
+
+
+def _walk_plugins(
     paths: PathsConfig,
-    playbook_dir: str | None,  # pylint: disable=unused-argument
     plugin_type: str,
     collection_name: str | None,
-) -> list[str]:
+    extensions: tuple[str, ...] = (".py",),
+) -> dict[str, str]:
     """
     Find all plugins of a type in a collection, or in ansible-core/-base. Uses os.walk().
 
-    This will also work with Ansible 2.9.
-
-    :arg paths: Paths configuration
-    :arg playbook_dir: Value for the ``--playbook-dir`` argument of ``ansible-doc``
-    :arg plugin_type: The plugin type to consider
-    :arg collection_name: The name of the collection, if appropriate.
+    :arg extensions: The file extensions to consider. If a plugin has several files,
+                     the one whose extension comes first is returned.
+    :return: A dictionary mapping plugin names to the real paths of their files.
     """
     plugin_source_path = get_plugins_path(paths, plugin_type)
 
     if not os.path.exists(plugin_source_path):
-        return []
+        return {}
 
     plugin_source_path = os.path.realpath(plugin_source_path)
 
-    result = set()
+    result: dict[str, str] = {}
     for dirpath, _, filenames in os.walk(plugin_source_path):
         if plugin_type != "module" and dirpath != plugin_source_path:
             continue
-        for filename in filenames:
-            if filename == "__init__.py" or not filename.endswith(".py"):
-                continue
+        for filename in _filter_plugin_files(filenames, extensions):
             if not paths.is_collection and dirpath == plugin_source_path:
                 # Skip files which are *not* plugins/modules, but live in these directories inside
                 # ansible-core/-base.
                 if (plugin_type, filename) in PLUGIN_EXCEPTIONS:
                     continue
-            path = os.path.realpath(os.path.join(dirpath, filename))
-            path = os.path.splitext(path)[0]
+            real_path = os.path.realpath(os.path.join(dirpath, filename))
+            path = os.path.splitext(real_path)[0]
             relpath = os.path.relpath(path, plugin_source_path)
             if not paths.is_collection and os.sep in relpath:
                 # When listing modules in ansible-core/-base, get rid of the namespace.
@@ -306,9 +363,28 @@ def list_plugins_walk(
             relname = relpath.replace(os.sep, ".")
             if collection_name:
                 relname = "{0}.{1}".format(collection_name, relname)
-            result.add(relname)
+            result.setdefault(relname, real_path)
+
+    return result
+
+
+def list_plugins_walk(
+    paths: PathsConfig,
+    playbook_dir: str | None,  # pylint: disable=unused-argument
+    plugin_type: str,
+    collection_name: str | None,
+) -> list[str]:
+    """
+    Find all plugins of a type in a collection, or in ansible-core/-base. Uses os.walk().
+
+    This will also work with Ansible 2.9.
 
-    return sorted(result)
+    :arg paths: Paths configuration
+    :arg playbook_dir: Value for the ``--playbook-dir`` argument of ``ansible-doc``
+    :arg plugin_type: The plugin type to consider
+    :arg collection_name: The name of the collection, if appropriate.
+    """
+    return sorted(_walk_plugins(paths, plugin_type, collection_name))
 
 
 def list_plugins_ansibledoc(
@@ -338,7 +414,7 @@ def list_plugins_ansibledoc(
         command.extend(["--playbook-dir", playbook_dir])
     if collection_name:
         command.append(collection_name)
-    output = subprocess.check_output(command)
+    output = check_output(command)
     plugins_list = json.loads(output.decode("utf-8"))
 
     if not collection_name:
@@ -374,23 +450,53 @@ def run_ansible_doc(
     if playbook_dir:
         command.extend(["--playbook-dir", playbook_dir])
     command.extend(plugin_names)
-    output = subprocess.check_output(command)
+    output = check_output(command)
     return json.loads(output.decode("utf-8"))
 
 
+# The parts of ansible-doc's documentation used by jsondoc_to_metadata()
+_METADATA_DOC_FIELDS = ("short_description", "version_added", "filename")
+
+
+def _reduce_jsondoc(data: dict[str, Any]) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    docs = data.get("doc")
+    if isinstance(docs, dict):
+        result["doc"] = {key: docs[key] for key in _METADATA_DOC_FIELDS if key in docs}
+    entrypoints = data.get("entry_points")
+    if isinstance(entrypoints, dict) and isinstance(entrypoints.get("main"), dict):
+        result["entry_points"] = {
+            "main": {
+                key: entrypoints["main"][key]
+                for key in _METADATA_DOC_FIELDS
+                if key in entrypoints["main"]
+            }
+        }
+    return result
+
+
 def run_ansible_doc_metadata_dump(
     paths: PathsConfig, playbook_dir: str | None, collection_name: str | None
 ) -> dict:
     """
     Runs ansible-doc to retrieve documentation for all plugins in a collection.
+
+    The output is parsed incrementally, and only the parts of every plugin's
+    documentation needed by ``jsondoc_to_metadata()`` are kept.
     """
     command = [paths.ansible_doc_path, "--metadata-dump"]
     if collection_name:
         command.append(collection_name)
     if playbook_dir:
         command.extend(["--playbook-dir", playbook_dir])
-    output = subprocess.check_output(command)
-    return json.loads(output.decode("utf-8"))
+    result: dict[str, dict[str, Any]] = {}
+    with stream_output(command) as output:
+        for plugin_type, plugins in iter_metadata_dump(output):
+            result[plugin_type] = {
+                plugin_name: _reduce_jsondoc(data or {})
+                for plugin_name, data in plugins
+            }
+    return {"all": result}
 
 
 def load_plugin_metadata(  # pylint: disable=too-many-arguments
@@ -400,6 +506,7 @@ def load_plugin_metadata(  # pylint: disable=too-many-arguments
     collection_name: str | None,
     use_ansible_doc: bool = False,
     category: str = "plugin",
+    plugin_names: list[str] | None = None,
 ) -> dict[str, dict[str, Any]]:
     """
     Collect plugin metadata for all plugins of a given type.
@@ -410,8 +517,12 @@ def load_plugin_metadata(  # pylint: disable=too-many-arguments
     :arg collection_name: The name of the collection, if appropriate
     :arg use_ansible_doc: Set to ``True`` to always use ansible-doc to enumerate plugins/modules
     :arg category: Set to ``object`` for roles and playbooks
+    :arg plugin_names: If given, only collect metadata for these plugins instead of
+                       enumerating all plugins of the given type
     """
-    if use_ansible_doc or category == "object":
+    if plugin_names is not None:
+        plugins_list = plugin_names
+    elif use_ansible_doc or category == "object":
         # WARNING: Do not make this the default to this before ansible-core/-base is a requirement!
         plugins_list = list_plugins_ansibledoc(
             paths, playbook_dir, plugin_type, collection_name, category
@@ -435,6 +546,165 @@ def load_plugin_metadata(  # pylint: disable=too-many-arguments
     return result
 
 
+def _read_documentation_literal(path: str) -> str | None:
+    """
+    Return the string literal assigned to ``DOCUMENTATION`` in a Python file, or
+    ``None`` if there is no such assignment or if the value is not a string literal.
+    """
+    try:
+        with open(path, "rb") as f:
+            tree = ast.parse(f.read(), filename=path)
+    except (OSError, SyntaxError, ValueError):
+        return None
+
+    documentation: str | None = None
+    for node in tree.body:
+        if not isinstance(node, ast.Assign) or not any(
+            isinstance(target, ast.Name) and target.id == "DOCUMENTATION"
+            for target in node.targets
+        ):
+            continue
+        if not isinstance(node.value, ast.Constant) or not isinstance(
+            node.value.value, str
+        ):
+            return None
+        documentation = node.value.value
+    return documentation
+
+
+def extract_plugin_documentation(path: str) -> dict[str, Any] | None:
+    """
+    Extract the ``DOCUMENTATION`` of a Python plugin or module without running
+    ansible-doc, by parsing the file with ``ast`` and the documentation with YAML.
+
+    Note that doc fragments are not evaluated; they do not provide a plugin's short
+    description or ``version_added``.
+
+    :arg path: Path to the plugin's or module's Python file
+    :return: The documentation, or ``None`` if it cannot be extracted statically. This
+             is the case for sidecar documentation, for ``DOCUMENTATION`` that is not
+             a string literal, and for documentation without short description.
+    """
+    base_path = os.path.splitext(path)[0]
+    if any(os.path.exists(base_path + ext) for ext in (".yml", ".yaml")):
+        return None
+    documentation = _read_documentation_literal(path)
+    if documentation is None:
+        return None
+
+    try:
+        doc = load_yaml_bytes(documentation.encode("utf-8"))
+    except Exception:  # pylint: disable=broad-exception-caught
+        return None
+    if not isinstance(doc, dict) or not isinstance(doc.get("short_description"), str):
+        return None
+    return doc
+
+
+def _static_doc_to_metadata(
+    plugin_type: str, name: str, namespace: str | None, doc: dict[str, Any]
+) -> dict[str, Any]:
+    return {
+        "description": doc.get("short_description"),
+        "name": name,
+        "namespace": namespace if plugin_type == "module" else None,
+        "version_added": doc.get("version_added"),
+    }
+
+
+def _extract_plugins_metadata(
+    paths: PathsConfig, plugin_type: str, collection_name: str | None
+) -> tuple[dict[str, dict[str, Any]], list[str]]:
+    """
+    Collect plugin metadata for all plugins of a given type whose documentation
+    can be extracted statically.
+
+    :return: A tuple ``(metadata, plugin_names)``, where ``plugin_names`` contains the
+             names of all plugins whose documentation cannot be extracted statically
+    """
+    plugin_source_path = os.path.realpath(get_plugins_path(paths, plugin_type))
+    result: dict[str, dict[str, Any]] = {}
+    remaining: list[str] = []
+    for name, path in sorted(
+        _walk_plugins(
+            paths, plugin_type, collection_name, extensions=_PLUGIN_FILE_EXTENSIONS
+        ).items()
+    ):
+        # Only Python files can contain documentation that can be extracted
+        doc = extract_plugin_documentation(path) if path.endswith(".py") else None
+        if doc is None:
+            remaining.append(name)
+            continue
+        namespace = ".".join(
+            part
+            for part in os.path.relpath(
+                os.path.dirname(path), plugin_source_path
+            ).split(os.sep)
+            if part not in ("", ".", "..")
+        )
+        processed_data = _static_doc_to_metadata(
+            plugin_type, name.rsplit(".", 1)[-1], namespace, doc
+        )
+        result[processed_data["name"]] = processed_data
+    return result, remaining
+
+
+def _load_plugins_static(
+    plugins_data: dict[str, Any],
+    paths: PathsConfig,
+    collection_details: CollectionDetails,
+    config: ChangelogConfig,
+    jobs: int,
+) -> None:
+    """
+    Collect metadata for all plugins and objects. Documentation is extracted
+    statically when possible; ansible-doc is only used for the remaining plugins,
+    for filter and test plugins, and for roles.
+
+    Filter and test plugins are always enumerated with ansible-doc, since a single
+    file can contain several of them.
+    """
+    collection_name = _get_collection_name(paths, collection_details)
+    tasks: list[tuple[str, str, list[str] | None]] = []
+    for plugin_type in get_documentable_plugins():
+        if plugin_type in ("filter", "test"):
+            # Files can contain several filter or test plugins
+            plugins_data["plugins"][plugin_type] = {}
+            tasks.append(("plugin", plugin_type, None))
+            continue
+        result, remaining = _extract_plugins_metadata(
+            paths, plugin_type, collection_name
+        )
+        plugins_data["plugins"][plugin_type] = result
+        if remaining:
+            tasks.append(("plugin", plugin_type, remaining))
+    if paths.is_collection:
+        for object_type in get_documentable_objects():
+            plugins_data["objects"][object_type] = {}
+            object_path = get_plugins_path(paths, object_type, "object")
+            if os.path.isdir(object_path) and os.listdir(object_path):
+                tasks.append(("object", object_type, None))
+
+    if not tasks:
+        return
+    LOGGER.debug("Run ansible-doc for plugins whose documentation cannot be extracted")
+    if not paths.is_collection:
+        _load_plugins_metadata(plugins_data, paths, None, None, True, jobs, tasks)
+        return
+    with collection_copier(
+        paths, config, collection_details.get_namespace(), collection_details.get_name()
+    ) as (playbook_dir, new_paths):
+        _load_plugins_metadata(
+            plugins_data,
+            new_paths,
+            playbook_dir,
+            collection_name,
+            True,
+            jobs,
+            tasks,
+        )
+
+
 def _load_plugins_2_13(
     plugins_data: dict[str, Any],
     paths: PathsConfig,
@@ -469,6 +739,116 @@ def _load_plugins_2_13(
                     ] = processed_data
 
 
+# Top-level entries of a collection that ansible-doc needs
+_STAGED_COLLECTION_ENTRIES = (
+    "MANIFEST.json",
+    "galaxy.yml",
+    "galaxy.yaml",
+    "meta",
+    "plugins",
+    "roles",
+)
+
+
+def _walk_files(base_dir: str, subdir: str) -> list[str]:
+    """
+    Return the paths, relative to ``base_dir`` and with ``/`` as separator, of all
+    files in a subdirectory of ``base_dir``. Symbolic links are not followed.
+    """
+    return [
+        os.path.relpath(os.path.join(dirpath, filename), base_dir).replace(os.sep, "/")
+        for dirpath, _, filenames in os.walk(os.path.join(base_dir, subdir))
+        for filename in filenames
+    ]
+
+
+def _list_copied_files(base_dir: str, vcs: str) -> list[str]:
+    """
+    Return the paths, relative to ``base_dir`` and with ``/`` as separator, of all
+    files that the copier for the given VCS copies when copying ``base_dir``.
+    """
+    if vcs != "git":
+        return _walk_files(base_dir, "")
+    result = []
+    for file in list_git_files(base_dir, log_debug=LOGGER.debug):
+        entry = file.decode("utf-8")
+        path = os.path.join(base_dir, entry)
+        if os.path.isdir(path) and not os.path.islink(path):
+            result.extend(_walk_files(base_dir, entry))
+        elif os.path.lexists(path):
+            result.append(entry)
+    return result
+
+
+def _get_files_size(base_dir: str, files: list[str]) -> int:
+    """
+    Return the total size of the given files relative to ``base_dir``. Symbolic links
+    are not followed.
+    """
+    size = 0
+    for file in files:
+        try:
+            size += os.lstat(os.path.join(base_dir, file)).st_size
+        except OSError:
+            pass
+    return size
+
+
+class _SelectiveCopier(Copier):
+    """
+    Copies only some top-level entries of a directory.
+    """
+
+    def __init__(self, copier: Copier, exclude_root: list[str]):
+        super().__init__(log_debug=LOGGER.debug)
+        self.copier = copier
+        self.exclude_root = exclude_root
+
+    def copy(
+        self,
+        from_path: Any,
+        to_path: Any,
+        *,
+        exclude_root: list[str] | None = None,
+    ) -> None:
+        self.copier.copy(
+            from_path, to_path, exclude_root=self.exclude_root + (exclude_root or [])
+        )
+
+
+@contextmanager
+def _symlink_collection(
+    paths: PathsConfig, namespace: str, name: str
+) -> Generator[tuple[str, PathsConfig], None, None]:
+    """
+    Creates a collection tree whose entries needed by ansible-doc are symbolic links
+    to the collection, so that ``--playbook-dir`` can be used to prefer it over any
+    installed ones.
+    """
+    root_dir = os.path.realpath(ansible_mkdtemp(prefix="antsibull-changelog"))
+    try:
+        source_dir = os.path.realpath(paths.base_dir)
+        collection_dir = os.path.join(
+            root_dir, "collections", "ansible_collections", namespace, name
+        )
+        os.makedirs(collection_dir)
+        LOGGER.debug("Temporary collection directory: {!r}", collection_dir)
+        for entry in _STAGED_COLLECTION_ENTRIES:
+            source = os.path.join(source_dir, entry)
+            if os.path.lexists(source):
+                os.symlink(source, os.path.join(collection_dir, entry))
+        LOGGER.info(
+            "Staged collection with symbolic links, avoided copying {} bytes",
+            _get_files_size(source_dir, _list_copied_files(source_dir, "none")),
+        )
+        # Paths of plugins reported by ansible-doc resolve to the collection itself
+        yield root_dir, PathsConfig.force_collection(
+            source_dir, ansible_doc_bin=paths.ansible_doc_path
+        )
+    finally:
+        shutil.rmtree(root_dir, ignore_errors=True)
+
+
 @contextmanager
 def collection_copier(
     paths: PathsConfig, config: ChangelogConfig, namespace: str, name: str
@@ -476,10 +856,28 @@ def collection_copier(
     """
     Creates a copy of a collection to a place where ``--playbook-dir`` can be used
     to prefer this copy of the collection over any installed ones.
+
+    Depending on the ``collection_staging`` configuration, the whole collection is
+    copied, only the entries needed by ansible-doc are copied, or these entries are
+    symbolically linked. Since symbolic links would also expose files ignored by
+    the VCS, the entries are copied selectively instead if a VCS is used.
     """
     vcs = config.vcs
     if vcs == "auto":
         vcs = detect_vcs(paths.base_dir, log_debug=LOGGER.debug)
+
+    staging = config.collection_staging
+    if staging == "symlink":
+        if vcs == "none":
+            with _symlink_collection(paths, namespace, name) as result:
+                yield result
+            return
+        LOGGER.info(
+            "cannot stage collection with symbolic links when using {}, copying selectively",
+            vcs,
+        )
+        staging = "selective"
+
     copier = {
         "none": Copier,
         "git": GitCopier,
@@ -487,6 +885,26 @@ def collection_copier(
         vcs
     ](log_debug=LOGGER.debug)
 
+    if staging == "selective":
+        exclude_root = sorted(
+            entry
+            for entry in os.listdir(paths.base_dir)
+            if entry not in _STAGED_COLLECTION_ENTRIES
+        )
+        LOGGER.info(
+            "Staging only {}, avoided copying {} bytes",
+            ", ".join(_STAGED_COLLECTION_ENTRIES),
+            _get_files_size(
+                paths.base_dir,
+                [
+                    file
+                    for file in _list_copied_files(paths.base_dir, vcs)
+                    if file.split("/", 1)[0] in exclude_root
+                ],
+            ),
+        )
+        copier = _SelectiveCopier(copier, exclude_root)
+
     with CollectionCopier(
         source_directory=paths.base_dir,
         namespace=namespace,
@@ -518,12 +936,73 @@ def _load_collection_plugins_2_13(
         )
 
 
-def _load_collection_plugins(
+def _get_plugin_metadata_tasks(
+    include_objects: bool = True,
+) -> list[tuple[str, str, list[str] | None]]:
+    """
+    Return tasks for ``_load_plugins_metadata()`` for all documentable plugin types,
+    and optionally for all documentable object types.
+    """
+    tasks: list[tuple[str, str, list[str] | None]] = [
+        ("plugin", plugin_type, None) for plugin_type in get_documentable_plugins()
+    ]
+    if include_objects:
+        tasks.extend(
+            ("object", object_type, None) for object_type in get_documentable_objects()
+        )
+    return tasks
+
+
+def _load_plugins_metadata(  # pylint: disable=too-many-arguments
+    plugins_data: dict[str, Any],
+    paths: PathsConfig,
+    playbook_dir: str | None,
+    collection_name: str | None,
+    use_ansible_doc: bool,
+    jobs: int,
+    tasks: list[tuple[str, str, list[str] | None]],
+) -> None:
+    """
+    Collect metadata for plugins and objects, and merge it into ``plugins_data``.
+
+    Every task is a tuple ``(category, plugin_type, plugin_names)``. If ``plugin_names``
+    is ``None``, all plugins of that type are considered.
+
+    Every task needs its own ansible-doc invocations. If ``jobs`` is larger than one,
+    up to ``jobs`` tasks are processed at the same time. The result does not depend
+    on the number of jobs.
+    """
+
+    def load(task: tuple[str, str, list[str] | None]) -> dict[str, dict[str, Any]]:
+        category, plugin_type, plugin_names = task
+        return load_plugin_metadata(
+            paths,
+            playbook_dir,
+            plugin_type,
+            collection_name,
+            use_ansible_doc=use_ansible_doc,
+            category=category,
+            plugin_names=plugin_names,
+        )
+
+    if jobs > 1 and len(tasks) > 1:
+        LOGGER.debug("Loading plugin metadata with {} workers", jobs)
+        with ThreadPoolExecutor(max_workers=min(jobs, len(tasks))) as executor:
+            results = list(executor.map(load, tasks))
+    else:
+        results = [load(task) for task in tasks]
+
+    for (category, plugin_type, _), result in zip(tasks, results):
+        plugins_data[f"{category}s"].setdefault(plugin_type, {}).update(result)
+
+
+def _load_collection_plugins(  # pylint: disable=too-many-arguments
     plugins_data: dict[str, Any],
     paths: PathsConfig,
     collection_details: CollectionDetails,
     config: ChangelogConfig,
     use_ansible_doc: bool,
+    jobs: int = 1,
 ) -> None:
     collection_name = "{}.{}".format(
         collection_details.get_namespace(), collection_details.get_name()
@@ -532,36 +1011,46 @@ def _load_collection_plugins(
     with collection_copier(
         paths, config, collection_details.get_namespace(), collection_details.get_name()
     ) as (playbook_dir, new_paths):
-        for plugin_type in get_documentable_plugins():
-            plugins_data["plugins"][plugin_type] = load_plugin_metadata(
-                new_paths,
-                playbook_dir,
-                plugin_type,
-                collection_name,
-                use_ansible_doc=use_ansible_doc,
-            )
-
-        for object_type in get_documentable_objects():
-            plugins_data["objects"][object_type] = load_plugin_metadata(
-                new_paths,
-                playbook_dir,
-                object_type,
-                collection_name,
-                use_ansible_doc=use_ansible_doc,
-                category="object",
-            )
+        _load_plugins_metadata(
+            plugins_data,
+            new_paths,
+            playbook_dir,
+            collection_name,
+            use_ansible_doc,
+            jobs,
+            _get_plugin_metadata_tasks(),
+        )
 
 
 def _load_ansible_plugins(
-    plugins_data: dict[str, Any], paths: PathsConfig, use_ansible_doc: bool
+    plugins_data: dict[str, Any],
+    paths: PathsConfig,
+    use_ansible_doc: bool,
+    jobs: int = 1,
 ) -> None:
-    for plugin_type in get_documentable_plugins():
-        plugins_data["plugins"][plugin_type] = load_plugin_metadata(
-            paths, None, plugin_type, None, use_ansible_doc=use_ansible_doc
-        )
+    _load_plugins_metadata(
+        plugins_data,
+        paths,
+        None,
+        None,
+        use_ansible_doc,
+        jobs,
+        _get_plugin_metadata_tasks(include_objects=False),
+    )
 
 
 def _get_ansible_core_version(paths: PathsConfig) -> packaging.version.Version:
+    """
+    Determine the version of ansible-core.
+
+    The version is taken from the installed package's metadata if possible, since
+    this is a lot faster than importing ansible or running ``ansible-doc --version``.
+    """
+    try:
+        return packaging.version.Version(importlib.metadata.version("ansible-core"))
+    except importlib.metadata.PackageNotFoundError:
+        pass
+
     try:
         version, _ = get_ansible_release()
         return packaging.version.Version(version)
@@ -569,7 +1058,7 @@ def _get_ansible_core_version(paths: PathsConfig) -> packaging.version.Version:
         pass
 
     command = [paths.ansible_doc_path, "--version"]
-    output = subprocess.check_output(command).decode("utf-8")
+    output = check_output(command).decode("utf-8")
     for regex in (r"^ansible-doc \[(?:core|base) ([^\]]+)\]", r"^ansible-doc ([^\s]+)"):
         match = re.match(regex, output)
         if match:
@@ -579,12 +1068,148 @@ def _get_ansible_core_version(paths: PathsConfig) -> packaging.version.Version:
     )
 
 
-def _refresh_plugin_cache(
+def _get_plugin_source_dirs(paths: PathsConfig) -> list[str]:
+    """
+    Return the directories containing the sources of all plugins and objects.
+    """
+    if paths.is_collection:
+        return [
+            os.path.join(paths.base_dir, "plugins"),
+            os.path.join(paths.base_dir, "roles"),
+        ]
+    lib_ansible = os.path.join(paths.base_dir, "lib", "ansible")
+    return [os.path.join(lib_ansible, "modules"), os.path.join(lib_ansible, "plugins")]
+
+
+def _hash_plugin_sources(paths: PathsConfig) -> dict[str, str]:
+    """
+    Compute the SHA-256 hashes of all files in the plugin source directories.
+
+    :return: A dictionary mapping paths relative to the project's base directory
+             (with ``/`` as separator) to the hashes of their content. Hashes of
+             symbolic links are prefixed with ``symlink:``.
+    """
+    result: dict[str, str] = {}
+    for source_dir in _get_plugin_source_dirs(paths):
+        for dirpath, dirnames, filenames in os.walk(source_dir):
+            dirnames[:] = [dirname for dirname in dirnames if dirname != "__pycache__"]
+            for filename in filenames:
+                if filename.endswith((".pyc", ".pyo")):
+                    continue
+                path = os.path.join(dirpath, filename)
+                relpath = os.path.relpath(path, paths.base_dir).replace(os.sep, "/")
+                try:
+                    with open(path, "rb") as f:
+                        digest = hashlib.sha256(f.read()).hexdigest()
+                except OSError:
+                    # Broken symlinks and similar
+                    continue
+                if os.path.islink(path):
+                    digest = f"symlink:{digest}"
+                result[relpath] = digest
+    return result
+
+
+def _has_cached_plugins_from(
+    paths: PathsConfig, source_dir: str, cached_data: dict[str, Any]
+) -> bool:
+    """
+    Determine whether the plugin cache contains plugins or objects from the given
+    plugin source directory.
+    """
+    plugins = cached_data.get("plugins") or {}
+    name = os.path.basename(source_dir)
+    if name == "roles":
+        return bool((cached_data.get("objects") or {}).get("role"))
+    if name == "modules":
+        return bool(plugins.get("module"))
+    return any(
+        section
+        for plugin_type, section in plugins.items()
+        if paths.is_collection or plugin_type != "module"
+    )
+
+
+def _get_newest_change(source_dir: str) -> int:
+    """
+    Return the newest modification or status change time (in nanoseconds) of the
+    given plugin source directory and of all files and directories in it.
+    """
+    result = 0
+    for dirpath, dirnames, filenames in os.walk(source_dir):
+        dirnames[:] = [dirname for dirname in dirnames if dirname != "__pycache__"]
+        for name in [""] + filenames:
+            try:
+                stat = os.stat(os.path.join(dirpath, name))
+            except OSError:
+                # Broken symlinks and similar
+                continue
+            result = max(result, stat.st_mtime_ns, stat.st_ctime_ns)
+    return result
+
+
+def _is_plugin_cache_fresh(
+    plugin_cache_path: str, paths: PathsConfig, cached_data: dict[str, Any]
+) -> bool:
+    """
+    Determine whether the plugin cache is newer than all plugin sources and than
+    ansible-doc. In that case, its fingerprint does not need to be recomputed.
+    """
+    ansible_doc = shutil.which(paths.ansible_doc_path)
+    if ansible_doc is None:
+        return False
+    try:
+        cache_time = os.stat(plugin_cache_path).st_mtime_ns
+        ansible_doc_stat = os.stat(ansible_doc)
+    except OSError:
+        return False
+    newest = max(ansible_doc_stat.st_mtime_ns, ansible_doc_stat.st_ctime_ns)
+    for source_dir in _get_plugin_source_dirs(paths):
+        if os.path.isdir(source_dir):
+            newest = max(newest, _get_newest_change(source_dir))
+        elif _has_cached_plugins_from(paths, source_dir, cached_data):
+            return False
+    return newest < cache_time
+
+
+def _get_collection_name(
+    paths: PathsConfig, collection_details: CollectionDetails
+) -> str | None:
+    if not paths.is_collection:
+        return None
+    return "{}.{}".format(
+        collection_details.get_namespace(), collection_details.get_name()
+    )
+
+
+def _get_plugin_cache_fingerprint(
+    collection_name: str | None,
+    core_version: packaging.version.Version,
+    sources: dict[str, str],
+) -> str:
+    """
+    Compute a fingerprint of everything the plugin cache depends on: the content
+    of all files in the plugin source directories, the collection's name, the
+    version of ansible-core, and the plugin and object types that can be documented.
+    """
+    data = {
+        "ansible_core": str(core_version),
+        "collection": collection_name,
+        "files": sources,
+        "plugin_types": sorted(get_documentable_plugins()),
+        "object_types": sorted(get_documentable_objects()),
+    }
+    return hashlib.sha256(json.dumps(data, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _refresh_plugin_cache(  # pylint: disable=too-many-arguments
     paths: PathsConfig,
     collection_details: CollectionDetails,
     config: ChangelogConfig,
     version: str,
     use_ansible_doc: bool = False,
+    jobs: int = 1,
+    core_version: packaging.version.Version | None = None,
 ):
     LOGGER.info("refreshing plugin cache")
 
@@ -594,8 +1219,11 @@ def _refresh_plugin_cache(
         "objects": {},
     }
 
-    core_version = _get_ansible_core_version(paths)
-    if core_version >= packaging.version.Version("2.13.0.dev0"):
+    if core_version is None:
+        core_version = _get_ansible_core_version(paths)
+    if config.static_plugin_docs:
+        _load_plugins_static(plugins_data, paths, collection_details, config, jobs)
+    elif core_version >= packaging.version.Version("2.13.0.dev0"):
         if paths.is_collection:
             _load_collection_plugins_2_13(
                 plugins_data, paths, collection_details, config
@@ -604,10 +1232,10 @@ def _refresh_plugin_cache(
             _load_plugins_2_13(plugins_data, paths, "ansible.builtin")
     elif paths.is_collection:
         _load_collection_plugins(
-            plugins_data, paths, collection_details, config, use_ansible_doc
+            plugins_data, paths, collection_details, config, use_ansible_doc, jobs
         )
     else:
-        _load_ansible_plugins(plugins_data, paths, use_ansible_doc)
+        _load_ansible_plugins(plugins_data, paths, use_ansible_doc, jobs)
 
     # remove empty namespaces from plugins
     for category in ("plugins", "objects"):
@@ -619,6 +1247,383 @@ def _refresh_plugin_cache(
     return plugins_data
 
 
+class _FullRefreshRequired(Exception):
+    """
+    Raised when a change of the plugin sources cannot be handled by an incremental
+    refresh of the plugin cache.
+    """
+
+
+def _get_changed_plugin(relpath: str) -> tuple[str, str] | None:
+    """
+    Determine which plugin a file in a collection belongs to.
+
+    :arg relpath: Path of the file relative to the collection's root, with ``/``
+                  as separator
+    :return: A tuple ``(plugin_type, name)``, where ``name`` is relative to the
+             collection, or ``None`` if the file cannot influence plugin metadata
+    :raises _FullRefreshRequired: If the file can influence the metadata of plugins
+                                  that cannot be determined from its path, like doc
+                                  fragments, roles, or files containing several
+                                  filter or test plugins
+    """
+    parts = relpath.split("/")
+    if parts[0] != "plugins" or len(parts) < 3 or parts[1] == "doc_fragments":
+        raise _FullRefreshRequired(relpath)
+    plugin_type = "module" if parts[1] == "modules" else parts[1]
+    if plugin_type not in get_documentable_plugins():
+        # Module utils, action plugins, ...
+        return None
+    basename, ext = os.path.splitext(parts[-1])
+    if (
+        plugin_type in ("filter", "test")
+        or ext != ".py"
+        or (plugin_type != "module" and len(parts) > 3)
+    ):
+        raise _FullRefreshRequired(relpath)
+    if basename == "__init__":
+        return None
+    return plugin_type, ".".join(parts[2:-1] + [basename])
+
+
+def _get_changed_plugins(
+    old_sources: dict[str, str], new_sources: dict[str, str]
+) -> dict[str, tuple[set[str], set[str]]]:
+    """
+    Determine the plugins whose sources have been added, modified, or removed.
+
+    :return: A dictionary mapping plugin types to tuples ``(updated, removed)`` of
+             sets of plugin names relative to the collection
+    :raises _FullRefreshRequired: If the changes cannot be handled incrementally
+    """
+    result: dict[str, tuple[set[str], set[str]]] = {}
+    for relpath in sorted(set(old_sources) | set(new_sources)):
+        old_digest = old_sources.get(relpath)
+        new_digest = new_sources.get(relpath)
+        if old_digest == new_digest:
+            continue
+        if any(
+            digest is not None and digest.startswith("symlink:")
+            for digest in (old_digest, new_digest)
+        ):
+            # Symlinked plugins are aliases of other plugins
+            raise _FullRefreshRequired(relpath)
+        plugin = _get_changed_plugin(relpath)
+        if plugin is None:
+            continue
+        plugin_type, name = plugin
+        updated, removed = result.setdefault(plugin_type, (set(), set()))
+        (updated if new_digest is not None else removed).add(name)
+
+    # Modules are stored without their namespace, so modules of the same name in
+    # different namespaces cannot be told apart
+    module_names = [
+        os.path.splitext(relpath.rsplit("/", 1)[-1])[0]
+        for relpath in new_sources
+        if relpath.startswith("plugins/modules/") and relpath.endswith(".py")
+    ]
+    updated, removed = result.get("module", (set(), set()))
+    for name in updated | removed:
+        basename = name.rsplit(".", 1)[-1]
+        if module_names.count(basename) > (1 if name in updated else 0):
+            raise _FullRefreshRequired(name)
+    return result
+
+
+def _extract_changed_plugins(
+    plugins_data: dict[str, Any],
+    paths: PathsConfig,
+    changed_plugins: dict[str, tuple[set[str], set[str]]],
+    use_static_docs: bool,
+) -> dict[str, list[str]]:
+    """
+    Remove the changed plugins from ``plugins_data``, and add the updated plugins whose
+    documentation can be extracted statically if ``use_static_docs`` is ``True``.
+
+    :return: A dictionary mapping plugin types to the names of updated plugins that
+             need to be documented by ansible-doc
+    """
+    result: dict[str, list[str]] = {}
+    for plugin_type, (updated, removed) in sorted(changed_plugins.items()):
+        section = plugins_data["plugins"].setdefault(plugin_type, {})
+        for name in updated | removed:
+            section.pop(name.rsplit(".", 1)[-1], None)
+        for name in sorted(updated):
+            namespace, _, short_name = name.rpartition(".")
+            doc = None
+            if use_static_docs:
+                doc = extract_plugin_documentation(
+                    os.path.join(get_plugins_path(paths, plugin_type), *name.split("."))
+                    + ".py"
+                )
+            if doc is None:
+                result.setdefault(plugin_type, []).append(name)
+                continue
+            processed_data = _static_doc_to_metadata(
+                plugin_type, short_name, namespace, doc
+            )
+            if processed_data["namespace"] is None:
+                del processed_data["namespace"]
+            section[short_name] = processed_data
+    return result
+
+
+def _load_changed_plugins(  # pylint: disable=too-many-arguments
+    plugins_data: dict[str, Any],
+    paths: PathsConfig,
+    collection_details: CollectionDetails,
+    config: ChangelogConfig,
+    core_version: packaging.version.Version,
+    changed_plugins: dict[str, tuple[set[str], set[str]]],
+) -> None:
+    """
+    Update ``plugins_data`` for the given changed plugins of a collection.
+    """
+    collection_name = _get_collection_name(paths, collection_details)
+    is_ansible_core_2_13 = core_version >= packaging.version.Version("2.13.0.dev0")
+
+    to_document = _extract_changed_plugins(
+        plugins_data, paths, changed_plugins, config.static_plugin_docs
+    )
+    if not to_document:
+        return
+
+    with collection_copier(
+        paths, config, collection_details.get_namespace(), collection_details.get_name()
+    ) as (playbook_dir, new_paths):
+        for plugin_type, names in sorted(to_document.items()):
+            LOGGER.debug("Run ansible-doc for {} {}", plugin_type, names)
+            data = run_ansible_doc(
+                new_paths,
+                playbook_dir,
+                plugin_type,
+                [f"{collection_name}.{name}" for name in names],
+            )
+            section = plugins_data["plugins"][plugin_type]
+            for plugin_name, plugin_data in data.items():
+                processed_data = jsondoc_to_metadata(
+                    new_paths,
+                    collection_name,
+                    plugin_type,
+                    plugin_name,
+                    plugin_data,
+                    is_ansible_core_2_13=is_ansible_core_2_13,
+                )
+                if processed_data["namespace"] is None:
+                    del processed_data["namespace"]
+                section[processed_data["name"]] = processed_data
+
+
+def _refresh_plugin_cache_incrementally(  # pylint: disable=too-many-arguments
+    cached_data: dict[str, Any],
+    paths: PathsConfig,
+    collection_details: CollectionDetails,
+    config: ChangelogConfig,
+    version: str,
+    core_version: packaging.version.Version,
+    sources: dict[str, str],
+) -> dict[str, Any] | None:
+    """
+    Update the plugin cache by running ansible-doc only for plugins whose sources
+    have been added or modified, and by removing plugins whose sources have been
+    removed.
+
+    :return: The updated plugin cache, or ``None`` if a full refresh is needed
+    """
+    old_sources = cached_data.get("sources")
+    if not paths.is_collection or not isinstance(old_sources, dict):
+        return None
+    collection_name = _get_collection_name(paths, collection_details)
+    old_fingerprint = _get_plugin_cache_fingerprint(
+        collection_name, core_version, old_sources
+    )
+    if old_fingerprint != cached_data["fingerprint"]:
+        # The ansible-core version, the collection name, or the documentable
+        # plugin types changed
+        return None
+    try:
+        changed_plugins = _get_changed_plugins(old_sources, sources)
+    except _FullRefreshRequired as exc:
+        LOGGER.debug("Cannot refresh plugin cache incrementally due to {}", exc)
+        return None
+
+    LOGGER.info("refreshing plugin cache incrementally")
+    plugins_data: dict[str, Any] = {
+        "version": version,
+        "plugins": {
+            plugin_type: dict(plugins)
+            for plugin_type, plugins in cached_data["plugins"].items()
+        },
+        "objects": cached_data.get("objects", {}),
+    }
+    _load_changed_plugins(
+        plugins_data, paths, collection_details, config, core_version, changed_plugins
+    )
+    return plugins_data
+
+
+def _is_plugin_cache_valid(
+    plugin_cache_path: str,
+    paths: PathsConfig,
+    cached_data: dict[str, Any],
+    version: str,
+) -> bool:
+    """
+    Determine whether the plugin cache is valid without computing its fingerprint.
+    """
+    if "fingerprint" in cached_data:
+        return _is_plugin_cache_fresh(plugin_cache_path, paths, cached_data)
+    if version == cached_data["version"]:
+        return True
+    LOGGER.info(
+        "version {} does not match plugin cache version {}",
+        version,
+        cached_data["version"],
+    )
+    return False
+
+
+def _update_plugin_cache(  # pylint: disable=too-many-arguments
+    plugin_cache_path: str,
+    cached_data: dict[str, Any],
+    paths: PathsConfig,
+    collection_details: CollectionDetails,
+    config: ChangelogConfig,
+    version: str,
+    use_ansible_doc: bool,
+    jobs: int,
+) -> dict[str, Any]:
+    """
+    Return the plugin cache if it is still valid, and an updated plugin cache otherwise.
+
+    Caches with a fingerprint are valid as long as the fingerprint does not change.
+    The fingerprint is only recomputed if the plugin sources or ansible-doc changed
+    since the cache file was last modified. Older caches without a fingerprint are
+    only valid for the version they were created for.
+    """
+    if cached_data and _is_plugin_cache_valid(
+        plugin_cache_path, paths, cached_data, version
+    ):
+        return cached_data
+    if "fingerprint" not in cached_data:
+        cached_data = {}
+
+    core_version = _get_ansible_core_version(paths)
+    collection_name = _get_collection_name(paths, collection_details)
+    sources = _hash_plugin_sources(paths)
+    fingerprint = _get_plugin_cache_fingerprint(collection_name, core_version, sources)
+
+    plugins_data: dict[str, Any] | None = None
+    if cached_data:
+        if fingerprint == cached_data["fingerprint"]:
+            # Mark the cache as fresh, so that the fingerprint does not have to be
+            # recomputed next time
+            try:
+                os.utime(plugin_cache_path)
+            except OSError:
+                pass
+            return cached_data
+        LOGGER.info("plugin sources or ansible-core version changed since last cached")
+        if config.incremental_plugin_refresh:
+            plugins_data = _refresh_plugin_cache_incrementally(
+                cached_data,
+                paths,
+                collection_details,
+                config,
+                version,
+                core_version,
+                sources,
+            )
+
+    if plugins_data is None:
+        plugins_data = _refresh_plugin_cache(
+            paths,
+            collection_details,
+            config,
+            version,
+            use_ansible_doc,
+            jobs,
+            core_version=core_version,
+        )
+    plugins_data["fingerprint"] = fingerprint
+    if config.incremental_plugin_refresh:
+        plugins_data["sources"] = sources
+    return plugins_data
+
+
+def _get_markup_converter() -> str:
+    try:
+        parser_version = importlib.metadata.version("antsibull-docs-parser")
+    except importlib.metadata.PackageNotFoundError:  # pragma: no cover
+        parser_version = "unknown"
+    return f"antsibull-changelog {_version}, antsibull-docs-parser {parser_version}"
+
+
+def _load_markup_cache(plugins_data: dict[str, Any]) -> dict[tuple[str, bool], str]:
+    """
+    Return a markup cache with the converted descriptions stored in the plugin cache.
+    """
+    markup_cache: dict[tuple[str, bool], str] = {}
+    markup = plugins_data.get("markup")
+    if (
+        not isinstance(markup, dict)
+        or markup.get("converter") != _get_markup_converter()
+    ):
+        return markup_cache
+    for description, add_plugin_period, converted in markup.get("descriptions") or []:
+        markup_cache.setdefault((description, add_plugin_period), converted)
+    return markup_cache
+
+
+def _update_markup_cache(
+    plugins_data: dict[str, Any],
+    add_plugin_period: bool,
+    markup_cache: dict[tuple[str, bool], str],
+) -> None:
+    """
+    Store the converted descriptions of all plugins in the plugin cache.
+    """
+    keys = {
+        (plugin["description"] or "", add_plugin_period)
+        for category in ("plugins", "objects")
+        for plugins in (plugins_data.get(category) or {}).values()
+        for plugin in plugins.values()
+        # Only descriptions that are strings are stored in the markup cache
+        if isinstance(plugin["description"] or "", str)
+    }
+    markup = {
+        "converter": _get_markup_converter(),
+        "descriptions": sorted(
+            [description, period, markup_cache[(description, period)]]
+            for description, period in keys
+            if (description, period) in markup_cache
+        ),
+    }
+    plugins_data["markup"] = markup
+
+
+def _load_plugin_cache(path: str) -> dict[str, Any]:
+    with open(path, "rb") as f:
+        content = f.read()
+    # Caches stored in JSON format can be loaded much faster as JSON than as YAML
+    if content.lstrip().startswith(b"{"):
+        try:
+            return json.loads(content)
+        except ValueError:
+            pass
+    return load_yaml_bytes(content)
+
+
+def _store_plugin_cache(path: str, data: dict[str, Any], cache_format: str) -> None:
+    if cache_format != "json":
+        store_yaml_file(path, data)
+        return
+    # JSON is a subset of YAML, so the file can still be read as YAML
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=1, sort_keys=True)
+        f.write("\n")
+
+
 def load_plugins(  # pylint: disable=too-many-arguments
     paths: PathsConfig,
     collection_details: CollectionDetails,
@@ -627,42 +1632,57 @@ def load_plugins(  # pylint: disable=too-many-arguments
     force_reload: bool = False,
     use_ansible_doc: bool = False,
     add_plugin_period: bool = False,
+    jobs: int | None = None,
 ) -> list[PluginDescription]:
     """
     Load plugins from ansible-doc.
 
+    The result is cached in ``.plugin-cache.yaml`` in the changelog directory. The cache
+    is reused as long as the plugin sources and the version of ansible-core do not
+    change. If ``incremental_plugin_refresh`` is enabled in the configuration, only
+    plugins whose sources changed are reloaded when possible. If ``ansible_doc_worker``
+    is enabled, ansible-doc requests are run by a persistent worker process.
+    The cache is stored as JSON if ``plugin_cache_format`` is ``json``; caches in
+    either format are loaded. When the cache is written, it also stores the
+    descriptions converted to RST, so that they do not have to be converted again.
+
     :arg paths: Paths configuration
     :arg collection_details: Collection details
-    :arg version: The current version. Used for caching data
+    :arg version: The current version. Stored in the cache for information
     :arg force_reload: Set to ``True`` to ignore potentially cached data
     :arg use_ansible_doc: Set to ``True`` to always use ansible-doc to enumerate plugins/modules
+    :arg jobs: Number of plugin types to load concurrently with ansible-core < 2.13.
+               If not given, the value of ``plugin_load_jobs`` from the configuration
+               is used.
     :return: A list of all plugins
     """
     if paths.is_other_project:
         return []
 
-    plugin_cache_path = os.path.join(paths.changelog_dir, ".plugin-cache.yaml")
-    plugins_data: dict[str, Any] = {}
+    if jobs is None:
+        jobs = config.plugin_load_jobs
 
+    plugin_cache_path = os.path.join(paths.changelog_dir, ".plugin-cache.yaml")
+    cached_data: dict[str, Any] = {}
     if not force_reload and os.path.exists(plugin_cache_path):
-        plugins_data = load_yaml_file(plugin_cache_path)
-        if version != plugins_data["version"]:
-            LOGGER.info(
-                "version {} does not match plugin cache version {}",
-                version,
-                plugins_data["version"],
-            )
-            plugins_data = {}
-
-    if not plugins_data:
-        plugins_data = _refresh_plugin_cache(
-            paths, collection_details, config, version, use_ansible_doc
+        cached_data = _load_plugin_cache(plugin_cache_path)
+    markup_cache = _load_markup_cache(cached_data)
+
+    with ansible_doc_session(paths.ansible_doc_path, enabled=config.ansible_doc_worker):
+        plugins_data = _update_plugin_cache(
+            plugin_cache_path,
+            cached_data,
+            paths,
+            collection_details,
+            config,
+            version,
+            use_ansible_doc,
+            jobs,
         )
-        store_yaml_file(plugin_cache_path, plugins_data)
-
     plugins = PluginDescription.from_dict(
         plugins_data["plugins"],
         add_plugin_period=add_plugin_period,
+        markup_cache=markup_cache,
     )
     if "objects" in plugins_data:
         plugins.extend(
@@ -670,7 +1690,12 @@ def load_plugins(  # pylint: disable=too-many-arguments
                 plugins_data["objects"],
                 category="object",
                 add_plugin_period=add_plugin_period,
+                markup_cache=markup_cache,
             )
         )
 
+    if plugins_data is not cached_data:
+        _update_markup_cache(plugins_data, add_plugin_period, markup_cache)
+        _store_plugin_cache(plugin_cache_path, plugins_data, config.plugin_cache_format)
+
     return plugins
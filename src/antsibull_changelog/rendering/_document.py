@@ -11,11 +11,14 @@ Common code for rendering a document.
 from __future__ import annotations
 
 import abc
+from collections.abc import Iterable, Iterator
+from typing import Any, TextIO
 
 from antsibull_docutils.utils import ensure_newline_after_last_content
 
 from ..config import TextFormat
-from .document import AbstractRenderer, DocumentRenderer
+from .block_cache import BlockCache, get_block_key
+from .document import AbstractRenderer, DocumentRenderer, SectionRenderer
 
 
 class BaseContent(abc.ABC):
@@ -33,6 +36,19 @@ class BaseContent(abc.ABC):
         Generate data for this content (if dynamic).
         """
 
+    def get_fingerprint(self) -> Any:
+        """
+        Return JSON-serializable data that determines the lines of this content, or
+        ``None`` if the content's lines cannot be cached.
+        """
+        return None
+
+    def iter_texts(self) -> Iterator[TextRenderer]:
+        """
+        Iterate over all texts in this content, in document order.
+        """
+        return iter(())
+
     @abc.abstractmethod
     def append_lines(self, lines: list[str], start_level: int = 0) -> None:
         """
@@ -40,6 +56,47 @@ class BaseContent(abc.ABC):
         """
 
 
+class LineWriter(list[str]):
+    """
+    List of lines that can pass all lines but the last one on to a text stream.
+
+    Content only looks at the last line when appending lines, so the other lines
+    can be written as soon as a piece of content has been completed.
+    """
+
+    sink: TextIO
+    written: int
+
+    def __init__(self, sink: TextIO):
+        super().__init__()
+        self.sink = sink
+        self.written = 0
+
+    def flush(self, keep_last: bool = True) -> None:
+        """
+        Write all lines but the last one to the sink, and remove them from the list.
+        If ``keep_last=False``, also write and remove the last line.
+        """
+        count = len(self) - 1 if keep_last else len(self)
+        if count > 0:
+            self.sink.write("".join(f"{line}\n" for line in self[:count]))
+            del self[:count]
+            self.written += count
+
+
+# Number of lines a LineWriter collects before writing them
+_FLUSH_THRESHOLD = 512
+
+
+def flush_lines(lines: list[str]) -> None:
+    """
+    Pass completed lines on to the sink if ``lines`` is a ``LineWriter`` that has
+    collected enough of them.
+    """
+    if isinstance(lines, LineWriter) and len(lines) > _FLUSH_THRESHOLD:
+        lines.flush()
+
+
 class DocumentRendererEx(DocumentRenderer):
     """
     Abstract extended document renderer
@@ -63,6 +120,49 @@ class DocumentRendererEx(DocumentRenderer):
             raise ValueError("Document title already set")
         self.title = title
 
+    def prepare_texts(self, texts: Iterable[TextRenderer]) -> None:
+        """
+        Called before the given texts are rendered with ``render_text()``. This
+        allows to process several texts at once.
+        """
+
+    def get_block_context(self) -> Any:
+        """
+        Return JSON-serializable data on document settings that influence how
+        sections are rendered.
+        """
+        return None
+
+    def begin_block(self) -> Any:
+        """
+        Called before a cacheable section is rendered. The result is passed to
+        ``end_block()``.
+        """
+        return None
+
+    def end_block(self, state: Any) -> Any:
+        # pylint: disable=unused-argument
+        """
+        Called after a cacheable section has been rendered. Returns JSON-serializable
+        data that ``replay_block()`` needs when the rendered section is reused, or
+        ``None`` if the rendered section cannot be reused.
+        """
+        return {}
+
+    def replay_block(self, block_state: Any) -> None:
+        """
+        Called when a rendered section is reused, with the result of ``end_block()``.
+        """
+
+    def replace_block_ids(
+        self, lines: list[str], old_ids: list[str], new_ids: list[str]
+    ) -> list[str]:
+        # pylint: disable=unused-argument
+        """
+        Replace the IDs of sections in reused rendered lines.
+        """
+        return lines
+
 
 class ParagraphBreak(BaseContent):
     """
@@ -74,6 +174,9 @@ class ParagraphBreak(BaseContent):
     ):
         super().__init__(already_closed=True)
 
+    def get_fingerprint(self) -> Any:
+        return ["paragraph-break"]
+
     def append_lines(self, lines: list[str], start_level: int = 0) -> None:
         ensure_newline_after_last_content(lines)
 
@@ -106,6 +209,18 @@ class TextRenderer(BaseContent):
         self.indent_first = indent_first
         self.indent_next = indent_next
 
+    def get_fingerprint(self) -> Any:
+        return [
+            "text",
+            self.text,
+            self.text_format.value,
+            self.indent_first,
+            self.indent_next,
+        ]
+
+    def iter_texts(self) -> Iterator[TextRenderer]:
+        yield self
+
     def append_lines(self, lines: list[str], start_level: int = 0) -> None:
         text = self.root.render_text(self.text, self.text_format)
         indent = self.indent_first
@@ -166,13 +281,96 @@ class AbstractRendererEx(BaseContent, AbstractRenderer):
     def ensure_paragraph_break(self) -> None:
         self.content.append(ParagraphBreak())
 
+    def _get_content_fingerprint(self) -> list[Any] | None:
+        result = []
+        for content in self.content:
+            fingerprint = content.get_fingerprint()
+            if fingerprint is None:
+                return None
+            result.append(fingerprint)
+        return result
 
-def _render(abstract_renderer: AbstractRendererEx, start_level: int = 0) -> str:
+    def iter_texts(self) -> Iterator[TextRenderer]:
+        for content in self.content:
+            yield from content.iter_texts()
+
+
+class SectionRendererEx(AbstractRendererEx, SectionRenderer):
+    """
+    Abstract extended section renderer. The rendered lines of the section can be
+    cached.
+    """
+
+    _block_cache: BlockCache | None = None
+
+    def use_block_cache(self, block_cache: BlockCache) -> None:
+        self._block_cache = block_cache
+
+    def get_block_ids(self) -> list[str]:
+        """
+        Return the IDs of this section and all its subsections that appear in the
+        rendered lines.
+        """
+        return []
+
+    @abc.abstractmethod
+    def _append_section_lines(self, lines: list[str], start_level: int) -> None:
+        """
+        Append the lines for this section's title and content.
+        """
+
+    def _render_section_lines(self, lines: list[str], start_level: int) -> None:
+        self.root.prepare_texts(self.iter_texts())
+        self._append_section_lines(lines, start_level)
+
+    def _get_block_lines(self, block_cache: BlockCache, start_level: int) -> list[str]:
+        lines: list[str] = []
+        fingerprint = self.get_fingerprint()
+        if fingerprint is None:
+            self._render_section_lines(lines, start_level)
+            return lines
+
+        key = get_block_key(
+            [
+                type(self.root).__name__,
+                self.root.get_block_context(),
+                start_level,
+                fingerprint,
+            ]
+        )
+        ids = self.get_block_ids()
+        block = block_cache.get(key)
+        if block is not None:
+            self.root.replay_block(block["state"])
+            return self.root.replace_block_ids(block["lines"], block["ids"], ids)
+
+        state = self.root.begin_block()
+        try:
+            self._render_section_lines(lines, start_level)
+        finally:
+            block_state = self.root.end_block(state)
+        if block_state is not None:
+            block_cache.put(key, {"lines": lines, "ids": ids, "state": block_state})
+        return lines
+
+    def append_lines(self, lines: list[str], start_level: int = 0) -> None:
+        ensure_newline_after_last_content(lines)
+        if self._block_cache is None:
+            self._render_section_lines(lines, start_level)
+        else:
+            lines.extend(self._get_block_lines(self._block_cache, start_level))
+
+
+def _generate(abstract_renderer: AbstractRendererEx) -> None:
     # Make sure everything is generated
     abstract_renderer.generate()
     for content in abstract_renderer.content:
         content.generate()
 
+
+def _render(abstract_renderer: AbstractRendererEx, start_level: int = 0) -> str:
+    _generate(abstract_renderer)
+
     # Generate lines
     lines: list[str] = []
     abstract_renderer.append_lines(lines, start_level=start_level)
@@ -181,6 +379,15 @@ def _render(abstract_renderer: AbstractRendererEx, start_level: int = 0) -> str:
     return "\n".join(lines) + "\n"  # add trailing newline
 
 
+def _check_document(
+    document_renderer: DocumentRendererEx,
+    abstract_renderer: AbstractRendererEx,
+) -> None:
+    abstract_renderer._check_content_closed()  # pylint: disable=protected-access
+    if document_renderer.start_level == 0 and document_renderer.title is None:
+        raise ValueError("Title must be specified if start_level == 0")
+
+
 def render_section(
     abstract_renderer: AbstractRendererEx,
 ) -> str:
@@ -207,9 +414,7 @@ def render_document(
     :arg abstract_renderer: View of the document as an extended abstract renderer.
     """
     # Check
-    abstract_renderer._check_content_closed()  # pylint: disable=protected-access
-    if document_renderer.start_level == 0 and document_renderer.title is None:
-        raise ValueError("Title must be specified if start_level == 0")
+    _check_document(document_renderer, abstract_renderer)
 
     return _render(
         abstract_renderer,
@@ -217,11 +422,39 @@ def render_document(
     )
 
 
+def render_document_to(
+    document_renderer: DocumentRendererEx,
+    abstract_renderer: AbstractRendererEx,
+    sink: TextIO,
+) -> None:
+    """
+    Renders the document to a text stream. The result is identical to the one of
+    ``render_document()``, but lines are written as soon as sections are complete.
+
+    :arg document_renderer: View of the document as an extended document renderer.
+    :arg abstract_renderer: View of the document as an extended abstract renderer.
+    :arg sink: The text stream to write to.
+    """
+    # Check
+    _check_document(document_renderer, abstract_renderer)
+
+    _generate(abstract_renderer)
+    lines = LineWriter(sink)
+    abstract_renderer.append_lines(lines, start_level=document_renderer.start_level)
+    lines.flush(keep_last=False)
+    if not lines.written:
+        sink.write("\n")
+
+
 __all__ = (
     "BaseContent",
+    "LineWriter",
+    "flush_lines",
     "DocumentRendererEx",
     "TextRenderer",
     "AbstractRendererEx",
+    "SectionRendererEx",
     "render_section",
     "render_document",
+    "render_document_to",
 )
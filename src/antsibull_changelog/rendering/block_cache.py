@@ -0,0 +1,141 @@
+# Author: Felix Fontein <felix@fontein.de>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or
+# https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-FileCopyrightText: 2026, Ansible Project
+
+"""
+On-disk cache for rendered sections of a changelog.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from functools import cache
+from typing import Any
+
+from .. import __version__ as _version
+from ..config import PathsConfig
+from ..json_cache import DEFAULT_MAX_ENTRIES, JSONLRUCache, get_package_versions
+
+BLOCK_CACHE_FILENAME = ".render-cache.json"
+
+BLOCK_CACHE_VERSION = 1
+
+
+def get_block_cache_path(paths: PathsConfig) -> str:
+    """
+    Return the path of the rendered block cache.
+    """
+    return os.path.join(paths.changelog_dir, BLOCK_CACHE_FILENAME)
+
+
+# Packages whose versions influence the rendered blocks
+_RENDER_DEPENDENCIES = ("antsibull-docs-parser", "antsibull-docutils", "docutils")
+
+
+@cache
+def _get_render_dependencies() -> dict[str, str | None]:
+    return get_package_versions(_RENDER_DEPENDENCIES)
+
+
+def get_block_key(data: Any) -> str:
+    """
+    Compute the key of a block from JSON-serializable data that describes everything
+    that influences the rendered block. The key also depends on the versions of
+    antsibull-changelog and of the packages used for rendering.
+    """
+    data = [_version, _get_render_dependencies(), data]
+    return hashlib.sha256(json.dumps(data, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class BlockCache(JSONLRUCache):
+    """
+    Stores the rendered lines of changelog sections, usually of single releases.
+
+    Blocks are keyed by a hash of the section's content and of the document
+    settings that influence its rendering, see ``get_block_key()``.
+    """
+
+    CACHE_VERSION = BLOCK_CACHE_VERSION
+    ENTRIES_KEY = "blocks"
+    NAME = "render cache"
+
+    def __init__(self, path: str | None = None, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Create an empty block cache.
+
+        :arg path: Path of the cache file. If not provided, the cache is only kept
+                   in memory.
+        :arg max_entries: Maximal number of entries to keep when saving the cache.
+        """
+        super().__init__(path, max_entries=max_entries)
+
+    @staticmethod
+    def load(path: str, max_entries: int = DEFAULT_MAX_ENTRIES) -> BlockCache:
+        """
+        Load the block cache from disk. Missing or invalid caches result in an empty cache.
+        """
+        cache = BlockCache(path, max_entries=max_entries)
+        cache._load()  # pylint: disable=protected-access
+        return cache
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """
+        Look up a block.
+
+        :return: The block's data stored with ``put()``, or ``None`` if the block is
+                 not cached.
+        """
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        self._touch(entry)
+        return entry["block"]
+
+    def put(self, key: str, block: dict[str, Any]) -> None:
+        """
+        Store a block. ``block`` must be JSON-serializable.
+        """
+        self.entries[key] = {
+            "generation": self.generation,
+            "block": block,
+        }
+        self._dirty = True
+
+    def fork(self) -> BlockCache:
+        """
+        Create an in-memory copy of the cache, for example to be used in another process.
+
+        Use ``get_recent_entries()`` on the copy and ``merge()`` to transfer blocks
+        that have been used or added back to this cache.
+        """
+        cache = BlockCache(max_entries=self.max_entries)
+        cache.generation = self.generation
+        cache.entries = dict(self.entries)
+        return cache
+
+    def get_recent_entries(self) -> dict[str, dict[str, Any]]:
+        """
+        Return all entries that have been used or added in the current generation.
+        """
+        return {
+            key: entry
+            for key, entry in self.entries.items()
+            if entry["generation"] == self.generation
+        }
+
+    def merge(self, entries: dict[str, dict[str, Any]]) -> None:
+        """
+        Merge entries returned by ``get_recent_entries()`` of a forked cache.
+        """
+        for key, entry in entries.items():
+            existing = self.entries.get(key)
+            if existing is None or existing["generation"] != entry["generation"]:
+                self.entries[key] = entry
+                self._dirty = True
+
+
+__all__ = ("BlockCache", "get_block_cache_path", "get_block_key")
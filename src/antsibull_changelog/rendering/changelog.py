@@ -11,9 +11,11 @@ Rendering a changelog.
 from __future__ import annotations
 
 import collections
+import contextlib
 import os
-from collections.abc import Mapping
-from typing import Any
+from collections.abc import Iterable, Mapping
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, TextIO, cast
 
 from ..changelog_generator import (
     ChangelogEntry,
@@ -29,6 +31,8 @@ from ..config import (
     TextFormat,
 )
 from ..logger import LOGGER
+from ..output_file import OutputFile
+from .block_cache import BlockCache
 from .document import AbstractRenderer, DocumentRenderer, SectionRenderer
 from .md_document import MDDocumentRenderer
 from .rst_document import RSTDocumentRenderer
@@ -61,16 +65,22 @@ class ChangelogGenerator(ChangelogGeneratorBase):
     a combined ACD changelog.
     """
 
-    def __init__(  # pylint: disable=useless-parent-delegation
+    block_cache: BlockCache | None
+
+    def __init__(
         self,
         config: ChangelogConfig,
         changes: ChangesData,
         *,
         flatmap: bool = True,
         render_config: ChangelogRenderConfig | None = None,
+        block_cache: BlockCache | None = None,
     ):
         """
         Create a changelog generator.
+
+        :kwarg block_cache: If provided, the rendered sections of releases are stored
+                            in and reused from this cache
         """
         super().__init__(
             config,
@@ -78,6 +88,7 @@ class ChangelogGenerator(ChangelogGeneratorBase):
             flatmap=flatmap,
             render_config=render_config,
         )
+        self.block_cache = block_cache
 
     def append_changelog_entry(
         self,
@@ -91,6 +102,8 @@ class ChangelogGenerator(ChangelogGeneratorBase):
         section_renderer: SectionRenderer | None = None
         if add_version:
             section_renderer = renderer.add_section("v%s" % changelog_entry.version)
+            if self.block_cache is not None:
+                section_renderer.use_block_cache(self.block_cache)
             renderer = section_renderer
 
         if self.render_config.per_release_toc:
@@ -131,6 +144,7 @@ class ChangelogGenerator(ChangelogGeneratorBase):
         after_version: str | None = None,
         until_version: str | None = None,
         only_latest: bool = False,
+        release_entries: Iterable[ChangelogEntry] | None = None,
     ) -> None:
         """
         Append changelog to a renderer.
@@ -139,10 +153,17 @@ class ChangelogGenerator(ChangelogGeneratorBase):
         :arg after_version: If given, only consider versions after this one
         :arg until_version: If given, do not consider versions following this one
         :arg only_latest: If set to ``True``, only generate the latest entry
+        :arg release_entries: If given, these entries are used instead of collecting
+                              them with the other arguments
         """
-        release_entries = self.collect(
-            squash=squash, after_version=after_version, until_version=until_version
-        )
+        if release_entries is None:
+            # Collect the entries one by one while adding them to the renderer
+            release_entries = self.iter_entries(
+                squash=squash,
+                after_version=after_version,
+                until_version=until_version,
+                only_latest=only_latest,
+            )
 
         for release in release_entries:
             self.append_changelog_entry(
@@ -153,9 +174,17 @@ class ChangelogGenerator(ChangelogGeneratorBase):
             if only_latest:
                 break
 
-    def generate(self, renderer: DocumentRenderer, only_latest: bool = False) -> None:
+    def generate(
+        self,
+        renderer: DocumentRenderer,
+        only_latest: bool = False,
+        release_entries: Iterable[ChangelogEntry] | None = None,
+    ) -> None:
         """
         Generate the changelog.
+
+        :arg release_entries: If given, these entries are used instead of collecting
+                              them. This allows to share them between several outputs.
         """
         if not only_latest:
             renderer.set_title(self.get_title())
@@ -172,7 +201,9 @@ class ChangelogGenerator(ChangelogGeneratorBase):
                     text_format=TextFormat.RESTRUCTURED_TEXT,
                 )
 
-        self.generate_to(renderer, only_latest=only_latest)
+        self.generate_to(
+            renderer, only_latest=only_latest, release_entries=release_entries
+        )
 
     def _add_section(
         self,
@@ -397,20 +428,22 @@ def _create_changelog_path(
     return os.path.join(paths.base_dir, changelog_filename)
 
 
-def generate_changelog(  # pylint: disable=too-many-arguments
+def _render_changelog(  # pylint: disable=too-many-arguments
     paths: PathsConfig,
     config: ChangelogConfig,
     changes: ChangesData,
     output: ChangelogOutput,
+    release_entries: list[ChangelogEntry] | None,
     *,
-    flatmap: bool = True,
-    only_latest: bool = False,
-):
+    flatmap: bool,
+    only_latest: bool,
+    block_cache: BlockCache | None,
+) -> tuple[list[str], bool]:
     """
-    Generate the changelog as reStructuredText.
+    Render one changelog output and write it.
 
-    :kwarg flatmap: Whether the collection uses flatmapping or not
-    :kwarg only_latest: Only write the last changelog entry without any preamble
+    :return: A tuple of the warnings produced while rendering, and whether the
+             changelog file was written
     """
     changelog_path = _create_changelog_path(paths, changes, output)
 
@@ -419,18 +452,204 @@ def generate_changelog(  # pylint: disable=too-many-arguments
         changes,
         flatmap=flatmap,
         render_config=output,
+        block_cache=block_cache,
     )
     renderer = create_document_renderer(
         output.format, start_level=1 if only_latest else 0
     )
-    generator.generate(renderer, only_latest=only_latest)
+    generator.generate(
+        renderer, only_latest=only_latest, release_entries=release_entries
+    )
 
-    text = renderer.render()
-    for warning in renderer.get_warnings():
-        LOGGER.warning(warning)
+    # Write the changelog while rendering it, instead of keeping all of it in memory
+    output_file = OutputFile(changelog_path, compare=config.compare_before_write)
+    with output_file as changelog_fd:
+        renderer.render_to(cast(TextIO, changelog_fd))
+    return renderer.get_warnings(), output_file.changed
+
+
+def _render_changelog_worker(  # pylint: disable=too-many-arguments
+    paths: PathsConfig,
+    config: ChangelogConfig,
+    changes: ChangesData,
+    output: ChangelogOutput,
+    release_entries: list[ChangelogEntry] | None,
+    flatmap: bool,
+    only_latest: bool,
+    block_cache: BlockCache | None,
+) -> tuple[list[str], bool, dict[str, dict[str, Any]] | None]:
+    """
+    Render one changelog output in a worker process.
+
+    :return: A tuple of the warnings, whether the changelog file was written, and the
+             used or added entries of the block cache
+    """
+    warnings, changed = _render_changelog(
+        paths,
+        config,
+        changes,
+        output,
+        release_entries,
+        flatmap=flatmap,
+        only_latest=only_latest,
+        block_cache=block_cache,
+    )
+    recent_blocks = block_cache.get_recent_entries() if block_cache else None
+    return warnings, changed, recent_blocks
+
+
+def _get_worker_outputs(outputs: list[ChangelogOutput], jobs: int) -> list[int]:
+    """
+    Determine the indices of the outputs that should be rendered in worker processes.
+
+    Rendering MarkDown converts every fragment with docutils, which is a lot slower
+    than rendering reStructuredText. The main process renders all other outputs, and
+    at least one output itself.
+    """
+    if jobs <= 1 or len(outputs) <= 1:
+        return []
+    indices = [
+        index
+        for index, output in enumerate(outputs)
+        if output.format == TextFormat.MARKDOWN
+    ]
+    if len(indices) == len(outputs):
+        indices.pop(0)
+    return indices
+
+
+def generate_changelogs(  # pylint: disable=too-many-arguments,too-many-locals
+    paths: PathsConfig,
+    config: ChangelogConfig,
+    changes: ChangesData,
+    outputs: list[ChangelogOutput],
+    *,
+    flatmap: bool = True,
+    only_latest: bool = False,
+    block_cache: BlockCache | None = None,
+    jobs: int = 1,
+) -> list[str]:
+    """
+    Generate several changelog outputs.
+
+    If there is more than one output, the releases are collected only once and shared
+    between all outputs. Otherwise, they are collected one by one while rendering.
+
+    :kwarg flatmap: Whether the collection uses flatmapping or not
+    :kwarg only_latest: Only write the last changelog entry without any preamble
+    :kwarg block_cache: If provided, rendered releases are reused from this cache
+    :kwarg jobs: If larger than one, MarkDown outputs are rendered by up to this
+                 number of worker processes while the other outputs are rendered
+    :return: The paths of the changelogs that were written. If ``compare_before_write``
+             is enabled, changelogs whose content did not change are not included.
+    """
+    release_entries: list[ChangelogEntry] | None = None
+    if len(outputs) > 1:
+        release_entries = ChangelogGenerator(config, changes, flatmap=flatmap).collect(
+            only_latest=only_latest
+        )
+    worker_indices = _get_worker_outputs(outputs, jobs)
+    results: dict[int, tuple[list[str], bool]] = {}
+    futures: dict[int, Future] = {}
+    with contextlib.ExitStack() as stack:
+        if worker_indices:
+            LOGGER.debug(
+                "Rendering {} changelogs with {} workers",
+                len(worker_indices),
+                min(jobs, len(worker_indices)),
+            )
+            pool = stack.enter_context(
+                ProcessPoolExecutor(max_workers=min(jobs, len(worker_indices)))
+            )
+            for index in worker_indices:
+                futures[index] = pool.submit(
+                    _render_changelog_worker,
+                    paths,
+                    config,
+                    changes,
+                    outputs[index],
+                    release_entries,
+                    flatmap,
+                    only_latest,
+                    block_cache.fork() if block_cache is not None else None,
+                )
+        for index, output in enumerate(outputs):
+            if index not in futures:
+                results[index] = _render_changelog(
+                    paths,
+                    config,
+                    changes,
+                    output,
+                    release_entries,
+                    flatmap=flatmap,
+                    only_latest=only_latest,
+                    block_cache=block_cache,
+                )
+        for index, future in futures.items():
+            warnings, changed, recent_blocks = future.result()
+            results[index] = warnings, changed
+            if block_cache is not None and recent_blocks is not None:
+                block_cache.merge(recent_blocks)
+
+    return _report_results(paths, changes, outputs, results)
+
+
+def _report_results(
+    paths: PathsConfig,
+    changes: ChangesData,
+    outputs: list[ChangelogOutput],
+    results: dict[int, tuple[list[str], bool]],
+) -> list[str]:
+    """
+    Log the warnings of rendered changelogs and whether they changed.
+
+    :return: The paths of the changelogs that were written
+    """
+    changed_paths = []
+    for index, output in enumerate(outputs):
+        warnings, changed = results[index]
+        for warning in warnings:
+            LOGGER.warning(warning)
+        changelog_path = _create_changelog_path(paths, changes, output)
+        if changed:
+            changed_paths.append(changelog_path)
+        else:
+            LOGGER.info("{} is unchanged", changelog_path)
+    return changed_paths
 
-    with open(changelog_path, "w", encoding="utf-8") as changelog_fd:
-        changelog_fd.write(text)
+
+def generate_changelog(  # pylint: disable=too-many-arguments
+    paths: PathsConfig,
+    config: ChangelogConfig,
+    changes: ChangesData,
+    output: ChangelogOutput,
+    *,
+    flatmap: bool = True,
+    only_latest: bool = False,
+    block_cache: BlockCache | None = None,
+) -> bool:
+    """
+    Generate the changelog as reStructuredText.
+
+    :kwarg flatmap: Whether the collection uses flatmapping or not
+    :kwarg only_latest: Only write the last changelog entry without any preamble
+    :kwarg block_cache: If provided, rendered releases are reused from this cache
+    :return: Whether the changelog was written. This is only ``False`` if
+             ``compare_before_write`` is enabled and the changelog did not change.
+    """
+    warnings, changed = _render_changelog(
+        paths,
+        config,
+        changes,
+        output,
+        None,
+        flatmap=flatmap,
+        only_latest=only_latest,
+        block_cache=block_cache,
+    )
+    for warning in warnings:
+        LOGGER.warning(warning)
+    return changed
 
 
 __all__ = (
@@ -438,4 +657,5 @@ __all__ = (
     "ChangelogGenerator",
     "create_document_renderer",
     "generate_changelog",
+    "generate_changelogs",
 )
@@ -11,8 +11,10 @@ Abstract functionality for rendering a document.
 from __future__ import annotations
 
 import abc
+from typing import TextIO
 
 from ..config import TextFormat
+from .block_cache import BlockCache
 
 
 class AbstractRenderer(abc.ABC):
@@ -56,6 +58,13 @@ class SectionRenderer(AbstractRenderer):
     Renders a section.
     """
 
+    def use_block_cache(self, block_cache: BlockCache) -> None:
+        # pylint: disable=unused-argument
+        """
+        Allow to reuse the rendered lines of this section from a block cache, and to
+        store them in it. Renderers that do not support this ignore it.
+        """
+
     def close(self) -> None:
         """
         Closes the section.
@@ -92,6 +101,15 @@ class DocumentRenderer(AbstractRenderer):
         All sections must be closed before calling this.
         """
 
+    def render_to(self, sink: TextIO) -> None:
+        """
+        Render the document to a text stream. The result is identical to the one of
+        ``render()``, but renderers can write parts of the document while rendering.
+
+        All sections must be closed before calling this.
+        """
+        sink.write(self.render())
+
     @abc.abstractmethod
     def get_warnings(self) -> list[str]:
         """
@@ -12,8 +12,9 @@ from __future__ import annotations
 
 import re
 import unicodedata
+from collections.abc import Iterable
 from dataclasses import dataclass
-from typing import cast
+from typing import Any, TextIO, cast
 
 from antsibull_docutils.html_utils import html_escape
 from antsibull_docutils.markdown import GlobalContext, render_as_markdown
@@ -25,7 +26,11 @@ from ._document import (
     AbstractRendererEx,
     BaseContent,
     DocumentRendererEx,
+    SectionRendererEx,
+    TextRenderer,
+    flush_lines,
     render_document,
+    render_document_to,
     render_section,
 )
 from .document import SectionRenderer
@@ -34,6 +39,22 @@ from .utils import get_parser_name
 _SPACE_LIKE = re.compile("[ ._-]")
 _DISALLOWED_LETTER = re.compile("[^a-zA-Z0-9-]")
 
+# Maximal number of texts converted in one docutils run
+_BATCH_SIZE = 100
+
+# Paragraph separating texts that are converted together
+_BATCH_SEPARATOR = "antsibullchangelogbatchseparator"
+
+# Texts whose conversion can depend on other texts converted in the same run:
+# explicit markup (targets, substitution definitions, directives, comments),
+# anonymous targets, references to named targets (references with embedded URIs
+# are fine), field lists at the start (docinfo), and transitions or section
+# adornments
+_BATCH_UNSAFE = re.compile(
+    r"^\s*\.\.|^\s*__ |(?<!>)`_|(?<!`)\w_(?!\w)|\A\s*:|^\s*([^\w\s])\1{3,}\s*$",
+    re.MULTILINE,
+)
+
 
 @dataclass
 class TOCEntry:
@@ -81,6 +102,10 @@ class MDTOCRenderer(BaseContent):
                 result.append(TOCEntry(c, children))
         return result
 
+    def get_fingerprint(self) -> Any:
+        # The TOC's entries are part of the fingerprint of the owner's content
+        return ["toc", self.title, self.max_depth]
+
     def generate(self) -> None:
         self.toc = self._collect_toc_entries(
             self.owner.content, max_depth=self.max_depth
@@ -128,7 +153,7 @@ class MDAbstractRenderer(AbstractRendererEx):
         self.content.append(MDTOCRenderer(self, title, max_depth))
 
 
-class MDSectionRenderer(MDAbstractRenderer, SectionRenderer):
+class MDSectionRenderer(MDAbstractRenderer, SectionRendererEx):
     """
     Render a section as MarkDown.
     """
@@ -151,19 +176,79 @@ class MDSectionRenderer(MDAbstractRenderer, SectionRenderer):
         self._check_content_closed()
         self.closed = True
 
-    def append_lines(self, lines: list[str], start_level: int = 0) -> None:
-        ensure_newline_after_last_content(lines)
+    def get_fingerprint(self) -> Any:
+        content = self._get_content_fingerprint()
+        if content is None:
+            return None
+        return ["section", self._level, self.title, content]
+
+    def get_block_ids(self) -> list[str]:
+        result = [self.ref_id]
+        for content in self.content:
+            if isinstance(content, MDSectionRenderer):
+                result.extend(content.get_block_ids())
+        return result
+
+    def _append_section_lines(self, lines: list[str], start_level: int) -> None:
         heading = "#" * (1 + self._level - start_level)
         lines.append(f'<a id="{html_escape(self.ref_id)}"></a>')
         lines.append(f"{heading} {md_escape(self.title)}")
         lines.append("")
         for content in self.content:
             content.append_lines(lines, start_level=start_level)
+            flush_lines(lines)
 
     def render(self) -> str:
         return render_section(self)
 
 
+def _render_batch(texts: list[str], text_format: TextFormat) -> list[str] | None:
+    """
+    Convert several texts to MarkDown with one docutils run.
+
+    :return: The converted texts, or ``None`` if the result could differ from
+             converting every text on its own.
+    """
+    separator = f"\n\n{_BATCH_SEPARATOR}\n\n"
+    global_context = GlobalContext()
+    result = render_as_markdown(
+        "".join(f"{separator}{text}" for text in texts),
+        parser_name=get_parser_name(text_format),
+        global_context=global_context,
+    )
+    if (
+        result.warnings
+        or result.unsupported_class_names
+        or global_context.labels
+        or global_context.fragments
+    ):
+        return None
+    parts = result.output.split(_BATCH_SEPARATOR)
+    if len(parts) != len(texts) + 1 or parts[0].strip("\n"):
+        return None
+    return [part.strip("\n") for part in parts[1:]]
+
+
+def _render_batches(
+    texts: list[str], text_format: TextFormat, results: dict[str, str]
+) -> None:
+    """
+    Convert texts to MarkDown in batches and store the results. If a batch cannot
+    be converted, it is split up until the texts that prevent it are found. These
+    texts are not stored.
+    """
+    if len(texts) <= 1:
+        # Converting single texts here does not save anything
+        return
+    outputs = _render_batch(texts, text_format)
+    if outputs is not None:
+        results.update(zip(texts, outputs))
+        return
+    middle = len(texts) // 2
+    _render_batches(texts[:middle], text_format, results)
+    _render_batches(texts[middle:], text_format, results)
+
+
 def _get_slug(text: str) -> str:
     text = unicodedata.normalize("NFD", text)
     text = _SPACE_LIKE.sub("-", text)
@@ -179,6 +264,8 @@ class MDDocumentRenderer(MDAbstractRenderer, DocumentRendererEx):
     global_context: GlobalContext
     unsupported_class_names: set[str]
     warnings: list[str]
+    _block_class_names: list[set[str]]
+    _prepared_texts: dict[str, str]
 
     def __init__(self, start_level: int = 0):
         super().__init__(root=self)
@@ -186,6 +273,8 @@ class MDDocumentRenderer(MDAbstractRenderer, DocumentRendererEx):
         self.global_context = GlobalContext()
         self.unsupported_class_names = set()
         self.warnings = []
+        self._block_class_names = []
+        self._prepared_texts = {}
 
     def _get_level(self) -> int:
         return self.start_level
@@ -196,15 +285,98 @@ class MDDocumentRenderer(MDAbstractRenderer, DocumentRendererEx):
         """
         if text_format == TextFormat.MARKDOWN:
             return text
+        if text_format == TextFormat.RESTRUCTURED_TEXT:
+            prepared = self._prepared_texts.get(text)
+            if prepared is not None:
+                return prepared
         result = render_as_markdown(
             text,
             parser_name=get_parser_name(text_format),
             global_context=self.global_context,
         )
-        self.unsupported_class_names.update(result.unsupported_class_names)
+        self._add_unsupported_class_names(result.unsupported_class_names)
         self.warnings.extend(result.warnings)
         return result.output
 
+    def prepare_texts(self, texts: Iterable[TextRenderer]) -> None:
+        """
+        Convert reStructuredText texts to MarkDown in batches, instead of running
+        docutils for every single one of them.
+
+        Texts whose conversion produces warnings, uses unsupported features, or
+        depends on or changes the document's state are left for ``render_text()``.
+        """
+        pending = {
+            text.text: None
+            for text in texts
+            if text.text_format == TextFormat.RESTRUCTURED_TEXT
+            and text.text not in self._prepared_texts
+            and _BATCH_SEPARATOR not in text.text
+            and not _BATCH_UNSAFE.search(text.text)
+        }
+        batch = list(pending)
+        for index in range(0, len(batch), _BATCH_SIZE):
+            _render_batches(
+                batch[index : index + _BATCH_SIZE],
+                TextFormat.RESTRUCTURED_TEXT,
+                self._prepared_texts,
+            )
+
+    def _add_unsupported_class_names(self, class_names: Iterable[str]) -> None:
+        self.unsupported_class_names.update(class_names)
+        for block_class_names in self._block_class_names:
+            block_class_names.update(class_names)
+
+    def get_block_context(self) -> Any:
+        # Rendering texts can depend on the labels registered so far
+        return sorted(self.global_context.labels.items())
+
+    def begin_block(self) -> Any:
+        self._block_class_names.append(set())
+        return (
+            len(self.warnings),
+            len(self.global_context.fragments),
+            len(self.global_context.labels),
+        )
+
+    def end_block(self, state: Any) -> Any:
+        class_names = self._block_class_names.pop()
+        warnings_count, fragments_count, labels_count = state
+        if (
+            len(self.global_context.fragments) != fragments_count
+            or len(self.global_context.labels) != labels_count
+        ):
+            # Texts registered labels or fragments, so the result depends on the
+            # document's state
+            return None
+        return {
+            "warnings": self.warnings[warnings_count:],
+            "unsupported_class_names": sorted(class_names),
+        }
+
+    def replay_block(self, block_state: Any) -> None:
+        self._add_unsupported_class_names(block_state["unsupported_class_names"])
+        self.warnings.extend(block_state["warnings"])
+
+    def replace_block_ids(
+        self, lines: list[str], old_ids: list[str], new_ids: list[str]
+    ) -> list[str]:
+        if old_ids == new_ids:
+            return lines
+        mapping = {
+            html_escape(old_id): html_escape(new_id)
+            for old_id, new_id in zip(old_ids, new_ids)
+        }
+        pattern = re.compile(
+            '(id="|href="#)('
+            + "|".join(re.escape(old_id) for old_id in sorted(mapping, reverse=True))
+            + ')"'
+        )
+        return [
+            pattern.sub(lambda m: f'{m.group(1)}{mapping[m.group(2)]}"', line)
+            for line in lines
+        ]
+
     def get_ref_id(self, title: str) -> str:
         """
         Create a reference ID for a section title.
@@ -216,11 +388,19 @@ class MDDocumentRenderer(MDAbstractRenderer, DocumentRendererEx):
             lines.append(f"# {md_escape(self.title or '')}")
             lines.append("")
         for content in self.content:
+            if not isinstance(content, SectionRendererEx):
+                # Sections prepare their texts themselves, unless they are cached
+                self.prepare_texts(content.iter_texts())
             content.append_lines(lines, start_level=start_level)
+            self._prepared_texts.clear()
+            flush_lines(lines)
 
     def render(self) -> str:
         return render_document(self, self)
 
+    def render_to(self, sink: TextIO) -> None:
+        render_document_to(self, self, sink)
+
     def get_warnings(self) -> list[str]:
         result = []
         if self.unsupported_class_names:
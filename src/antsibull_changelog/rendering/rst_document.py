@@ -10,6 +10,8 @@ Functionality for rendering a ReStructuredText document.
 
 from __future__ import annotations
 
+from typing import Any, TextIO
+
 from antsibull_docutils.rst_utils import column_width, rst_escape
 from antsibull_docutils.utils import ensure_newline_after_last_content
 
@@ -18,7 +20,10 @@ from ._document import (
     AbstractRendererEx,
     BaseContent,
     DocumentRendererEx,
+    SectionRendererEx,
+    flush_lines,
     render_document,
+    render_document_to,
     render_section,
 )
 from .document import SectionRenderer
@@ -41,6 +46,9 @@ class RSTTOCRenderer(BaseContent):
         self.max_depth = max_depth
         self.level = level
 
+    def get_fingerprint(self) -> Any:
+        return ["toc", self.title, self.max_depth, self.level]
+
     def append_lines(self, lines: list[str], start_level: int = 0) -> None:
         ensure_newline_after_last_content(lines)
         if self.title:
@@ -77,7 +85,7 @@ class RSTAbstractRenderer(AbstractRendererEx):
         self.content.append(RSTTOCRenderer(title, max_depth, self._get_level()))
 
 
-class RSTSectionRenderer(RSTAbstractRenderer, SectionRenderer):
+class RSTSectionRenderer(RSTAbstractRenderer, SectionRendererEx):
     """
     Render a section as RST.
     """
@@ -100,14 +108,20 @@ class RSTSectionRenderer(RSTAbstractRenderer, SectionRenderer):
         self._check_content_closed()
         self.closed = True
 
-    def append_lines(self, lines: list[str], start_level: int = 0) -> None:
-        ensure_newline_after_last_content(lines)
+    def get_fingerprint(self) -> Any:
+        content = self._get_content_fingerprint()
+        if content is None:
+            return None
+        return ["section", self._level, self.title, content]
+
+    def _append_section_lines(self, lines: list[str], start_level: int) -> None:
         level = max(0, self._level - 1)
         lines.append(self.title)
         lines.append(self.root.section_underlines[level] * column_width(self.title))
         lines.append("")
         for content in self.content:
             content.append_lines(lines, start_level=start_level)
+            flush_lines(lines)
 
     def render(self) -> str:
         return render_section(self)
@@ -175,10 +189,17 @@ class RSTDocumentRenderer(RSTAbstractRenderer, DocumentRendererEx):
             lines.append("")
         for content in self.content:
             content.append_lines(lines, start_level=start_level)
+            flush_lines(lines)
 
     def render(self) -> str:
         return render_document(self, self)
 
+    def render_to(self, sink: TextIO) -> None:
+        render_document_to(self, self, sink)
+
+    def get_block_context(self) -> Any:
+        return {"section_underlines": self.section_underlines}
+
     def get_warnings(self) -> list[str]:
         return []
 
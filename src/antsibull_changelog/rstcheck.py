@@ -10,9 +10,111 @@ Handle rstcheck.
 
 from __future__ import annotations
 
+import bisect
 import os.path
 import pathlib
+import re
 import tempfile
+from collections.abc import Sequence
+from functools import cache
+
+# Snippets are joined with blank lines, so that every snippet forms its own
+# paragraph(s) in the combined document.
+_BATCH_SEPARATOR = "\n\n"
+
+_INLINE_LITERAL = re.compile(r"``\S(?:.*?\S)?``", re.DOTALL)
+
+# Constructs whose meaning or whose warnings can depend on the surrounding document:
+# references and targets, substitutions, explicit markup, literal blocks, and
+# anything that is not a plain paragraph line (indentation, lists, section
+# adornments, tables, field and option lists, ...). Also line break characters
+# other than ``\n``, and BOMs, which rstcheck treats specially at the start of a file.
+_UNBATCHABLE = re.compile(
+    r"_\b|__|\||::|[\r\f\v\x1c-\x1e\x85\u2028\u2029\ufeff]"
+    r"|^(?:[ \t]|[^\w`(\"'*\n]|\*\s|\*+$)"
+    r"|^\(?(?:\d+|[a-zA-Z]|[ivxlcdmIVXLCDM]+|#)[.)](?:\s|$)",
+    re.MULTILINE,
+)
+
+
+def _check_rst_content_tempfile(
+    content: str, filename: str | None
+) -> list[tuple[int, int, str]]:
+    """
+    Check the content with rstcheck-core by writing it to a temporary file.
+    """
+    # We import from rstcheck_core locally since importing it is rather slow
+    import rstcheck_core.checker  # pylint: disable=import-outside-toplevel
+    import rstcheck_core.config  # pylint: disable=import-outside-toplevel
+
+    filename = os.path.basename(filename or "file.rst") or "file.rst"
+    with tempfile.TemporaryDirectory() as tempdir:
+        rst_path = os.path.join(tempdir, filename)
+        with open(rst_path, "w", encoding="utf-8") as f:
+            f.write(content)
+        config = rstcheck_core.config.RstcheckConfig(
+            report_level=rstcheck_core.config.ReportLevel.WARNING,
+        )
+        core_results = rstcheck_core.checker.check_file(pathlib.Path(rst_path), config)
+        return [
+            (result["line_number"], 0, result["message"]) for result in core_results
+        ]
+
+
+@cache
+def _has_rstcheck_core_internals() -> bool:
+    """
+    Determine whether the rstcheck-core internals used by
+    ``_check_rst_content_in_memory()`` are available.
+    """
+    try:
+        # We import from rstcheck_core locally since importing it is rather slow
+        # pylint: disable=import-outside-toplevel
+        import rstcheck_core._docutils  # pylint: disable=protected-access
+        import rstcheck_core._sphinx  # pylint: disable=protected-access
+        import rstcheck_core.checker
+
+        # pylint: enable=import-outside-toplevel
+    except ImportError:
+        return False
+    return (
+        hasattr(rstcheck_core._docutils, "clean_docutils_directives_and_roles_cache")
+        and hasattr(rstcheck_core._sphinx, "load_sphinx_if_available")
+        and hasattr(rstcheck_core.checker, "check_source")
+    )
+
+
+def _check_rst_content_in_memory(
+    content: str, filename: str | None
+) -> list[tuple[int, int, str]]:
+    """
+    Check the content with rstcheck-core without writing it to disk.
+
+    This does the same as ``rstcheck_core.checker.check_file()``, except that it does
+    not look for rstcheck configuration files.
+    """
+    # We import from rstcheck_core locally since importing it is rather slow
+    # pylint: disable=import-outside-toplevel
+    import rstcheck_core._docutils  # pylint: disable=protected-access
+    import rstcheck_core._sphinx  # pylint: disable=protected-access
+    import rstcheck_core.checker
+    import rstcheck_core.config
+
+    # pylint: enable=import-outside-toplevel
+
+    filename = os.path.basename(filename or "file.rst") or "file.rst"
+    # docutils normalizes line breaks when reading a file
+    content = "\n".join(content.splitlines() + [""])
+    rstcheck_core._docutils.clean_docutils_directives_and_roles_cache()
+    with rstcheck_core._sphinx.load_sphinx_if_available():
+        core_results = list(
+            rstcheck_core.checker.check_source(
+                content,
+                source_file=pathlib.Path(filename),
+                report_level=rstcheck_core.config.ReportLevel.WARNING,
+            )
+        )
+    return [(result["line_number"], 0, result["message"]) for result in core_results]
 
 
 def check_rst_content(
@@ -24,26 +126,13 @@ def check_rst_content(
     The entries in the return list are tuples with line number, column number, and
     error/warning message.
     """
+    # The in-memory check relies on rstcheck-core internals; if these are
+    # not available, pass the content to rstcheck-core as a file
+    if _has_rstcheck_core_internals():
+        return _check_rst_content_in_memory(content, filename)
     # rstcheck >= 6.0.0 depends on rstcheck-core
     try:
-        # We import from rstcheck_core locally since importing it is rather slow
-        import rstcheck_core.checker  # pylint: disable=import-outside-toplevel
-        import rstcheck_core.config  # pylint: disable=import-outside-toplevel
-
-        filename = os.path.basename(filename or "file.rst") or "file.rst"
-        with tempfile.TemporaryDirectory() as tempdir:
-            rst_path = os.path.join(tempdir, filename)
-            with open(rst_path, "w", encoding="utf-8") as f:
-                f.write(content)
-            config = rstcheck_core.config.RstcheckConfig(
-                report_level=rstcheck_core.config.ReportLevel.WARNING,
-            )
-            core_results = rstcheck_core.checker.check_file(
-                pathlib.Path(rst_path), config
-            )
-            return [
-                (result["line_number"], 0, result["message"]) for result in core_results
-            ]
+        return _check_rst_content_tempfile(content, filename)
     except ImportError:
         # We import from rstcheck_core locally since importing it is rather slow
         import docutils.utils  # pylint: disable=import-outside-toplevel
@@ -55,3 +144,64 @@ def check_rst_content(
             report_level=docutils.utils.Reporter.WARNING_LEVEL,
         )
         return [(result[0], 0, result[1]) for result in results]
+
+
+def _can_batch(content: str) -> bool:
+    """
+    Determine whether the result of checking ``content`` as part of a larger document
+    is guaranteed to be the same as the result of checking it on its own.
+    """
+    return not _UNBATCHABLE.search(_INLINE_LITERAL.sub("x", content))
+
+
+def _check_rst_batch(
+    contents: Sequence[str], filename: str | None
+) -> list[list[tuple[int, int, str]]] | None:
+    """
+    Check all snippets as one document, and assign the messages to the snippets.
+
+    Returns ``None`` if a message could not be assigned to a snippet.
+    """
+    start_lines = []
+    line = 1
+    for content in contents:
+        start_lines.append(line)
+        line += content.count("\n") + _BATCH_SEPARATOR.count("\n")
+    results: list[list[tuple[int, int, str]]] = [[] for _ in contents]
+    for line, column, message in check_rst_content(
+        _BATCH_SEPARATOR.join(contents), filename=filename
+    ):
+        if not isinstance(line, int) or line < 1:
+            return None
+        index = bisect.bisect_right(start_lines, line) - 1
+        results[index].append((line - start_lines[index] + 1, column, message))
+    return results
+
+
+def check_rst_contents(
+    contents: Sequence[str], filename: str | None = None
+) -> list[list[tuple[int, int, str]]]:
+    """
+    Check several independent snippets with rstcheck. Return a list of errors and
+    warnings for every snippet, in the same format as ``check_rst_content()``.
+
+    Snippets that consist only of plain paragraphs are checked together in a single
+    rstcheck run. All other snippets are checked individually, so the result is
+    always the same as calling ``check_rst_content()`` for every snippet.
+    """
+    results: list[list[tuple[int, int, str]]] = [[] for _ in contents]
+    batch: list[int] = []
+    for index, content in enumerate(contents):
+        if _can_batch(content):
+            batch.append(index)
+        else:
+            results[index] = check_rst_content(content, filename=filename)
+    if len(batch) > 1:
+        batch_results = _check_rst_batch([contents[i] for i in batch], filename)
+        if batch_results is not None:
+            for index, result in zip(batch, batch_results):
+                results[index] = result
+            return results
+    for index in batch:
+        results[index] = check_rst_content(contents[index], filename=filename)
+    return results
@@ -11,7 +11,7 @@ Utility functions.
 
 from __future__ import annotations
 
-import re
+import functools
 from collections.abc import Callable, Collection
 from typing import Any
 
@@ -21,30 +21,39 @@ import semantic_version
 from .config import ChangelogConfig
 from .errors import ChangelogError
 
+# Maximal number of parsed version objects to keep per versioning scheme.
+VERSION_CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=VERSION_CACHE_SIZE)
+def _parse_semantic_version(version: str) -> semantic_version.Version:
+    return semantic_version.Version(version)
+
+
+@functools.lru_cache(maxsize=VERSION_CACHE_SIZE)
+def _parse_packaging_version(version: str) -> packaging.version.Version:
+    return packaging.version.Version(version)
+
 
 def get_version_constructor(config: ChangelogConfig) -> Callable[[str], Any]:
     """
     Returns a version object constructor for the given changelog config.
 
+    The constructor caches the version objects it creates, so the returned
+    objects must not be modified.
+
     :arg config: The changelog configuration
     :return: A callable which converts a string to a version object
     """
     if config.use_semantic_versioning:
-        return semantic_version.Version
-    return packaging.version.Version
+        return _parse_semantic_version
+    return _parse_packaging_version
 
 
-def is_release_version(config: ChangelogConfig, version: str) -> bool:
-    """
-    Determine the type of release from the given version.
-
-    :arg config: The changelog configuration
-    :arg version: The version to check
-    :return: Whether the provided version is a release version
-    """
+def _is_release_version(config: ChangelogConfig, version: str) -> bool:
     if config.use_semantic_versioning:
         try:
-            return not bool(semantic_version.Version(version).prerelease)
+            return not bool(_parse_semantic_version(version).prerelease)
         except Exception as exc:
             raise ChangelogError(
                 "unsupported semantic version format: %s (%s)" % (version, exc)
@@ -52,38 +61,129 @@ def is_release_version(config: ChangelogConfig, version: str) -> bool:
 
     tag_format = "v%s" % version
 
-    if re.search(config.pre_release_tag_re, tag_format):
+    if config.pre_release_tag_pattern.search(tag_format):
         return False
 
-    if re.search(config.release_tag_re, tag_format):
+    if config.release_tag_pattern.search(tag_format):
         return True
 
     raise ChangelogError("unsupported version format: %s" % version)
 
 
-def collect_versions(
+def is_release_version(config: ChangelogConfig, version: str) -> bool:
+    """
+    Determine the type of release from the given version.
+
+    The result is cached in the config for every version.
+
+    :arg config: The changelog configuration
+    :arg version: The version to check
+    :return: Whether the provided version is a release version
+    """
+    # pylint: disable-next=protected-access
+    release_versions = config._release_versions
+    key = (
+        config.use_semantic_versioning,
+        config.release_tag_re,
+        config.pre_release_tag_re,
+        version,
+    )
+    result = release_versions.get(key)
+    if result is None:
+        result = release_versions[key] = _is_release_version(config, version)
+    return result
+
+
+def _collect_latest_versions(
+    versions: Collection[str],
+    config: ChangelogConfig,
+    squash: bool,
+) -> list[tuple[str, list[str]]]:
+    """
+    Determine the group of versions of the latest changelog entry, without sorting
+    all versions.
+
+    The result is identical to the first element of ``collect_versions()``.
+    """
+    version_constructor = get_version_constructor(config)
+    if not versions:
+        return []
+    if squash:
+        squashed = sorted(versions, reverse=True, key=version_constructor)
+        return [(squashed[0], squashed)]
+
+    latest_version = max(versions, key=version_constructor)
+    if not is_release_version(config, latest_version):
+        # A pre-release that is the latest version gets its own entry
+        return [(latest_version, [latest_version])]
+
+    # A release includes all pre-releases following the previous release
+    latest = version_constructor(latest_version)
+    previous_release = None
+    pre_releases = []
+    for version in versions:
+        parsed_version = version_constructor(version)
+        if parsed_version >= latest:
+            continue
+        if is_release_version(config, version):
+            if previous_release is None or parsed_version > previous_release:
+                previous_release = parsed_version
+        else:
+            pre_releases.append(version)
+    pre_releases = [
+        version
+        for version in pre_releases
+        if previous_release is None or version_constructor(version) > previous_release
+    ]
+    pre_releases.sort(reverse=True, key=version_constructor)
+    return [(latest_version, [latest_version] + pre_releases)]
+
+
+def _filter_versions(
+    versions: Collection[str],
+    config: ChangelogConfig,
+    after_version: str | None,
+    until_version: str | None,
+) -> list[str]:
+    version_constructor = get_version_constructor(config)
+    after_version_ = (
+        version_constructor(after_version) if after_version is not None else None
+    )
+    until_version_ = (
+        version_constructor(until_version) if until_version is not None else None
+    )
+    return [
+        version
+        for version in versions
+        if (after_version_ is None or version_constructor(version) > after_version_)
+        and (until_version_ is None or version_constructor(version) <= until_version_)
+    ]
+
+
+def collect_versions(  # pylint: disable=too-many-arguments
     versions: Collection[str],
     config: ChangelogConfig,
     after_version: str | None = None,
     until_version: str | None = None,
     squash: bool = False,
+    only_latest: bool = False,
 ) -> list[tuple[str, list[str]]]:
     """
     Collect all versions of interest and return them as an ordered list,
     latest to earliest. The versions are grouped by versions that should
     result in a changelog entry.
+
+    If ``only_latest`` is ``True``, only the group of the latest entry is returned.
+    This avoids sorting all versions.
     """
+    versions = _filter_versions(versions, config, after_version, until_version)
+    if only_latest:
+        return _collect_latest_versions(versions, config, squash)
+
     version_constructor = get_version_constructor(config)
     result: list[tuple[str, list[str]]] = []
     entry: tuple[str, list[str]] | None = None
     for version in sorted(versions, reverse=True, key=version_constructor):
-        if after_version is not None:
-            if version_constructor(version) <= version_constructor(after_version):
-                continue
-        if until_version is not None:
-            if version_constructor(version) > version_constructor(until_version):
-                continue
-
         version_list: list[str]
         if not squash and is_release_version(config, version):
             # next version is a release, it needs its own entry
@@ -0,0 +1,10 @@
+# Author: Felix Fontein <felix@fontein.de>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-FileCopyrightText: 2026, Ansible Project
+
+import contextlib
+from collections.abc import Iterator
+
+@contextlib.contextmanager
+def load_sphinx_if_available() -> Iterator[None]: ...
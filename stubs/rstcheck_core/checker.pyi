@@ -5,6 +5,7 @@
 
 import enum
 import pathlib
+from collections.abc import Iterator
 
 from . import config, types
 
@@ -13,3 +14,13 @@ def check_file(
     rstcheck_config: config.RstcheckConfig,
     overwrite_with_file_config: bool = True,
 ) -> list[types.LintError]: ...
+
+def check_source(
+    source: str,
+    source_file: pathlib.Path | str | None = None,
+    ignores: dict | None = None,
+    report_level: config.ReportLevel = ...,
+    sphinx_source_dir: pathlib.Path | None = None,
+    *,
+    warn_unknown_settings: bool = False,
+) -> Iterator[types.LintError]: ...
@@ -0,0 +1,84 @@
+# Author: Felix Fontein <felix@fontein.de>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-FileCopyrightText: 2026, Ansible Project
+
+"""
+Benchmark loading the plugin cache stored as YAML and as JSON.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+from collections.abc import Callable
+from typing import Any
+
+from antsibull_changelog.plugins import _load_plugin_cache, _store_plugin_cache
+
+PLUGIN_TYPES = ("module", "lookup", "filter", "callback", "inventory")
+
+
+def create_plugin_cache(count: int) -> dict[str, Any]:
+    """
+    Create plugin cache data with the given number of plugins.
+    """
+    plugins: dict[str, dict[str, Any]] = {
+        plugin_type: {} for plugin_type in PLUGIN_TYPES
+    }
+    sources = {}
+    for index in range(count):
+        plugin_type = PLUGIN_TYPES[index % len(PLUGIN_TYPES)]
+        name = f"plugin_{index}"
+        plugins[plugin_type][name] = {
+            "description": f"Manage the C(foo) resource number {index}",
+            "name": name,
+            "namespace": "" if plugin_type == "module" else None,
+            "version_added": f"{index // 100 + 1}.{index % 10}.0",
+        }
+        sources[f"plugins/{plugin_type}/{name}.py"] = f"{index:064x}"
+    return {
+        "fingerprint": "0" * 64,
+        "objects": {"role": {}},
+        "plugins": plugins,
+        "sources": sources,
+        "version": "1.0.0",
+    }
+
+
+def measure(name: str, func: Callable[[], None]) -> float:
+    start = time.perf_counter()
+    func()
+    duration = time.perf_counter() - start
+    print(f"{name:>12}: {duration:8.3f} s")
+    return duration
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--plugins", type=int, default=5000, help="number of plugins")
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="number of times to repeat"
+    )
+    args = parser.parse_args()
+
+    data = create_plugin_cache(args.plugins)
+    print(f"Loading a cache with {args.plugins} plugins {args.repeat} times")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        results = {}
+        for cache_format in ("yaml", "json"):
+            path = os.path.join(tmp_dir, f"plugin-cache-{cache_format}.yaml")
+            _store_plugin_cache(path, data, cache_format)
+
+            def load(path: str = path) -> None:
+                for _ in range(args.repeat):
+                    assert _load_plugin_cache(path) == data
+
+            results[cache_format] = measure(cache_format, load)
+    print(f"Speedup: {results['yaml'] / results['json']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
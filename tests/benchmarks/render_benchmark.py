@@ -0,0 +1,137 @@
+# Author: Felix Fontein <felix@fontein.de>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-FileCopyrightText: 2026, Ansible Project
+
+"""
+Benchmark the peak memory usage of rendering a changelog to a string and writing
+it, compared to streaming it directly to the output file.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+
+from antsibull_changelog.changes import ChangesData
+from antsibull_changelog.config import (
+    ChangelogConfig,
+    CollectionDetails,
+    PathsConfig,
+    TextFormat,
+)
+from antsibull_changelog.rendering.changelog import (
+    ChangelogGenerator,
+    create_document_renderer,
+)
+from antsibull_changelog.rendering.document import DocumentRenderer
+
+
+def create_changes(config: ChangelogConfig, releases: int, fragments: int):
+    """
+    Create changes with many releases.
+    """
+    changes = ChangesData(config, "/dev/null", {"releases": {}})
+    for index in range(releases):
+        major, minor = divmod(index, 10)
+        changes.releases[f"{major + 1}.{minor}.0"] = {
+            "release_date": "2020-01-01",
+            "changes": {
+                "minor_changes": [
+                    f"module_{fragment} - add ``option_{index}`` option"
+                    f" (https://github.com/ansible-collections/foo.bar/pull/{index})."
+                    for fragment in range(fragments)
+                ],
+                "bugfixes": [
+                    f"module_{fragment} - fix crash when ``state=absent``"
+                    f" (https://github.com/ansible-collections/foo.bar/issues/{index})."
+                    for fragment in range(fragments)
+                ],
+            },
+        }
+    return changes
+
+
+def create_renderer(
+    config: ChangelogConfig, changes: ChangesData, document_format: TextFormat
+) -> DocumentRenderer:
+    generator = ChangelogGenerator(config, changes, flatmap=True)
+    renderer = create_document_renderer(document_format)
+    generator.generate(renderer)
+    return renderer
+
+
+def render_string(renderer: DocumentRenderer, path: str) -> None:
+    text = renderer.render()
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+def render_stream(renderer: DocumentRenderer, path: str) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        renderer.render_to(f)
+
+
+def measure(
+    name: str,
+    func: Callable[[DocumentRenderer, str], None],
+    create: Callable[[], DocumentRenderer],
+    path: str,
+) -> tuple[int, bytes]:
+    renderer = create()
+    tracemalloc.start()
+    start = time.perf_counter()
+    func(renderer, path)
+    duration = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:>12}: {duration:8.3f} s, peak memory {peak / 1024 / 1024:8.2f} MiB")
+    with open(path, "rb") as f:
+        return peak, f.read()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--releases", type=int, default=500, help="number of releases")
+    parser.add_argument(
+        "--fragments",
+        type=int,
+        default=20,
+        help="number of fragments per section and release",
+    )
+    parser.add_argument(
+        "--format", choices=["rst", "md"], default="rst", help="output format"
+    )
+    args = parser.parse_args()
+
+    paths = PathsConfig.force_collection("/")
+    collection_details = CollectionDetails(paths)
+    collection_details.namespace = "foo"
+    collection_details.name = "bar"
+    config = ChangelogConfig.default(paths, collection_details)
+    changes = create_changes(config, args.releases, args.fragments)
+    document_format = (
+        TextFormat.MARKDOWN if args.format == "md" else TextFormat.RESTRUCTURED_TEXT
+    )
+    print(
+        f"Rendering {args.releases} releases with {args.fragments * 2} fragments each"
+    )
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "CHANGELOG")
+
+        def create() -> DocumentRenderer:
+            return create_renderer(config, changes, document_format)
+
+        string_peak, string_result = measure("string", render_string, create, path)
+        stream_peak, stream_result = measure("streaming", render_stream, create, path)
+    assert string_result == stream_result
+    print(f"Peak memory reduction: {string_peak / stream_peak:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+# Author: Felix Fontein <felix@fontein.de>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-FileCopyrightText: 2026, Ansible Project
+
+"""
+Benchmark validating changelog fragment lines with rstcheck.
+
+Compares checking every line through a temporary file, checking every line in memory,
+and checking all lines in batches.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from collections.abc import Callable
+
+from antsibull_changelog.rstcheck import (
+    _check_rst_content_in_memory,
+    _check_rst_content_tempfile,
+    check_rst_contents,
+)
+
+TEMPLATES = [
+    "Fix crash in ``{name}`` when ``{option}`` is not set"
+    " (https://github.com/ansible-collections/community.general/pull/{number}).",
+    "{name} - add ``{option}`` option to configure the {word} {word2}.",
+    "{name} - the *{option}* option is now **deprecated** and will be removed in a"
+    " future release.",
+    "{name} - fix `{option} <https://docs.ansible.com/{option}.html>`_ handling.",
+    "{name} - ``{option}`` now accepts a list.\n\nThe old format is still supported.",
+    "{name} - fix *broken emphasis in {option}.",
+    "- {name}\n- {option}",
+]
+
+WORDS = ["module", "plugin", "inventory", "lookup", "timeout", "retry", "cache"]
+
+
+def create_corpus(count: int, seed: int = 42) -> list[str]:
+    """
+    Create a synthetic corpus of changelog fragment lines.
+    """
+    rng = random.Random(seed)
+    return [
+        rng.choice(TEMPLATES).format(
+            name=f"{rng.choice(WORDS)}_{index}",
+            option=f"{rng.choice(WORDS)}_{rng.choice(WORDS)}",
+            word=rng.choice(WORDS),
+            word2=rng.choice(WORDS),
+            number=rng.randint(1, 10000),
+        )
+        for index in range(count)
+    ]
+
+
+def measure(
+    name: str, check: Callable[[list[str]], list[list[tuple[int, int, str]]]], corpus
+) -> list[list[tuple[int, int, str]]]:
+    start = time.perf_counter()
+    results = check(corpus)
+    duration = time.perf_counter() - start
+    print(
+        f"{name:>12}: {duration:8.2f} s ({len(corpus) / duration:8.1f} lines/s),"
+        f" {sum(len(result) for result in results)} messages"
+    )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, default=10000, help="size of the corpus")
+    parser.add_argument(
+        "--batch-size", type=int, default=1000, help="lines per batched rstcheck call"
+    )
+    args = parser.parse_args()
+
+    corpus = create_corpus(args.lines)
+    print(f"Checking {len(corpus)} synthetic changelog fragment lines")
+
+    tempfile_results = measure(
+        "tempfile",
+        lambda lines: [_check_rst_content_tempfile(line, "x.yml") for line in lines],
+        corpus,
+    )
+    in_memory_results = measure(
+        "in-memory",
+        lambda lines: [_check_rst_content_in_memory(line, "x.yml") for line in lines],
+        corpus,
+    )
+    batched_results = measure(
+        "batched",
+        lambda lines: [
+            result
+            for offset in range(0, len(lines), args.batch_size)
+            for result in check_rst_contents(lines[offset : offset + args.batch_size])
+        ],
+        corpus,
+    )
+    if not tempfile_results == in_memory_results == batched_results:
+        raise SystemExit("ERROR: results differ!")
+
+
+if __name__ == "__main__":
+    main()
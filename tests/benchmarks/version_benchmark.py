@@ -0,0 +1,93 @@
+# Author: Felix Fontein <felix@fontein.de>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-FileCopyrightText: 2026, Ansible Project
+
+"""
+Benchmark parsing versions with and without the version object cache.
+
+Runs the version-heavy operations of a release on a changelog with many releases.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Callable
+from unittest import mock
+
+import packaging.version
+import semantic_version
+
+from antsibull_changelog.changes import ChangesData
+from antsibull_changelog.config import ChangelogConfig, CollectionDetails, PathsConfig
+from antsibull_changelog.utils import collect_versions
+
+
+def create_versions(count: int) -> list[str]:
+    """
+    Create a list of release and pre-release versions.
+    """
+    versions = []
+    for index in range(count):
+        major, minor = divmod(index, 10)
+        versions.append(f"{major + 1}.{minor}.0")
+        if index % 5 == 0:
+            versions.append(f"{major + 1}.{minor}.1-rc.1")
+    return versions
+
+
+def run(config: ChangelogConfig, versions: list[str], repeat: int) -> None:
+    """
+    Run the operations that parse versions.
+    """
+    changes = ChangesData(config, "/dev/null", {"releases": {}})
+    for version in versions:
+        changes.releases[version] = {"changes": {}}
+    middle = sorted(versions, key=changes.version_constructor)[len(versions) // 2]
+    for _ in range(repeat):
+        assert changes.latest_version
+        collect_versions(versions, config, after_version=middle)
+        collect_versions(versions, config, until_version=middle, squash=True)
+        changes.prune_versions(versions_after=None, versions_until=None)
+
+
+def measure(name: str, func: Callable[[], None]) -> float:
+    start = time.perf_counter()
+    func()
+    duration = time.perf_counter() - start
+    print(f"{name:>12}: {duration:8.3f} s")
+    return duration
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--releases", type=int, default=300, help="number of releases")
+    parser.add_argument(
+        "--repeat", type=int, default=20, help="number of times to repeat"
+    )
+    args = parser.parse_args()
+
+    paths = PathsConfig.force_collection("/")
+    config = ChangelogConfig.default(paths, CollectionDetails(paths))
+    config.use_semantic_versioning = True
+    versions = create_versions(args.releases)
+    print(f"Processing {len(versions)} versions {args.repeat} times")
+
+    with (
+        mock.patch(
+            "antsibull_changelog.utils._parse_semantic_version",
+            semantic_version.Version,
+        ),
+        mock.patch(
+            "antsibull_changelog.utils._parse_packaging_version",
+            packaging.version.Version,
+        ),
+    ):
+        uncached = measure("uncached", lambda: run(config, versions, args.repeat))
+    cached = measure("cached", lambda: run(config, versions, args.repeat))
+    print(f"Speedup: {uncached / cached:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -279,6 +279,17 @@ class ChangelogEnvironment:
         self.mkdir(plugin_dir)
         self._write(os.path.join(plugin_dir, name), content.encode("utf-8"))
 
+    def remove_plugin(self, plugin_type: str, name: str, subdirs: list[str] = None):
+        path = os.path.join(
+            self.paths.base_dir,
+            *self._plugin_base(plugin_type),
+            *(subdirs or []),
+            name,
+        )
+        if os.path.exists(path):
+            os.remove(path)
+        self.created_files.pop(path, None)
+
     def add_file(self, filename: str, content: bytes):
         path = os.path.join(self.paths.base_dir, filename)
         self.mkdir(os.path.dirname(path))
@@ -9,15 +9,22 @@ Test basic changelog functionality: Ansible collections
 
 from __future__ import annotations
 
+import copy
+import json
+import logging
 import os
+import re
 from unittest import mock
 
+import pytest
+from antsibull_fileutils.copier import Copier
 from fixtures import collection_changelog  # noqa: F401; pylint: disable=unused-variable
 from fixtures import create_plugin
 
 import antsibull_changelog.plugins  # noqa: F401; pylint: disable=unused-variable
 from antsibull_changelog import constants as C
 from antsibull_changelog.config import ChangelogOutput, TextFormat
+from antsibull_changelog.plugins import _list_copied_files
 
 
 def test_changelog_init(  # pylint: disable=redefined-outer-name
@@ -2150,6 +2157,7 @@ def test_changelog_release_plugin_cache(  # pylint: disable=redefined-outer-name
 
                 plugin_cache = diff.parse_yaml("changelogs/.plugin-cache.yaml")
                 assert plugin_cache["version"] == "1.0.0"
+                fingerprint = plugin_cache["fingerprint"]
 
                 # Plugin cache: modules
                 assert sorted(plugin_cache["plugins"]["module"]) == [
@@ -2311,6 +2319,777 @@ New Roles
                 diff.dump()
                 assert diff.unchanged
 
+                # Force reloading plugins with several ansible-doc calls in parallel.
+                assert (
+                    collection_changelog.run_tool(
+                        "generate",
+                        ["-v", "--reload-plugins", "--plugin-load-jobs", "4"],
+                    )
+                    == C.RC_SUCCESS
+                )
+
+                diff = collection_changelog.diff()
+                diff.dump()
+                assert diff.unchanged
+
+    commands = []
+    fake_ansible_doc = collection_changelog.create_fake_subprocess_ansible_doc(
+        FAKE_PLUGINS
+    )
+
+    def record_ansible_doc(command, **kwargs):
+        commands.append(command)
+        return fake_ansible_doc(command, **kwargs)
+
+    with mock.patch(
+        "antsibull_changelog.plugins.get_ansible_release",
+        return_value=("2.11.0", "dummy codename"),
+    ):
+        with mock.patch(
+            "antsibull_changelog.plugins.get_documentable_objects",
+            return_value=("role",),
+        ):
+            with mock.patch("subprocess.check_output", record_ansible_doc):
+                # The plugin cache is reused for a new version as long as the
+                # plugin sources do not change
+                collection_changelog.set_galaxy(
+                    {
+                        "version": "1.1.0",
+                    }
+                )
+                collection_changelog.add_fragment_line(
+                    "1.1.0.yml", "bugfixes", ["Fix something."]
+                )
+                assert (
+                    collection_changelog.run_tool(
+                        "release", ["-v", "--date", "2020-02-02"]
+                    )
+                    == C.RC_SUCCESS
+                )
+
+                assert commands == []
+                diff = collection_changelog.diff()
+                assert "changelogs/.plugin-cache.yaml" not in diff.changed_files
+                assert (
+                    diff.parse_yaml("changelogs/.plugin-cache.yaml")["version"]
+                    == "1.0.0"
+                )
+
+                # Changing a plugin's source invalidates the plugin cache
+                collection_changelog.add_plugin(
+                    "module",
+                    "test_module.py",
+                    create_plugin(
+                        DOCUMENTATION={
+                            "name": "test_module",
+                            "short_description": "A modified test module",
+                            "version_added": "1.0.0",
+                            "description": ["This is a test module."],
+                            "author": ["Someone"],
+                            "options": {},
+                        },
+                        EXAMPLES="",
+                        RETURN={},
+                    ),
+                )
+                assert (
+                    collection_changelog.run_tool(
+                        "generate", ["-v", "--refresh-plugins"]
+                    )
+                    == C.RC_SUCCESS
+                )
+
+                assert commands
+                diff = collection_changelog.diff()
+                assert diff.changed_files == ["changelogs/.plugin-cache.yaml"]
+                plugin_cache = diff.parse_yaml("changelogs/.plugin-cache.yaml")
+                assert plugin_cache["version"] == "1.1.0"
+                assert plugin_cache["fingerprint"] != fingerprint
+
+
+def test_changelog_release_plugin_cache_incremental(  # pylint: disable=redefined-outer-name
+    collection_changelog,
+):  # noqa: F811
+    fake_plugins = copy.deepcopy(FAKE_PLUGINS)
+    fake_ansible_doc = collection_changelog.create_fake_subprocess_ansible_doc(
+        fake_plugins
+    )
+    ansible_doc_commands = []
+
+    def record_ansible_doc(command, **kwargs):
+        if command[0].endswith("ansible-doc"):
+            ansible_doc_commands.append(
+                [arg for arg in command[1:] if not os.path.isabs(arg)]
+            )
+        return fake_ansible_doc(command, **kwargs)
+
+    with mock.patch(
+        "antsibull_changelog.plugins.get_ansible_release",
+        return_value=("2.11.0", "dummy codename"),
+    ):
+        with mock.patch(
+            "antsibull_changelog.plugins.get_documentable_objects",
+            return_value=(),
+        ):
+            with mock.patch("subprocess.check_output", record_ansible_doc):
+                collection_changelog.set_galaxy(
+                    {
+                        "version": "1.0.0",
+                    }
+                )
+                collection_changelog.config.incremental_plugin_refresh = True
+                collection_changelog.set_config(collection_changelog.config)
+                collection_changelog.add_fragment_line(
+                    "1.0.0.yml", "release_summary", "This is the first proper release."
+                )
+                for name, subdirs in (
+                    ("test_module", []),
+                    ("old_module", ["cloud", "sky"]),
+                ):
+                    collection_changelog.add_plugin(
+                        "module",
+                        f"{name}.py",
+                        create_plugin(DOCUMENTATION={"name": name}),
+                        subdirs=subdirs,
+                    )
+                collection_changelog.add_plugin(
+                    "callback",
+                    "test_callback.py",
+                    create_plugin(DOCUMENTATION={"name": "test_callback"}),
+                )
+
+                assert (
+                    collection_changelog.run_tool(
+                        "release", ["-v", "--date", "2020-01-02"]
+                    )
+                    == C.RC_SUCCESS
+                )
+
+                diff = collection_changelog.diff()
+                assert "changelogs/.plugin-cache.yaml" in diff.added_files
+                plugin_cache = diff.parse_yaml("changelogs/.plugin-cache.yaml")
+                assert sorted(plugin_cache["sources"]) == [
+                    "plugins/callback/test_callback.py",
+                    "plugins/modules/cloud/sky/old_module.py",
+                    "plugins/modules/test_module.py",
+                ]
+
+                # Modify one module, remove another one, and change module utils
+                ansible_doc_commands.clear()
+                fake_plugins["module"]["acme.test.test_module"]["doc"][
+                    "short_description"
+                ] = "A modified test module"
+                collection_changelog.add_plugin(
+                    "module",
+                    "test_module.py",
+                    create_plugin(
+                        DOCUMENTATION={"name": "test_module", "description": "New"}
+                    ),
+                )
+                collection_changelog.remove_plugin(
+                    "module", "old_module.py", subdirs=["cloud", "sky"]
+                )
+                collection_changelog.add_file(
+                    os.path.join("plugins", "module_utils", "helper.py"), b""
+                )
+
+                assert (
+                    collection_changelog.run_tool(
+                        "generate", ["-v", "--refresh-plugins"]
+                    )
+                    == C.RC_SUCCESS
+                )
+
+                assert ansible_doc_commands == [
+                    [
+                        "--json",
+                        "-t",
+                        "module",
+                        "--playbook-dir",
+                        "acme.test.test_module",
+                    ]
+                ]
+                diff = collection_changelog.diff()
+                assert "changelogs/.plugin-cache.yaml" in diff.changed_files
+                plugin_cache = diff.parse_yaml("changelogs/.plugin-cache.yaml")
+                assert sorted(plugin_cache["plugins"]["module"]) == ["test_module"]
+                assert (
+                    plugin_cache["plugins"]["module"]["test_module"]["description"]
+                    == "A modified test module"
+                )
+                assert sorted(plugin_cache["plugins"]["callback"]) == ["test_callback"]
+
+                # A full refresh results in the same plugin cache
+                assert (
+                    collection_changelog.run_tool(
+                        "generate", ["-v", "--reload-plugins"]
+                    )
+                    == C.RC_SUCCESS
+                )
+
+                diff = collection_changelog.diff()
+                diff.dump()
+                assert diff.unchanged
+
+                # Changing doc fragments requires a full refresh
+                ansible_doc_commands.clear()
+                collection_changelog.add_file(
+                    os.path.join("plugins", "doc_fragments", "common.py"), b""
+                )
+
+                assert (
+                    collection_changelog.run_tool(
+                        "generate", ["-v", "--refresh-plugins"]
+                    )
+                    == C.RC_SUCCESS
+                )
+
+                assert ["--json", "-t", "callback", "--playbook-dir"] in [
+                    command[:4] for command in ansible_doc_commands
+                ]
+
+
+def test_changelog_release_plugin_cache_static(  # pylint: disable=redefined-outer-name
+    collection_changelog,
+):  # noqa: F811
+    plugins = copy.deepcopy(FAKE_PLUGINS)
+    plugins["module"]["acme.test.win_module"] = {
+        "doc": {
+            "author": ["Someone"],
+            "description": ["This is a Windows module."],
+            "filename": os.path.join("plugins", "modules", "win_module.ps1"),
+            "name": "win_module",
+            "options": {},
+            "short_description": "A Windows module",
+            "version_added": "1.0.0",
+        },
+        "examples": "",
+        "metadata": None,
+        "return": {},
+    }
+    fake_ansible_doc = collection_changelog.create_fake_subprocess_ansible_doc(plugins)
+    ansible_doc_commands = []
+
+    def record_ansible_doc(command, **kwargs):
+        if command[0].endswith("ansible-doc"):
+            ansible_doc_commands.append(
+                [arg for arg in command[1:] if not os.path.isabs(arg)]
+            )
+        return fake_ansible_doc(command, **kwargs)
+
+    with mock.patch(
+        "antsibull_changelog.plugins.get_ansible_release",
+        return_value=("2.11.0", "dummy codename"),
+    ):
+        with mock.patch(
+            "antsibull_changelog.plugins.get_documentable_objects",
+            return_value=("role",),
+        ):
+            with mock.patch("subprocess.check_output", record_ansible_doc):
+                collection_changelog.set_galaxy(
+                    {
+                        "version": "1.0.0",
+                    }
+                )
+                collection_changelog.config.static_plugin_docs = True
+                collection_changelog.set_config(collection_changelog.config)
+                collection_changelog.add_fragment_line(
+                    "1.0.0.yml", "release_summary", "This is the first proper release."
+                )
+                collection_changelog.add_plugin(
+                    "module",
+                    "test_module.py",
+                    create_plugin(
+                        DOCUMENTATION={
+                            "name": "test_module",
+                            "short_description": "A test module",
+                            "version_added": "1.0.0",
+                            "extends_documentation_fragment": ["acme.test.foo"],
+                        },
+                    ),
+                )
+                collection_changelog.add_plugin(
+                    "module",
+                    "old_module.py",
+                    create_plugin(
+                        DOCUMENTATION={
+                            "name": "old_module",
+                            "short_description": "An old module",
+                        },
+                    ),
+                    subdirs=["cloud", "sky"],
+                )
+                # The documentation of this module is in a sidecar file
+                collection_changelog.add_plugin(
+                    "module", "win_module.ps1", "#!powershell\n"
+                )
+                collection_changelog.add_plugin(
+                    "module",
+                    "win_module.yml",
+                    "DOCUMENTATION:\n  short_description: A Windows module\n",
+                )
+                # The documentation of this plugin cannot be extracted statically
+                collection_changelog.add_plugin(
+                    "callback",
+                    "test_callback.py",
+                    "DOCUMENTATION = 'short_description: ' + 'Callback'\n",
+                )
+                collection_changelog.add_role(
+                    "test_role",
+                    {
+                        "main": {
+                            "short_description": "Test role",
+                            "version_added": "1.0.0",
+                            "options": {},
+                        },
+                    },
+                )
+
+                assert (
+                    collection_changelog.run_tool(
+                        "release", ["-v", "--date", "2020-01-02"]
+                    )
+                    == C.RC_SUCCESS
+                )
+
+                assert sorted(command[:3] for command in ansible_doc_commands) == [
+                    ["--json", "-t", "callback"],
+                    ["--json", "-t", "module"],
+                    ["--json", "-t", "role"],
+                    ["--json", "-t", "role"],
+                ]
+                diff = collection_changelog.diff()
+                assert "changelogs/.plugin-cache.yaml" in diff.added_files
+                plugin_cache = diff.parse_yaml("changelogs/.plugin-cache.yaml")
+                assert plugin_cache["plugins"]["module"] == {
+                    "old_module": {
+                        "description": "An old module",
+                        "name": "old_module",
+                        "namespace": "cloud.sky",
+                        "version_added": None,
+                    },
+                    "test_module": {
+                        "description": "A test module",
+                        "name": "test_module",
+                        "namespace": "",
+                        "version_added": "1.0.0",
+                    },
+                    "win_module": {
+                        "description": "A Windows module",
+                        "name": "win_module",
+                        "namespace": "",
+                        "version_added": "1.0.0",
+                    },
+                }
+                assert plugin_cache["plugins"]["callback"] == {
+                    "test_callback": {
+                        "description": "A not so old callback",
+                        "name": "test_callback",
+                        "version_added": "0.5.0",
+                    },
+                }
+                assert (
+                    plugin_cache["objects"]["role"]["test_role"]["description"]
+                    == "Test role"
+                )
+
+                # Loading all plugins with ansible-doc results in the same plugin cache.
+                # Without --use-ansible-doc, only Python plugins would be found.
+                collection_changelog.config.static_plugin_docs = False
+                collection_changelog.set_config(collection_changelog.config)
+                collection_changelog.diff()
+                assert (
+                    collection_changelog.run_tool(
+                        "generate", ["-v", "--reload-plugins", "--use-ansible-doc"]
+                    )
+                    == C.RC_SUCCESS
+                )
+
+                diff = collection_changelog.diff()
+                diff.dump()
+                assert diff.unchanged
+
+
+def test_changelog_release_plugin_cache_list_description(  # pylint: disable=redefined-outer-name
+    collection_changelog,
+):  # noqa: F811
+    plugins = copy.deepcopy(FAKE_PLUGINS)
+    plugins["module"]["acme.test.test_module"]["doc"]["short_description"] = [
+        "A test",
+        "module",
+    ]
+    with mock.patch(
+        "antsibull_changelog.plugins.get_ansible_release",
+        return_value=("2.11.0", "dummy codename"),
+    ):
+        with mock.patch(
+            "antsibull_changelog.plugins.get_documentable_objects",
+            return_value=(),
+        ):
+            with mock.patch(
+                "subprocess.check_output",
+                collection_changelog.create_fake_subprocess_ansible_doc(plugins),
+            ):
+                collection_changelog.set_galaxy(
+                    {
+                        "version": "1.0.0",
+                    }
+                )
+                collection_changelog.set_config(collection_changelog.config)
+                collection_changelog.add_fragment_line(
+                    "1.0.0.yml", "release_summary", "This is the first proper release."
+                )
+                collection_changelog.add_plugin(
+                    "module",
+                    "test_module.py",
+                    create_plugin(
+                        DOCUMENTATION={
+                            "name": "test_module",
+                            "short_description": "A test module",
+                            "version_added": "1.0.0",
+                        },
+                    ),
+                )
+
+                # Descriptions that are lists cannot be stored in the markup cache
+                assert (
+                    collection_changelog.run_tool(
+                        "release", ["-v", "--date", "2020-01-02"]
+                    )
+                    == C.RC_SUCCESS
+                )
+
+                diff = collection_changelog.diff()
+                plugin_cache = diff.parse_yaml("changelogs/.plugin-cache.yaml")
+                assert plugin_cache["plugins"]["module"]["test_module"][
+                    "description"
+                ] == [
+                    "A test",
+                    "module",
+                ]
+                assert plugin_cache["markup"]["descriptions"] == []
+                assert "- acme.test.test_module - A test\n\n  module\n" in (
+                    diff.file_contents["CHANGELOG.rst"].decode("utf-8")
+                )
+
+
+def test_changelog_release_plugin_cache_fresh(  # pylint: disable=redefined-outer-name
+    collection_changelog, tmp_path
+):  # noqa: F811
+    ansible_doc = tmp_path / "ansible-doc"
+    ansible_doc.write_text("")
+    with mock.patch(
+        "antsibull_changelog.plugins.get_ansible_release",
+        return_value=("2.11.0", "dummy codename"),
+    ):
+        with mock.patch(
+            "antsibull_changelog.plugins.get_documentable_objects",
+            return_value=(),
+        ):
+            with (
+                mock.patch(
+                    "subprocess.check_output",
+                    collection_changelog.create_fake_subprocess_ansible_doc(
+                        FAKE_PLUGINS
+                    ),
+                ),
+                mock.patch("shutil.which", return_value=str(ansible_doc)),
+            ):
+                collection_changelog.set_galaxy(
+                    {
+                        "version": "1.0.0",
+                    }
+                )
+                collection_changelog.set_config(collection_changelog.config)
+                collection_changelog.add_fragment_line(
+                    "1.0.0.yml", "release_summary", "This is the first proper release."
+                )
+                collection_changelog.add_plugin(
+                    "module",
+                    "test_module.py",
+                    create_plugin(
+                        DOCUMENTATION={
+                            "name": "test_module",
+                            "short_description": "A test module",
+                            "version_added": "1.0.0",
+                        },
+                    ),
+                )
+                assert (
+                    collection_changelog.run_tool(
+                        "release", ["-v", "--date", "2020-01-02"]
+                    )
+                    == C.RC_SUCCESS
+                )
+                cache_path = os.path.join(
+                    collection_changelog.paths.changelog_dir, ".plugin-cache.yaml"
+                )
+                cache_mtime = os.stat(cache_path).st_mtime_ns
+
+                # The plugin cache is newer than the plugin sources and ansible-doc,
+                # so neither the sources nor ansible-core have to be inspected
+                os.utime(cache_path, ns=(cache_mtime + 10**10, cache_mtime + 10**10))
+                with (
+                    mock.patch(
+                        "antsibull_changelog.plugins._hash_plugin_sources",
+                        side_effect=AssertionError("sources must not be hashed"),
+                    ),
+                    mock.patch(
+                        "antsibull_changelog.plugins._get_ansible_core_version",
+                        side_effect=AssertionError("ansible-core must not be queried"),
+                    ),
+                ):
+                    assert (
+                        collection_changelog.run_tool(
+                            "generate", ["-v", "--refresh-plugins"]
+                        )
+                        == C.RC_SUCCESS
+                    )
+
+                # If a plugin source is newer than the plugin cache, the fingerprint
+                # is recomputed
+                os.utime(cache_path, ns=(10**9, 10**9))
+                with mock.patch(
+                    "antsibull_changelog.plugins._hash_plugin_sources",
+                    wraps=antsibull_changelog.plugins._hash_plugin_sources,
+                ) as hash_plugin_sources:
+                    assert (
+                        collection_changelog.run_tool(
+                            "generate", ["-v", "--refresh-plugins"]
+                        )
+                        == C.RC_SUCCESS
+                    )
+                hash_plugin_sources.assert_called_once()
+
+                # Since the fingerprint did not change, the plugin cache is marked
+                # as fresh again
+                assert os.stat(cache_path).st_mtime_ns > 10**9
+
+
+@pytest.mark.parametrize(
+    "collection_staging, vcs",
+    [
+        ("selective", "none"),
+        ("symlink", "none"),
+        ("symlink", "git"),
+    ],
+)
+def test_changelog_release_plugin_cache_staging(  # pylint: disable=redefined-outer-name
+    collection_changelog, collection_staging, vcs, caplog
+):  # noqa: F811
+    def list_git_files(directory, log_debug=None):
+        # Pretend that the tests directory is ignored by Git
+        return [
+            file.encode("utf-8")
+            for file in _list_copied_files(directory, "none")
+            if not file.startswith("tests/")
+        ]
+
+    with (
+        mock.patch(
+            "antsibull_changelog.plugins.get_ansible_release",
+            return_value=("2.11.0", "dummy codename"),
+        ),
+        mock.patch("antsibull_changelog.plugins.list_git_files", list_git_files),
+        mock.patch("antsibull_changelog.plugins.GitCopier", Copier),
+    ):
+        with mock.patch(
+            "antsibull_changelog.plugins.get_documentable_objects",
+            return_value=("role",),
+        ):
+            with mock.patch(
+                "subprocess.check_output",
+                collection_changelog.create_fake_subprocess_ansible_doc(FAKE_PLUGINS),
+            ):
+                collection_changelog.set_galaxy(
+                    {
+                        "version": "1.0.0",
+                    }
+                )
+                collection_changelog.config.collection_staging = collection_staging
+                collection_changelog.config.vcs = vcs
+                collection_changelog.set_config(collection_changelog.config)
+                collection_changelog.add_fragment_line(
+                    "1.0.0.yml", "release_summary", "This is the first proper release."
+                )
+                for name, subdirs in (
+                    ("test_module", []),
+                    ("old_module", ["cloud", "sky"]),
+                ):
+                    collection_changelog.add_plugin(
+                        "module",
+                        f"{name}.py",
+                        create_plugin(DOCUMENTATION={"name": name}),
+                        subdirs=subdirs,
+                    )
+                collection_changelog.add_plugin(
+                    "callback",
+                    "test_callback.py",
+                    create_plugin(DOCUMENTATION={"name": "test_callback"}),
+                )
+                collection_changelog.add_role(
+                    "test_role",
+                    {
+                        "main": {
+                            "short_description": "Test role",
+                            "version_added": "1.0.0",
+                            "options": {},
+                        },
+                    },
+                )
+                collection_changelog.add_file(
+                    os.path.join("tests", "integration", "large.bin"), b"x" * 10000
+                )
+
+                with caplog.at_level(logging.INFO):
+                    assert (
+                        collection_changelog.run_tool(
+                            "release", ["-vv", "--date", "2020-01-02"]
+                        )
+                        == C.RC_SUCCESS
+                    )
+                avoided = re.search(r"avoided copying (\d+) bytes", caplog.text)
+                assert avoided is not None
+                if vcs == "git":
+                    # Symbolic links would expose files ignored by Git, and the
+                    # ignored files would not have been copied anyway
+                    assert "copying selectively" in caplog.text
+                    assert "Staging only" in caplog.text
+                    assert int(avoided.group(1)) < 10000
+                else:
+                    assert int(avoided.group(1)) >= 10000
+                    if collection_staging == "symlink":
+                        assert "Staged collection with symbolic links" in caplog.text
+
+                diff = collection_changelog.diff()
+                plugin_cache = diff.parse_yaml("changelogs/.plugin-cache.yaml")
+                assert (
+                    plugin_cache["plugins"]["module"]["old_module"]["namespace"]
+                    == "cloud.sky"
+                )
+                assert (
+                    plugin_cache["plugins"]["module"]["test_module"]["namespace"] == ""
+                )
+
+                # Copying the whole collection results in the same plugin cache
+                collection_changelog.config.collection_staging = "copy"
+                collection_changelog.set_config(collection_changelog.config)
+                collection_changelog.diff()
+                assert (
+                    collection_changelog.run_tool(
+                        "generate", ["-v", "--reload-plugins"]
+                    )
+                    == C.RC_SUCCESS
+                )
+
+                diff = collection_changelog.diff()
+                diff.dump()
+                assert diff.unchanged
+
+
+def test_changelog_release_plugin_cache_json(  # pylint: disable=redefined-outer-name
+    collection_changelog,
+):  # noqa: F811
+    fake_ansible_doc = collection_changelog.create_fake_subprocess_ansible_doc(
+        FAKE_PLUGINS
+    )
+    ansible_doc_commands = []
+
+    def record_ansible_doc(command, **kwargs):
+        ansible_doc_commands.append(command[1:])
+        return fake_ansible_doc(command, **kwargs)
+
+    with mock.patch(
+        "antsibull_changelog.plugins.get_ansible_release",
+        return_value=("2.11.0", "dummy codename"),
+    ):
+        with mock.patch(
+            "antsibull_changelog.plugins.get_documentable_objects",
+            return_value=(),
+        ):
+            with mock.patch("subprocess.check_output", record_ansible_doc):
+                collection_changelog.set_galaxy(
+                    {
+                        "version": "1.0.0",
+                    }
+                )
+                collection_changelog.config.plugin_cache_format = "json"
+                collection_changelog.set_config(collection_changelog.config)
+                collection_changelog.add_fragment_line(
+                    "1.0.0.yml", "release_summary", "This is the first proper release."
+                )
+                collection_changelog.add_plugin(
+                    "module",
+                    "test_module.py",
+                    create_plugin(DOCUMENTATION={"name": "test_module"}),
+                )
+
+                assert (
+                    collection_changelog.run_tool(
+                        "release", ["-v", "--date", "2020-01-02"]
+                    )
+                    == C.RC_SUCCESS
+                )
+
+                diff = collection_changelog.diff()
+                assert "changelogs/.plugin-cache.yaml" in diff.added_files
+                content = diff.file_contents["changelogs/.plugin-cache.yaml"]
+                plugin_cache = json.loads(content)
+                # The JSON cache can also be read as YAML
+                assert diff.parse_yaml("changelogs/.plugin-cache.yaml") == plugin_cache
+                assert plugin_cache["plugins"]["module"]["test_module"] == {
+                    "description": "A test module",
+                    "name": "test_module",
+                    "namespace": "",
+                    "version_added": "1.0.0",
+                }
+                assert plugin_cache["markup"]["descriptions"] == [
+                    ["A test module", True, "A test module."]
+                ]
+
+                # The JSON cache is reused
+                ansible_doc_commands.clear()
+                assert (
+                    collection_changelog.run_tool(
+                        "generate", ["-v", "--refresh-plugins"]
+                    )
+                    == C.RC_SUCCESS
+                )
+                assert ansible_doc_commands == []
+                diff = collection_changelog.diff()
+                assert diff.unchanged
+
+                # Store the cache as YAML
+                collection_changelog.config.plugin_cache_format = "yaml"
+                collection_changelog.set_config(collection_changelog.config)
+                collection_changelog.diff()
+                assert (
+                    collection_changelog.run_tool(
+                        "generate", ["-v", "--reload-plugins"]
+                    )
+                    == C.RC_SUCCESS
+                )
+                diff = collection_changelog.diff()
+                assert diff.changed_files == ["changelogs/.plugin-cache.yaml"]
+                content = diff.file_contents["changelogs/.plugin-cache.yaml"]
+                assert not content.startswith(b"{")
+                assert diff.parse_yaml("changelogs/.plugin-cache.yaml") == plugin_cache
+
+                # A YAML cache is reused when JSON is configured
+                collection_changelog.config.plugin_cache_format = "json"
+                collection_changelog.set_config(collection_changelog.config)
+                collection_changelog.diff()
+                ansible_doc_commands.clear()
+                assert (
+                    collection_changelog.run_tool(
+                        "generate", ["-v", "--refresh-plugins"]
+                    )
+                    == C.RC_SUCCESS
+                )
+                assert ansible_doc_commands == []
+                diff = collection_changelog.diff()
+                assert diff.unchanged
+
 
 def test_changelog_output(  # pylint: disable=redefined-outer-name
     collection_changelog,
@@ -2542,6 +3321,203 @@ This is the first proper release\.
     )
 
 
+def test_changelog_output_render_cache(  # pylint: disable=redefined-outer-name
+    collection_changelog,
+):  # noqa: F811
+    collection_changelog.set_galaxy(
+        {
+            "version": "1.0.0",
+        }
+    )
+    collection_changelog.config.output = [
+        ChangelogOutput(
+            file="CHANGELOG.rst",
+            format=TextFormat.RESTRUCTURED_TEXT,
+            global_toc=True,
+            per_release_toc=True,
+        ),
+        ChangelogOutput(
+            file="CHANGELOG.md",
+            format=TextFormat.MARKDOWN,
+            global_toc=True,
+            per_release_toc=True,
+        ),
+    ]
+    collection_changelog.config.render_cache = True
+    collection_changelog.set_config(collection_changelog.config)
+    collection_changelog.set_plugin_cache("1.0.0", {})
+
+    collection_changelog.add_fragment_line(
+        "1.0.0.yml", "release_summary", "This is the first proper release."
+    )
+    collection_changelog.add_fragment_line(
+        "foo.yml", "minor_changes", ["foo - add ``bar`` option."]
+    )
+    assert (
+        collection_changelog.run_tool("release", ["-v", "--date", "2020-01-02"])
+        == C.RC_SUCCESS
+    )
+    diff = collection_changelog.diff()
+    assert "changelogs/.render-cache.json" in diff.added_files
+
+    # The sections of the new release shift the IDs of the sections of the old one
+    collection_changelog.set_galaxy(
+        {
+            "version": "1.1.0",
+        }
+    )
+    collection_changelog.set_plugin_cache("1.1.0", {})
+    collection_changelog.add_fragment_line(
+        "1.1.0.yml", "release_summary", "Feature release."
+    )
+    collection_changelog.add_fragment_line(
+        "baz.yml", "minor_changes", ["baz - add ``bam`` option."]
+    )
+    assert (
+        collection_changelog.run_tool("release", ["-v", "--date", "2020-02-02"])
+        == C.RC_SUCCESS
+    )
+    diff = collection_changelog.diff()
+    assert "changelogs/.render-cache.json" in diff.changed_files
+    assert '<a id="release-summary-1"></a>' in diff.file_contents[
+        "CHANGELOG.md"
+    ].decode("utf-8")
+
+    # Rendering without the cache results in the same changelogs
+    collection_changelog.config.render_cache = False
+    collection_changelog.set_config(collection_changelog.config)
+    collection_changelog.diff()
+    assert collection_changelog.run_tool("generate", ["-v"]) == C.RC_SUCCESS
+    diff = collection_changelog.diff()
+    assert diff.unchanged
+
+
+def test_changelog_output_render_jobs(  # pylint: disable=redefined-outer-name
+    collection_changelog,
+):  # noqa: F811
+    collection_changelog.set_galaxy(
+        {
+            "version": "1.0.0",
+        }
+    )
+    collection_changelog.config.output = [
+        ChangelogOutput(
+            file="CHANGELOG.rst",
+            format=TextFormat.RESTRUCTURED_TEXT,
+            global_toc=True,
+        ),
+        ChangelogOutput(
+            file="CHANGELOG.md",
+            format=TextFormat.MARKDOWN,
+            global_toc=True,
+        ),
+        ChangelogOutput(
+            file="CHANGELOG-toc.md",
+            format=TextFormat.MARKDOWN,
+            per_release_toc=True,
+        ),
+    ]
+    collection_changelog.config.render_cache = True
+    collection_changelog.config.render_jobs = 2
+    collection_changelog.set_config(collection_changelog.config)
+    collection_changelog.set_plugin_cache("1.0.0", {})
+
+    collection_changelog.add_fragment_line(
+        "1.0.0.yml", "release_summary", "This is the first proper release."
+    )
+    collection_changelog.add_fragment_line(
+        "foo.yml", "minor_changes", ["foo - add ``bar`` option.", "bar - fix *baz*."]
+    )
+    assert (
+        collection_changelog.run_tool("release", ["-v", "--date", "2020-01-02"])
+        == C.RC_SUCCESS
+    )
+    diff = collection_changelog.diff()
+    assert set(diff.added_files) >= {
+        "CHANGELOG.rst",
+        "CHANGELOG.md",
+        "CHANGELOG-toc.md",
+        "changelogs/.render-cache.json",
+    }
+    # The blocks rendered by the worker processes end up in the cache
+    render_cache = json.loads(
+        diff.file_contents["changelogs/.render-cache.json"].decode("utf-8")
+    )
+    assert len(render_cache["blocks"]) == 3
+
+    # Rendering serially without the cache results in the same changelogs
+    collection_changelog.config.render_cache = False
+    collection_changelog.set_config(collection_changelog.config)
+    collection_changelog.diff()
+    assert (
+        collection_changelog.run_tool("generate", ["-v", "--render-jobs", "1"])
+        == C.RC_SUCCESS
+    )
+    diff = collection_changelog.diff()
+    assert diff.unchanged
+
+    assert (
+        collection_changelog.run_tool("generate", ["-v", "--render-jobs", "0"])
+        == C.RC_COMMAND_FAILED
+    )
+
+
+def test_changelog_compare_before_write(  # pylint: disable=redefined-outer-name
+    collection_changelog,
+):  # noqa: F811
+    collection_changelog.set_galaxy(
+        {
+            "version": "1.0.0",
+        }
+    )
+    collection_changelog.config.output = [
+        ChangelogOutput(file="CHANGELOG.rst", format=TextFormat.RESTRUCTURED_TEXT),
+        ChangelogOutput(file="CHANGELOG.md", format=TextFormat.MARKDOWN),
+    ]
+    collection_changelog.config.compare_before_write = True
+    collection_changelog.set_config(collection_changelog.config)
+    collection_changelog.set_plugin_cache("1.0.0", {})
+
+    collection_changelog.add_fragment_line(
+        "1.0.0.yml", "release_summary", "This is the first proper release."
+    )
+    assert (
+        collection_changelog.run_tool("release", ["-v", "--date", "2020-01-02"])
+        == C.RC_SUCCESS
+    )
+    diff = collection_changelog.diff()
+    assert set(diff.added_files) >= {
+        "CHANGELOG.rst",
+        "CHANGELOG.md",
+        "changelogs/changelog.yaml",
+    }
+
+    mtimes = {}
+    for filename in ("CHANGELOG.rst", "CHANGELOG.md", "changelogs/changelog.yaml"):
+        path = os.path.join(collection_changelog.paths.base_dir, filename)
+        os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+        mtimes[path] = os.stat(path).st_mtime_ns
+
+    # Regenerating does not touch the unchanged files
+    assert collection_changelog.run_tool("generate", ["-v"]) == C.RC_SUCCESS
+    assert (
+        collection_changelog.run_tool("reformat", ["-v", "--is-collection", "yes"])
+        == C.RC_SUCCESS
+    )
+    assert collection_changelog.diff().unchanged
+    for path, mtime in mtimes.items():
+        assert os.stat(path).st_mtime_ns == mtime
+
+    # Changed files are written
+    collection_changelog.config.title = "New Title"
+    collection_changelog.set_config(collection_changelog.config)
+    assert collection_changelog.run_tool("generate", ["-v"]) == C.RC_SUCCESS
+    diff = collection_changelog.diff()
+    assert diff.changed_files == ["CHANGELOG.md", "CHANGELOG.rst"]
+    for path, mtime in mtimes.items():
+        assert (os.stat(path).st_mtime_ns == mtime) == path.endswith(".yaml")
+
+
 def test_changelog_ancestor(  # pylint: disable=redefined-outer-name
     collection_changelog,
 ):  # noqa: F811
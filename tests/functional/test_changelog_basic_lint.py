@@ -120,6 +120,13 @@ changelogs/fragments/string-instead-of-list.yml:0:0: section "minor_changes" mus
 changelogs/fragments/wrong-category.yaml:0:0: invalid section: minor_change
 """.lstrip()
 
+    # Lint fragments with several worker processes
+    rc, parallel_stdout, stderr = collection_changelog.run_tool_w_output(
+        "lint", ["--jobs", "3"]
+    )
+    assert rc == C.RC_INVALID_FRAGMENT
+    assert parallel_stdout == stdout
+
     # Lint non-existing fragment
     rc, stdout, stderr = collection_changelog.run_tool_w_output(
         "lint", ["changelogs/fragments/non-existing"]
@@ -128,3 +135,60 @@ changelogs/fragments/wrong-category.yaml:0:0: invalid section: minor_change
     assert stdout == r"""
 changelogs/fragments/non-existing:0:0: yaml parsing error
 """.lstrip()
+
+
+def test_changelog_fragment_lint_incremental(  # pylint: disable=redefined-outer-name
+    collection_changelog,
+):  # noqa: F811
+    collection_changelog.set_config(collection_changelog.config)
+    collection_changelog.add_fragment_line(
+        "good.yml", "minor_changes", ["test - has a new option ``foo``."]
+    )
+    collection_changelog.add_fragment_line("bad-rst.yml", "bugfixes", ["This is *foo"])
+    collection_changelog.add_fragment_line("trivial.yml", "trivial", ["Trivial."])
+    expected = r"""
+changelogs/fragments/bad-rst.yml:0:0: (WARNING/2) Inline emphasis start-string without end-string.
+""".lstrip()
+
+    rc, stdout, stderr = collection_changelog.run_tool_w_output(
+        "lint", ["--incremental"]
+    )
+    assert rc == C.RC_INVALID_FRAGMENT
+    assert stdout == expected
+    assert os.path.exists(
+        os.path.join(collection_changelog.paths.changelog_dir, ".lint-cache.json")
+    )
+
+    # Nothing changed: no fragment is linted again
+    with mock.patch(
+        "antsibull_changelog.fragment.ChangelogFragmentLinter._lint_fragment",
+        side_effect=AssertionError("fragment should not be linted again"),
+    ):
+        rc, stdout, stderr = collection_changelog.run_tool_w_output(
+            "lint", ["--incremental"]
+        )
+    assert rc == C.RC_INVALID_FRAGMENT
+    assert stdout == expected
+
+    # Only the changed fragment is linted again
+    collection_changelog.add_fragment_line("bad-rst.yml", "bugfixes", ["Fixed *foo*."])
+    with mock.patch(
+        "antsibull_changelog.fragment.check_rst_contents", return_value=[[]]
+    ) as check_rst_contents:
+        rc, stdout, stderr = collection_changelog.run_tool_w_output(
+            "lint", ["--incremental"]
+        )
+    assert rc == C.RC_SUCCESS
+    assert stdout == ""
+    check_rst_contents.assert_called_once_with(["Fixed *foo*."])
+
+    # Changing the relevant configuration lints everything again
+    collection_changelog.config.trivial_section_name = "boring"
+    collection_changelog.set_config(collection_changelog.config)
+    rc, stdout, stderr = collection_changelog.run_tool_w_output(
+        "lint", ["--incremental"]
+    )
+    assert rc == C.RC_INVALID_FRAGMENT
+    assert stdout == r"""
+changelogs/fragments/trivial.yml:0:0: invalid section: trivial
+""".lstrip()
@@ -0,0 +1,253 @@
+# Author: Felix Fontein <felix@fontein.de>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-FileCopyrightText: 2026, Ansible Project
+
+"""
+Test ansible_doc module.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from antsibull_changelog.ansible_doc import (
+    AnsibleDocWorker,
+    ansible_doc_session,
+    check_output,
+    iter_metadata_dump,
+    stream_output,
+)
+
+requires_fork = pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork()")
+
+FAKE_ANSIBLE_DOC_MODULE = """
+import json
+import os
+import sys
+
+def main(args=None):
+    if args is None:
+        args = sys.argv
+    args = args[1:]
+    if "--fail" in args:
+        sys.stderr.write("failed\\n")
+        sys.exit(5)
+    sys.stdout.write(json.dumps({"args": args, "pid": os.getpid()}))
+"""
+
+
+def _create_fake_ansible_doc(
+    tmp_path, monkeypatch, importable=True, import_output=False
+) -> str:
+    lib = tmp_path / "lib"
+    if importable:
+        package = lib / "ansible" / "cli"
+        package.mkdir(parents=True)
+        (lib / "ansible" / "__init__.py").write_text("")
+        (package / "__init__.py").write_text("")
+        module = FAKE_ANSIBLE_DOC_MODULE
+        if import_output:
+            module += "\nprint('importing ansible.cli.doc')\n"
+        (package / "doc.py").write_text(module)
+    else:
+        lib.mkdir()
+    monkeypatch.setenv("PYTHONPATH", str(lib))
+
+    ansible_doc = tmp_path / "ansible-doc"
+    ansible_doc.write_text(
+        f"#!{sys.executable}\nfrom ansible.cli.doc import main\nmain()\n"
+    )
+    ansible_doc.chmod(0o755)
+    return str(ansible_doc)
+
+
+@requires_fork
+def test_worker(tmp_path, monkeypatch):
+    # Output while importing ansible must not end up in the worker's responses
+    ansible_doc = _create_fake_ansible_doc(tmp_path, monkeypatch, import_output=True)
+    worker = AnsibleDocWorker(ansible_doc)
+    try:
+        first = json.loads(worker.run(["--json", "-t", "module", "foo"]))
+        assert first["args"] == ["--json", "-t", "module", "foo"]
+        second = json.loads(worker.run(["--version"]))
+        assert second["args"] == ["--version"]
+        # Every request is run in its own child process
+        assert first["pid"] != second["pid"]
+
+        with pytest.raises(subprocess.CalledProcessError) as exc:
+            worker.run(["--fail"])
+        assert exc.value.returncode == 5
+        assert exc.value.stderr == b"failed\n"
+
+        assert json.loads(worker.run([]))["args"] == []
+    finally:
+        worker.close()
+
+
+@requires_fork
+def test_worker_cannot_import_ansible(tmp_path, monkeypatch):
+    ansible_doc = _create_fake_ansible_doc(tmp_path, monkeypatch, importable=False)
+    with pytest.raises(ValueError, match="Cannot import ansible"):
+        AnsibleDocWorker(ansible_doc)
+
+
+@requires_fork
+def test_session(tmp_path, monkeypatch):
+    ansible_doc = _create_fake_ansible_doc(tmp_path, monkeypatch)
+
+    # Without session, ansible-doc is executed directly
+    data = json.loads(check_output([ansible_doc, "--version"]))
+    assert data["args"] == ["--version"]
+
+    started = []
+    original_init = AnsibleDocWorker.__init__
+
+    def init(self, *args, **kwargs):
+        started.append(self)
+        original_init(self, *args, **kwargs)
+
+    monkeypatch.setattr(AnsibleDocWorker, "__init__", init)
+    with ansible_doc_session(ansible_doc):
+        assert started == []
+        first = json.loads(check_output([ansible_doc, "--version"]))
+        with ansible_doc_session(ansible_doc):
+            second = json.loads(check_output([ansible_doc, "--list"]))
+        third = json.loads(check_output([ansible_doc, "foo"]))
+        assert [first["args"], second["args"], third["args"]] == [
+            ["--version"],
+            ["--list"],
+            ["foo"],
+        ]
+        assert len(started) == 1
+
+        # Other commands are not routed to the worker
+        assert check_output([sys.executable, "-c", "print(1)"]).strip() == b"1"
+
+    with ansible_doc_session(ansible_doc, enabled=False):
+        check_output([ansible_doc, "--version"])
+    assert len(started) == 1
+
+
+@requires_fork
+def test_session_fallback(tmp_path, monkeypatch):
+    ansible_doc = _create_fake_ansible_doc(tmp_path, monkeypatch)
+    monkeypatch.setattr(
+        "antsibull_changelog.ansible_doc._WORKER_PATH",
+        str(tmp_path / "does-not-exist.py"),
+    )
+    with ansible_doc_session(ansible_doc):
+        data = json.loads(check_output([ansible_doc, "--version"]))
+        assert data["args"] == ["--version"]
+        data = json.loads(check_output([ansible_doc, "--list"]))
+        assert data["args"] == ["--list"]
+
+
+METADATA_DUMP = {
+    "all": {
+        "module": {
+            "foo.bar.baz": {
+                "doc": {"short_description": "B\u00e4z", "version_added": "1.0.0"},
+                "examples": "- foo.bar.baz:\n    value: 123\n",
+                "return": {"value": {"type": "int", "sample": 12345}},
+            },
+            "foo.bar.qux": {"doc": {"short_description": "Qux"}},
+        },
+        "lookup": {},
+        "role": {"foo.bar.role": {"entry_points": {"main": {}}}},
+    },
+    "erred": {"module": ["foo.bar.broken"]},
+}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 65536])
+@pytest.mark.parametrize("indent", [None, 4])
+def test_iter_metadata_dump(chunk_size, indent, monkeypatch):
+    monkeypatch.setattr("antsibull_changelog.ansible_doc._CHUNK_SIZE", chunk_size)
+    stream = io.BytesIO(json.dumps(METADATA_DUMP, indent=indent).encode("utf-8"))
+    result = {
+        plugin_type: dict(plugins)
+        for plugin_type, plugins in iter_metadata_dump(stream)
+    }
+    assert result == METADATA_DUMP["all"]
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"",
+        b"[]",
+        b'{"all": {"module": []}}',
+        b'{"all": {"module": {"foo": }}}',
+        b'{"all": {}',
+        b'{"all": {}} {}',
+    ],
+)
+def test_iter_metadata_dump_invalid(data):
+    with pytest.raises(ValueError):
+        for _, plugins in iter_metadata_dump(io.BytesIO(data)):
+            for _ in plugins:
+                pass
+
+
+def test_stream_output():
+    with stream_output([sys.executable, "-c", "print('a' * 100000)"]) as output:
+        assert output.read(3) == b"aaa"
+    with pytest.raises(subprocess.CalledProcessError) as exc:
+        with stream_output([sys.executable, "-c", "import sys; sys.exit(3)"]) as output:
+            assert output.read() == b""
+    assert exc.value.returncode == 3
+
+
+def test_stream_output_failing_ansible_doc(tmp_path, monkeypatch):
+    ansible_doc = _create_fake_ansible_doc(tmp_path, monkeypatch)
+    with pytest.raises(subprocess.CalledProcessError) as exc:
+        with stream_output([ansible_doc, "--metadata-dump", "--fail"]) as stream:
+            for _ in iter_metadata_dump(stream):
+                pass
+    assert exc.value.returncode == 5
+
+
+@pytest.mark.parametrize("output", ["", '{"all": {'])
+def test_stream_output_failure(output):
+    # Errors while processing the output of a failing command are reported as
+    # failure of the command
+    command = [
+        sys.executable,
+        "-c",
+        f"import sys; sys.stdout.write({output!r}); sys.exit(2)",
+    ]
+    with pytest.raises(subprocess.CalledProcessError) as exc:
+        with stream_output(command) as stream:
+            for _ in iter_metadata_dump(stream):
+                pass
+    assert exc.value.returncode == 2
+    assert isinstance(exc.value.__cause__, ValueError)
+
+    # Errors while processing the output of a successful command are not hidden
+    command = [sys.executable, "-c", f"import sys; sys.stdout.write({output!r})"]
+    with pytest.raises(ValueError):
+        with stream_output(command) as stream:
+            for _ in iter_metadata_dump(stream):
+                pass
+
+
+@requires_fork
+def test_stream_output_session(tmp_path, monkeypatch):
+    ansible_doc = _create_fake_ansible_doc(tmp_path, monkeypatch)
+    with ansible_doc_session(ansible_doc):
+        with stream_output([ansible_doc, "--metadata-dump"]) as output:
+            assert output.read(2) == b'{"'
+        # The unread part of the output has been skipped
+        with stream_output([ansible_doc, "foo"]) as output:
+            assert json.load(output)["args"] == ["foo"]
+        with pytest.raises(subprocess.CalledProcessError):
+            with stream_output([ansible_doc, "--fail"]) as output:
+                pass
+        assert json.loads(check_output([ansible_doc, "bar"]))["args"] == ["bar"]
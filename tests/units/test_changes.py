@@ -16,6 +16,8 @@ import pytest
 
 from antsibull_changelog.changes import ChangesData
 from antsibull_changelog.config import ChangelogConfig, CollectionDetails, PathsConfig
+from antsibull_changelog.fragment import ChangelogFragment
+from antsibull_changelog.plugins import PluginDescription
 
 
 def test_changes_data():
@@ -184,3 +186,88 @@ def test_changes_data():
         "1.3.0-beta",
     ]
     assert changes_concat.ancestor == "1.1.0"
+
+
+def _plugin(plugin_type, name, description, category="plugin"):
+    return PluginDescription(
+        plugin_type=plugin_type,
+        name=name,
+        namespace="" if plugin_type == "module" else None,
+        description=description,
+        version_added=None,
+        category=category,
+    )
+
+
+def test_changes_data_index():
+    paths = PathsConfig.force_collection("/")
+    config = ChangelogConfig.default(paths, CollectionDetails(paths))
+
+    changes = ChangesData(
+        config,
+        "",
+        data_override={
+            "ancestor": None,
+            "releases": {
+                "1.0.0": {
+                    "modules": [{"name": "foo", "description": "Foo", "namespace": ""}],
+                    "plugins": {
+                        "lookup": [{"name": "bar", "description": "Bar"}],
+                    },
+                    "objects": {
+                        "role": [{"name": "baz", "description": "Baz"}],
+                    },
+                    "fragments": ["1.yml"],
+                },
+                "1.1.0": {
+                    "fragments": ["2.yml"],
+                },
+            },
+        },
+    )
+
+    assert changes._plugin_index.get("module/foo") == {"1.0.0"}
+    assert changes._plugin_index.get("lookup/bar") == {"1.0.0"}
+    assert changes._plugin_index.get("lookup/foo") == set()
+    assert changes._object_index.get("role/baz") == {"1.0.0"}
+    assert changes.known_fragments == {"1.yml", "2.yml"}
+
+    changes.add_release("1.2.0", None, datetime.date(2020, 3, 1))
+    assert changes.add_plugin(_plugin("filter", "bam", "Bam"), "1.2.0")
+    assert changes.add_object(_plugin("role", "boo", "Boo", "object"), "1.2.0")
+    assert changes.add_fragment(
+        ChangelogFragment(
+            {"add plugin.test": [{"name": "tst", "description": "Test"}]}, "3.yml"
+        ),
+        "1.2.0",
+    )
+    assert changes._plugin_index.get("filter/bam") == {"1.2.0"}
+    assert changes._plugin_index.get("test/tst") == {"1.2.0"}
+    assert changes._object_index.get("role/boo") == {"1.2.0"}
+    assert changes.known_fragments == {"1.yml", "2.yml", "3.yml"}
+
+    # Descriptions are updated; removed plugins are only dropped with allow_removals
+    plugins = [
+        _plugin("module", "foo", "New foo"),
+        _plugin("filter", "bam", "Bam"),
+        _plugin("test", "tst", "Test"),
+    ]
+    changes.update_plugins(plugins, allow_removals=False)
+    assert changes.releases["1.0.0"]["modules"][0]["description"] == "New foo"
+    assert changes._plugin_index.get("lookup/bar") == {"1.0.0"}
+    changes.update_plugins(plugins, allow_removals=True)
+    assert changes.releases["1.0.0"]["plugins"]["lookup"] == []
+    assert changes._plugin_index.get("lookup/bar") == set()
+    assert "lookup/bar" not in changes.known_plugins
+
+    changes.update_objects([_plugin("role", "boo", "Boo", "object")], True)
+    assert changes.releases["1.0.0"]["objects"]["role"] == []
+    assert changes._object_index.get("role/baz") == set()
+    assert changes._object_index.get("role/boo") == {"1.2.0"}
+
+    changes.restrict_to("1.1.0")
+    assert changes._plugin_index.get("filter/bam") == set()
+    assert "1.2.0" not in changes.releases
+    changes.prune_versions(versions_after="1.0.0", versions_until=None)
+    assert changes._plugin_index.get("module/foo") == set()
+    assert list(changes.releases) == ["1.1.0"]
@@ -13,7 +13,12 @@ import pytest
 
 from antsibull_changelog.config import ChangelogConfig, CollectionDetails, PathsConfig
 from antsibull_changelog.errors import ChangelogError
-from antsibull_changelog.fragment import ChangelogFragment, load_fragments
+from antsibull_changelog.fragment import (
+    PARALLEL_LOAD_THRESHOLD,
+    ChangelogFragment,
+    ChangelogFragmentLinter,
+    load_fragments,
+)
 
 
 def test_fragment_combine_fail():
@@ -62,3 +67,60 @@ def test_fragments_filename_ignore(tmp_path):
         "valid.yaml",
         "valid.yml",
     ]
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_fragments_parallel_loading(tmp_path, executor):
+    paths = PathsConfig.force_ansible(str(tmp_path))
+    config = ChangelogConfig.default(paths, CollectionDetails(paths))
+    fragment_paths = []
+    for index in range(PARALLEL_LOAD_THRESHOLD + 10):
+        p = tmp_path / f"fragment-{index:03d}.yaml"
+        if index % 17 == 5:
+            p.write_text("test: [")
+        else:
+            p.write_text(f'minor_changes: ["change {index}"]')
+        fragment_paths.append(str(p))
+
+    serial_exceptions: list[tuple[str, Exception]] = []
+    serial = load_fragments(paths, config, fragment_paths, serial_exceptions)
+
+    parallel_exceptions: list[tuple[str, Exception]] = []
+    parallel = load_fragments(
+        paths, config, fragment_paths, parallel_exceptions, jobs=4, executor=executor
+    )
+
+    assert [(f.path, f.content) for f in parallel] == [
+        (f.path, f.content) for f in serial
+    ]
+    assert [path for path, _ in parallel_exceptions] == [
+        path for path, _ in serial_exceptions
+    ]
+    assert len(parallel_exceptions) == 5
+
+    with pytest.raises(ChangelogError):
+        load_fragments(paths, config, fragment_paths, jobs=4, executor=executor)
+
+
+def test_fragments_parallel_linting(tmp_path):
+    paths = PathsConfig.force_collection(str(tmp_path))
+    config = ChangelogConfig.default(paths, CollectionDetails(paths))
+    fragments = [
+        ChangelogFragment({"bugfixes": [f"Fix {i}.", f"Fix *{i}."]}, f"{i}.yml")
+        for i in range(10)
+    ] + [
+        ChangelogFragment({"foo": ["Bar."]}, "foo.yml"),
+        ChangelogFragment({"bugfixes": [None]}, "none.yml"),
+    ]
+    linter = ChangelogFragmentLinter(config)
+    serial = [linter.lint(fragment) for fragment in fragments]
+    assert linter.lint_many(fragments) == serial
+    assert linter.lint_many(fragments, jobs=3) == serial
+    assert serial[0] == [
+        (
+            "0.yml",
+            0,
+            0,
+            "(WARNING/2) Inline emphasis start-string without end-string.",
+        )
+    ]
@@ -0,0 +1,144 @@
+# Author: Felix Fontein <felix@fontein.de>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-FileCopyrightText: 2026, Ansible Project
+
+"""
+Test fragment_cache module.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from unittest import mock
+
+from antsibull_changelog.config import ChangelogConfig, CollectionDetails, PathsConfig
+from antsibull_changelog.fragment import load_fragments
+from antsibull_changelog.fragment_cache import (
+    FragmentCache,
+    get_fragment_cache_path,
+    get_lint_config_fingerprint,
+)
+
+
+def _create_config(tmp_path):
+    paths = PathsConfig.force_other(str(tmp_path))
+    config = ChangelogConfig.default(paths, CollectionDetails(paths))
+    config.fragment_cache = True
+    os.makedirs(os.path.join(paths.changelog_dir, config.notes_dir))
+    return paths, config
+
+
+def _write_fragment(paths, config, name, content):
+    path = os.path.join(paths.changelog_dir, config.notes_dir, name)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+    return path
+
+
+def _loaded(fragments):
+    return sorted((fragment.name, fragment.content) for fragment in fragments)
+
+
+def test_fragment_cache_hits(tmp_path):
+    paths, config = _create_config(tmp_path)
+    _write_fragment(paths, config, "a.yml", "minor_changes: [a]")
+    _write_fragment(paths, config, "b.yml", "bugfixes: [b]")
+
+    first = load_fragments(paths, config)
+    cache_path = get_fragment_cache_path(paths)
+    assert os.path.exists(cache_path)
+
+    with mock.patch(
+        "antsibull_changelog.fragment.load_yaml_file",
+        side_effect=AssertionError("fragment should come from cache"),
+    ):
+        second = load_fragments(paths, config)
+    assert _loaded(second) == _loaded(first)
+
+    # Bypassing the cache parses the fragments again
+    with mock.patch(
+        "antsibull_changelog.fragment.load_yaml_file",
+        side_effect=AssertionError("parsed"),
+    ):
+        exceptions = []
+        load_fragments(paths, config, exceptions=exceptions, use_cache=False)
+    assert len(exceptions) == 2
+
+
+def test_fragment_cache_invalidation(tmp_path):
+    paths, config = _create_config(tmp_path)
+    path = _write_fragment(paths, config, "a.yml", "minor_changes: [a]")
+    load_fragments(paths, config)
+
+    # Same size, different content
+    _write_fragment(paths, config, "a.yml", "minor_changes: [b]")
+    os.utime(path, ns=(0, 0))
+    assert _loaded(load_fragments(paths, config)) == [
+        ("a.yml", {"minor_changes": ["b"]})
+    ]
+
+    # Only the modification time changed: hash still matches
+    os.utime(path, ns=(1, 1))
+    with mock.patch(
+        "antsibull_changelog.fragment.load_yaml_file",
+        side_effect=AssertionError("fragment should come from cache"),
+    ):
+        assert _loaded(load_fragments(paths, config)) == [
+            ("a.yml", {"minor_changes": ["b"]})
+        ]
+
+
+def test_fragment_cache_eviction(tmp_path):
+    paths, config = _create_config(tmp_path)
+    cache_path = get_fragment_cache_path(paths)
+    fragment_paths = [
+        _write_fragment(paths, config, f"{index}.yml", f"minor_changes: ['{index}']")
+        for index in range(5)
+    ]
+    load_fragments(paths, config)
+    os.remove(fragment_paths[0])
+    load_fragments(paths, config)
+    with open(cache_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    assert sorted(data["fragments"]) == sorted(fragment_paths[1:])
+
+    cache = FragmentCache.load(cache_path, max_entries=2)
+    assert cache.get(fragment_paths[4]) == (True, {"minor_changes": ["4"]})
+    cache.save()
+    assert len(cache.entries) == 2
+    assert fragment_paths[4] in cache.entries
+
+
+def test_fragment_cache_invalid_file(tmp_path):
+    paths, config = _create_config(tmp_path)
+    _write_fragment(paths, config, "a.yml", "minor_changes: [a]")
+    _write_fragment(paths, config, "date.yml", "release_summary: 2020-01-01")
+    with open(get_fragment_cache_path(paths), "w", encoding="utf-8") as f:
+        f.write("{")
+    assert _loaded(load_fragments(paths, config))[0] == (
+        "a.yml",
+        {"minor_changes": ["a"]},
+    )
+    cache = FragmentCache.load(get_fragment_cache_path(paths))
+    # Content that cannot be represented in JSON is not cached
+    assert sorted(os.path.basename(key) for key in cache.entries) == ["a.yml"]
+
+
+def test_lint_config_fingerprint_dependencies(tmp_path):
+    _, config = _create_config(tmp_path)
+
+    def get_fingerprint(versions):
+        with mock.patch(
+            "importlib.metadata.version",
+            side_effect=lambda package: versions.get(package, "1.0.0"),
+        ):
+            return get_lint_config_fingerprint(config)
+
+    fingerprint = get_fingerprint({})
+    assert get_fingerprint({}) == fingerprint
+
+    # Updating docutils or rstcheck can change the lint results
+    for name in ("docutils", "rstcheck", "rstcheck-core"):
+        assert get_fingerprint({name: "1.0.1"}) != fingerprint
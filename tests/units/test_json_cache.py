@@ -0,0 +1,85 @@
+# Author: Felix Fontein <felix@fontein.de>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-FileCopyrightText: 2026, Ansible Project
+
+"""
+Test json_cache module.
+"""
+
+from __future__ import annotations
+
+import json
+
+from antsibull_changelog.json_cache import JSONLRUCache
+
+
+class _TestCache(JSONLRUCache):
+    CACHE_VERSION = 2
+    ENTRIES_KEY = "items"
+    NAME = "test cache"
+
+    @staticmethod
+    def load(path: str, max_entries: int = 2) -> _TestCache:
+        cache = _TestCache(path, max_entries=max_entries)
+        cache._load()
+        return cache
+
+    def get(self, key: str) -> str | None:
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        self._touch(entry)
+        return entry["value"]
+
+    def put(self, key: str, value: str) -> None:
+        self.entries[key] = {"generation": self.generation, "value": value}
+        self._dirty = True
+
+
+def test_json_lru_cache(tmp_path):
+    path = tmp_path / "cache.json"
+
+    cache = _TestCache.load(str(path))
+    cache.put("a", "A")
+    cache.put("b", "B")
+    cache.save()
+    assert json.loads(path.read_text()) == {
+        "version": 2,
+        "generation": 0,
+        "items": {
+            "a": {"generation": 0, "value": "A"},
+            "b": {"generation": 0, "value": "B"},
+        },
+    }
+
+    # The least recently used entry is evicted
+    cache = _TestCache.load(str(path))
+    assert cache.generation == 1
+    assert cache.get("a") == "A"
+    cache.put("c", "C")
+    cache.save()
+    cache = _TestCache.load(str(path))
+    assert sorted(cache.entries) == ["a", "c"]
+
+    # Unchanged caches are not written
+    mtime = path.stat().st_mtime_ns
+    cache.save()
+    assert path.stat().st_mtime_ns == mtime
+
+
+def test_json_lru_cache_invalid(tmp_path):
+    path = tmp_path / "cache.json"
+
+    path.write_text("{")
+    assert _TestCache.load(str(path)).entries == {}
+
+    path.write_text(json.dumps({"version": 1, "generation": 3, "items": {}}))
+    cache = _TestCache.load(str(path))
+    assert cache.entries == {}
+    assert cache.generation == 0
+
+    # In-memory caches are never written
+    cache = _TestCache(None)
+    cache.put("a", "A")
+    cache.save()
@@ -0,0 +1,109 @@
+# Author: Felix Fontein <felix@fontein.de>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-FileCopyrightText: 2026, Ansible Project
+
+"""
+Test writing files only if they changed.
+"""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from antsibull_changelog.output_file import OutputFile
+
+
+def _set_old_mtime(path) -> int:
+    os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+    return os.stat(path).st_mtime_ns
+
+
+@pytest.mark.parametrize(
+    "old_content, new_content, changed",
+    [
+        (None, "foo\n", True),
+        ("foo\n", "foo\n", False),
+        ("foo\n", "bar\n", True),
+        ("foo\n", "foo\nbar\n", True),
+        ("foo\nbar\n", "foo\n", True),
+        ("", "", False),
+    ],
+)
+def test_output_file(old_content, new_content, changed, tmp_path):
+    path = tmp_path / "file.txt"
+    mtime = None
+    if old_content is not None:
+        path.write_text(old_content, encoding="utf-8")
+        path.chmod(0o640)
+        mtime = _set_old_mtime(path)
+
+    output_file = OutputFile(str(path))
+    with output_file as f:
+        f.write(new_content)
+    assert output_file.changed == changed
+    assert path.read_text(encoding="utf-8") == new_content
+    assert sorted(os.listdir(tmp_path)) == ["file.txt"]
+    if old_content is not None:
+        assert path.stat().st_mode & 0o777 == 0o640
+        assert (path.stat().st_mtime_ns == mtime) != changed
+
+
+def test_output_file_binary(tmp_path):
+    path = tmp_path / "file.bin"
+    path.write_bytes(b"\x00\x01")
+    mtime = _set_old_mtime(path)
+
+    output_file = OutputFile(str(path), encoding=None)
+    with output_file as f:
+        f.write(b"\x00")
+        f.write(b"\x01")
+    assert not output_file.changed
+    assert path.stat().st_mtime_ns == mtime
+
+    output_file = OutputFile(str(path), encoding=None, compare=False)
+    with output_file as f:
+        f.write(b"\x00\x01")
+    assert output_file.changed
+    assert path.stat().st_mtime_ns != mtime
+
+
+def test_output_file_symlink(tmp_path):
+    path = tmp_path / "file.txt"
+    path.write_text("foo\n", encoding="utf-8")
+    link = tmp_path / "link.txt"
+    link.symlink_to(path)
+
+    output_file = OutputFile(str(link))
+    with output_file as f:
+        f.write("bar\n")
+    assert output_file.changed
+    assert link.is_symlink()
+    assert path.read_text(encoding="utf-8") == "bar\n"
+
+
+@pytest.mark.parametrize("compare", [True, False])
+def test_output_file_error(compare, tmp_path):
+    path = tmp_path / "file.txt"
+    path.write_text("foo\n", encoding="utf-8")
+
+    # The existing file is not touched if writing fails
+    with pytest.raises(ValueError):
+        with OutputFile(str(path), compare=compare) as f:
+            f.write("bar\n")
+            raise ValueError("error")
+    assert path.read_text(encoding="utf-8") == "foo\n"
+    assert sorted(os.listdir(tmp_path)) == ["file.txt"]
+
+
+def test_output_file_new_file_mode(tmp_path):
+    # New files get the same permissions as files created with open()
+    reference = tmp_path / "reference.txt"
+    reference.write_text("", encoding="utf-8")
+    path = tmp_path / "file.txt"
+    with OutputFile(str(path), compare=False) as f:
+        f.write("foo\n")
+    assert path.read_text(encoding="utf-8") == "foo\n"
+    assert path.stat().st_mode & 0o777 == reference.stat().st_mode & 0o777
@@ -0,0 +1,239 @@
+# Author: Felix Fontein <felix@fontein.de>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-FileCopyrightText: 2026, Ansible Project
+
+"""
+Test plugins module.
+"""
+
+from __future__ import annotations
+
+import importlib.metadata
+import io
+import json
+from contextlib import contextmanager
+
+import packaging.version
+import pytest
+
+from antsibull_changelog.config import PathsConfig
+from antsibull_changelog.plugins import (
+    PluginDescription,
+    _get_ansible_core_version,
+    _get_files_size,
+    _list_copied_files,
+    extract_plugin_documentation,
+    run_ansible_doc_metadata_dump,
+)
+
+EXTRACT_PLUGIN_DOCUMENTATION_DATA = [
+    (
+        'DOCUMENTATION = r"""\nshort_description: Foo\nversion_added: 1.2.0\n"""\n',
+        {"short_description": "Foo", "version_added": "1.2.0"},
+    ),
+    (
+        "DOCUMENTATION = 'short_description: Foo'\n"
+        "DOCUMENTATION = 'short_description: Bar'\n",
+        {"short_description": "Bar"},
+    ),
+    (
+        "DOCUMENTATION = 'short_description: Foo'\nEXAMPLES = ''\nRETURN = ''\n",
+        {"short_description": "Foo"},
+    ),
+    # No DOCUMENTATION
+    ("EXAMPLES = ''\n", None),
+    # DOCUMENTATION is not a string literal
+    ("DOCUMENTATION = 'short_description: ' + 'Foo'\n", None),
+    (
+        "DOCUMENTATION = 'short_description: Foo'\nDOCUMENTATION += ''\n",
+        {"short_description": "Foo"},
+    ),
+    # Invalid YAML
+    ("DOCUMENTATION = 'short_description: [Foo'\n", None),
+    # Documentation is not a dictionary, or has no short description
+    ("DOCUMENTATION = '- Foo'\n", None),
+    ("DOCUMENTATION = 'description: Foo'\n", None),
+    ("DOCUMENTATION = 'short_description: [Foo]'\n", None),
+    # Syntax error
+    ("DOCUMENTATION = 'short_description: Foo\n", None),
+]
+
+
+@pytest.mark.parametrize("source, expected", EXTRACT_PLUGIN_DOCUMENTATION_DATA)
+def test_extract_plugin_documentation(source, expected, tmp_path):
+    path = tmp_path / "plugin.py"
+    path.write_text(source)
+    assert extract_plugin_documentation(str(path)) == expected
+
+
+def test_extract_plugin_documentation_sidecar(tmp_path):
+    path = tmp_path / "plugin.py"
+    path.write_text("DOCUMENTATION = 'short_description: Foo'\n")
+    assert extract_plugin_documentation(str(path)) == {"short_description": "Foo"}
+    (tmp_path / "plugin.yml").write_text("DOCUMENTATION:\n  short_description: Bar\n")
+    assert extract_plugin_documentation(str(path)) is None
+    assert extract_plugin_documentation(str(tmp_path / "missing.py")) is None
+
+
+def test_run_ansible_doc_metadata_dump(tmp_path, monkeypatch):
+    commands = []
+    dump = {
+        "all": {
+            "module": {
+                "foo.bar.baz": {
+                    "doc": {
+                        "short_description": "Baz",
+                        "version_added": "1.0.0",
+                        "filename": "/path/to/baz.py",
+                        "options": {"value": {"description": "A value."}},
+                    },
+                    "examples": "- foo.bar.baz:\n",
+                    "metadata": None,
+                    "return": {"value": {"type": "int"}},
+                },
+            },
+            "role": {
+                "foo.bar.role": {
+                    "entry_points": {
+                        "main": {"short_description": "Role", "options": {}},
+                        "other": {"short_description": "Other"},
+                    },
+                    "path": "/path/to/role",
+                },
+            },
+            "lookup": {},
+        },
+    }
+
+    @contextmanager
+    def fake_stream_output(command):
+        commands.append(command)
+        yield io.BytesIO(json.dumps(dump).encode("utf-8"))
+
+    monkeypatch.setattr("antsibull_changelog.plugins.stream_output", fake_stream_output)
+    paths = PathsConfig.force_collection(str(tmp_path))
+    assert run_ansible_doc_metadata_dump(paths, "/playbook", "foo.bar") == {
+        "all": {
+            "module": {
+                "foo.bar.baz": {
+                    "doc": {
+                        "short_description": "Baz",
+                        "version_added": "1.0.0",
+                        "filename": "/path/to/baz.py",
+                    },
+                },
+            },
+            "role": {
+                "foo.bar.role": {
+                    "entry_points": {"main": {"short_description": "Role"}},
+                },
+            },
+            "lookup": {},
+        },
+    }
+    assert commands == [
+        ["ansible-doc", "--metadata-dump", "foo.bar", "--playbook-dir", "/playbook"]
+    ]
+
+
+def test_get_ansible_core_version(tmp_path, monkeypatch):
+    commands = []
+
+    def fake_check_output(command):
+        commands.append(command)
+        return b"ansible-doc [core 2.14.3]\n  config file = None\n"
+
+    def fake_get_ansible_release():
+        raise ValueError("Cannot import ansible.release")
+
+    monkeypatch.setattr("antsibull_changelog.plugins.check_output", fake_check_output)
+    monkeypatch.setattr(
+        "antsibull_changelog.plugins.get_ansible_release", fake_get_ansible_release
+    )
+    paths = PathsConfig.force_collection(str(tmp_path))
+
+    # The installed package's metadata is used if possible
+    monkeypatch.setattr(importlib.metadata, "version", lambda name: "2.16.1")
+    assert _get_ansible_core_version(paths) == packaging.version.Version("2.16.1")
+    assert commands == []
+
+    def fake_version(name):
+        raise importlib.metadata.PackageNotFoundError(name)
+
+    # Otherwise ansible-doc is asked
+    monkeypatch.setattr(importlib.metadata, "version", fake_version)
+    assert _get_ansible_core_version(paths) == packaging.version.Version("2.14.3")
+    assert commands == [["ansible-doc", "--version"]]
+
+
+def test_plugin_description_markup_cache(caplog):
+    data = {
+        "module": {
+            "foo": {"description": "Use O(bar)", "version_added": "1.0.0"},
+            "bar": {"description": "Cached", "version_added": None},
+            "baz": {"description": "Broken M(", "version_added": None},
+        },
+    }
+    markup_cache = {("Cached", True): "From cache"}
+    plugins = PluginDescription.from_dict(
+        data, add_plugin_period=True, markup_cache=markup_cache
+    )
+    assert [plugin.description for plugin in plugins] == [
+        "Use :literal:`bar`.",
+        "From cache",
+        "Broken M(.",
+    ]
+    assert markup_cache == {
+        ("Cached", True): "From cache",
+        ("Use O(bar)", True): "Use :literal:`bar`.",
+    }
+    assert "Error while parsing description of module baz" in caplog.text
+
+    plugins = PluginDescription.from_dict(data, markup_cache=markup_cache)
+    assert [plugin.description for plugin in plugins] == [
+        "Use :literal:`bar`",
+        "Cached",
+        "Broken M(",
+    ]
+    assert ("Use O(bar)", False) in markup_cache
+    assert ("Broken M(", False) not in markup_cache
+
+
+def test_plugin_description_list():
+    data = {
+        "module": {
+            "foo": {"description": ["A", "list"], "version_added": None},
+        },
+    }
+    markup_cache: dict[tuple[str, bool], str] = {}
+    plugins = PluginDescription.from_dict(
+        data, add_plugin_period=True, markup_cache=markup_cache
+    )
+    assert [plugin.description for plugin in plugins] == ["A\n\nlist"]
+    assert markup_cache == {}
+
+
+def test_list_copied_files(tmp_path, monkeypatch):
+    (tmp_path / "plugins" / "modules").mkdir(parents=True)
+    (tmp_path / "plugins" / "modules" / "foo.py").write_text("foo")
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "tests" / "ignored.bin").write_text("x" * 100)
+    (tmp_path / "galaxy.yml").write_text("bar")
+
+    files = _list_copied_files(str(tmp_path), "none")
+    assert sorted(files) == [
+        "galaxy.yml",
+        "plugins/modules/foo.py",
+        "tests/ignored.bin",
+    ]
+    assert _get_files_size(str(tmp_path), files) == 106
+
+    # Only files not ignored by Git are copied; directories are copied completely
+    monkeypatch.setattr(
+        "antsibull_changelog.plugins.list_git_files",
+        lambda directory, log_debug=None: [b"galaxy.yml", b"plugins", b"deleted.txt"],
+    )
+    files = _list_copied_files(str(tmp_path), "git")
+    assert sorted(files) == ["galaxy.yml", "plugins/modules/foo.py"]
+    assert _get_files_size(str(tmp_path), files) == 6
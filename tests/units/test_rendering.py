@@ -0,0 +1,273 @@
+# Author: Felix Fontein <felix@fontein.de>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-FileCopyrightText: 2026, Ansible Project
+
+"""
+Test rendering documents.
+"""
+
+from __future__ import annotations
+
+import io
+from unittest import mock
+
+import pytest
+from antsibull_docutils.markdown import render_as_markdown
+
+from antsibull_changelog.changes import ChangesData
+from antsibull_changelog.config import (
+    ChangelogConfig,
+    CollectionDetails,
+    PathsConfig,
+    TextFormat,
+)
+from antsibull_changelog.rendering import block_cache as _block_cache
+from antsibull_changelog.rendering.block_cache import BlockCache, get_block_key
+from antsibull_changelog.rendering.changelog import (
+    ChangelogGenerator,
+    create_document_renderer,
+)
+
+
+def _fill_document(renderer, sections: int) -> None:
+    renderer.set_title("Test Changelog")
+    renderer.add_toc("Topics", max_depth=2)
+    renderer.add_text(
+        "This changelog describes changes after version 0.1.0.",
+        text_format=TextFormat.RESTRUCTURED_TEXT,
+    )
+    for index in range(sections):
+        section = renderer.add_section(f"v1.{index}.0")
+        section.add_toc(max_depth=1)
+        subsection = section.add_section("Minor Changes")
+        subsection.add_fragment(
+            f"Add ``option_{index}`` to the module (https://example.com/{index}).",
+            text_format=TextFormat.RESTRUCTURED_TEXT,
+        )
+        subsection.add_fragment(
+            "A fragment\nspanning *multiple*\n\nparagraphs.",
+            text_format=TextFormat.RESTRUCTURED_TEXT,
+        )
+        subsection.close()
+        section.ensure_paragraph_break()
+        section.add_text("Some text.", text_format=TextFormat.RESTRUCTURED_TEXT)
+        section.close()
+
+
+@pytest.mark.parametrize(
+    "document_format", [TextFormat.RESTRUCTURED_TEXT, TextFormat.MARKDOWN]
+)
+@pytest.mark.parametrize("sections", [0, 1, 5])
+@pytest.mark.parametrize("flush_threshold", [0, 3, 512])
+def test_render_to(document_format, sections, flush_threshold, monkeypatch):
+    monkeypatch.setattr(
+        "antsibull_changelog.rendering._document._FLUSH_THRESHOLD", flush_threshold
+    )
+    expected_renderer = create_document_renderer(document_format)
+    _fill_document(expected_renderer, sections)
+    expected = expected_renderer.render()
+
+    renderer = create_document_renderer(document_format)
+    _fill_document(renderer, sections)
+    sink = io.StringIO()
+    renderer.render_to(sink)
+    assert sink.getvalue() == expected
+    assert renderer.get_warnings() == expected_renderer.get_warnings()
+
+
+@pytest.mark.parametrize(
+    "document_format", [TextFormat.RESTRUCTURED_TEXT, TextFormat.MARKDOWN]
+)
+def test_render_to_empty(document_format):
+    renderer = create_document_renderer(document_format, start_level=1)
+    sink = io.StringIO()
+    renderer.render_to(sink)
+    assert sink.getvalue() == renderer.render() == "\n"
+
+
+def _fill_releases(renderer, versions, block_cache=None, texts=()) -> None:
+    renderer.set_title("Test Changelog")
+    renderer.add_toc("Topics", max_depth=3)
+    for version in versions:
+        section = renderer.add_section(f"v{version}")
+        if block_cache is not None:
+            section.use_block_cache(block_cache)
+        section.add_toc(max_depth=2)
+        for title in ("Minor Changes", "Bugfixes"):
+            subsection = section.add_section(title)
+            subsection.add_fragment(
+                f"Fix ``{version}`` in {title.lower()}.",
+                text_format=TextFormat.RESTRUCTURED_TEXT,
+            )
+            for text in texts:
+                subsection.add_fragment(text, text_format=TextFormat.RESTRUCTURED_TEXT)
+            subsection.close()
+        section.close()
+
+
+def _render_releases(document_format, versions, block_cache=None, texts=()):
+    renderer = create_document_renderer(document_format)
+    _fill_releases(renderer, versions, block_cache=block_cache, texts=texts)
+    return renderer.render(), renderer.get_warnings()
+
+
+@pytest.mark.parametrize(
+    "document_format", [TextFormat.RESTRUCTURED_TEXT, TextFormat.MARKDOWN]
+)
+@pytest.mark.parametrize(
+    "texts",
+    [
+        (),
+        ("Some :unknown:`role`.", "Text\n\n.. sidebar:: Sidebar\n\n   Content"),
+    ],
+)
+def test_block_cache(document_format, texts, tmp_path):
+    if texts and document_format == TextFormat.RESTRUCTURED_TEXT:
+        texts = ()
+    path = str(tmp_path / "cache.json")
+    old_versions = ["1.1.0", "1.0.0"]
+    new_versions = ["2.0.0", "1.1.0", "1.0.0"]
+
+    block_cache = BlockCache.load(path)
+    result = _render_releases(document_format, old_versions, block_cache, texts)
+    assert result == _render_releases(document_format, old_versions, texts=texts)
+    assert len(block_cache.entries) == 2
+    block_cache.save()
+
+    # Reuse all blocks
+    block_cache = BlockCache.load(path)
+    for key in block_cache.entries:
+        block_cache.entries[key]["block"]["lines"].append("cached")
+    result = _render_releases(document_format, old_versions, block_cache, texts)
+    assert result[0].count("cached") == 2
+    assert len(block_cache.entries) == 2
+
+    # Adding a new release changes the IDs of the sections of older releases
+    block_cache = BlockCache.load(path)
+    result = _render_releases(document_format, new_versions, block_cache, texts)
+    assert result == _render_releases(document_format, new_versions, texts=texts)
+    assert len(block_cache.entries) == 3
+
+
+def test_block_cache_labels():
+    block_cache = BlockCache()
+    texts = (".. _label:\n\nText",)
+    result = _render_releases(
+        TextFormat.MARKDOWN, ["1.0.0"], block_cache=block_cache, texts=texts
+    )
+    assert result == _render_releases(TextFormat.MARKDOWN, ["1.0.0"], texts=texts)
+    # Blocks that register labels are not cached
+    assert block_cache.entries == {}
+
+
+@pytest.mark.parametrize(
+    "package", ["antsibull-docs-parser", "antsibull-docutils", "docutils"]
+)
+def test_block_key_dependencies(package):
+    def get_key(versions):
+        # pylint: disable-next=protected-access
+        _block_cache._get_render_dependencies.cache_clear()
+        with mock.patch(
+            "importlib.metadata.version",
+            side_effect=lambda name: versions.get(name, "1.0.0"),
+        ):
+            return get_block_key({"foo": "bar"})
+
+    try:
+        # Updating packages used for rendering invalidates all blocks
+        assert get_key({}) == get_key({})
+        assert get_key({package: "1.0.1"}) != get_key({})
+    finally:
+        # pylint: disable-next=protected-access
+        _block_cache._get_render_dependencies.cache_clear()
+
+
+def test_iter_entries():
+    paths = PathsConfig.force_collection("/")
+    collection_details = CollectionDetails(paths)
+    collection_details.namespace = "foo"
+    collection_details.name = "bar"
+    config = ChangelogConfig.default(paths, collection_details)
+    changes = ChangesData(config, "/dev/null", {"releases": {}})
+    for version in ["1.0.0", "1.1.0-a1", "1.1.0", "2.0.0"]:
+        changes.releases[version] = {
+            "changes": {"minor_changes": [f"Change in {version}."]},
+        }
+    generator = ChangelogGenerator(config, changes)
+
+    entries = generator.iter_entries()
+    first = next(entries)
+    assert first.version == "2.0.0"
+    assert first.changes == {"minor_changes": ["Change in 2.0.0."]}
+    rest = list(entries)
+    assert [entry.version for entry in rest] == ["1.1.0", "1.0.0"]
+    assert rest[0].changes == {
+        "minor_changes": ["Change in 1.1.0.", "Change in 1.1.0-a1."]
+    }
+
+    collected = generator.collect()
+    assert [entry.version for entry in collected] == ["2.0.0", "1.1.0", "1.0.0"]
+    assert [entry.changes for entry in collected] == [
+        entry.changes for entry in [first] + rest
+    ]
+
+    lazy_renderer = create_document_renderer(TextFormat.RESTRUCTURED_TEXT)
+    generator.generate(lazy_renderer)
+    renderer = create_document_renderer(TextFormat.RESTRUCTURED_TEXT)
+    generator.generate(renderer, release_entries=collected)
+    assert lazy_renderer.render() == renderer.render()
+
+
+_BATCH_TEXTS = [
+    "foo - add ``bar`` option (https://github.com/ansible-collections/foo.bar/pull/1).",
+    "A fragment\nspanning *multiple*\n\nparagraphs.",
+    "- list item\n- another item\n\n  nested paragraph",
+    "Literal::\n\n  code\n  more code",
+    "See `the docs <https://example.com>`_ and `the docs <https://example.com>`__.",
+    "Some <html> & special characters * _ [x](y) #hash.",
+    "Some :unknown:`role`.",
+    "Text\n\n.. sidebar:: Sidebar\n\n   Content",
+    "* unclosed emphasis",
+    ".. _label:\n\nText with label",
+    "Reference to label_.",
+    "Title\n=====\n\nText",
+    "Title\n=====\n\nText",
+    "foo - add ``bar`` option (https://github.com/ansible-collections/foo.bar/pull/1).",
+]
+
+
+@pytest.mark.parametrize("batch_size", [1, 3, 100])
+def test_md_batched_conversion(batch_size, monkeypatch):
+    def fill(renderer) -> None:
+        renderer.set_title("Test Changelog")
+        renderer.add_text(_BATCH_TEXTS[0], text_format=TextFormat.RESTRUCTURED_TEXT)
+        for index in range(3):
+            section = renderer.add_section(f"v1.{index}.0")
+            for text in _BATCH_TEXTS[index:]:
+                section.add_fragment(text, text_format=TextFormat.RESTRUCTURED_TEXT)
+            section.close()
+
+    with monkeypatch.context() as m:
+        m.setattr(
+            "antsibull_changelog.rendering.md_document.MDDocumentRenderer.prepare_texts",
+            lambda self, texts: None,
+        )
+        expected_renderer = create_document_renderer(TextFormat.MARKDOWN)
+        fill(expected_renderer)
+        expected = expected_renderer.render()
+
+    monkeypatch.setattr(
+        "antsibull_changelog.rendering.md_document._BATCH_SIZE", batch_size
+    )
+    renderer = create_document_renderer(TextFormat.MARKDOWN)
+    fill(renderer)
+    with mock.patch(
+        "antsibull_changelog.rendering.md_document.render_as_markdown",
+        wraps=render_as_markdown,
+    ) as render:
+        assert renderer.render() == expected
+    assert renderer.get_warnings() == expected_renderer.get_warnings()
+    assert renderer.unsupported_class_names == {"sidebar"}
+    if batch_size > 1:
+        assert render.call_count < 3 * len(_BATCH_TEXTS)
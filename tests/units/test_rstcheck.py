@@ -0,0 +1,98 @@
+# Author: Felix Fontein <felix@fontein.de>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-FileCopyrightText: 2026, Ansible Project
+
+"""
+Test rstcheck module.
+"""
+
+from __future__ import annotations
+
+from unittest import mock
+
+import pytest
+
+from antsibull_changelog import rstcheck
+from antsibull_changelog.rstcheck import check_rst_content, check_rst_contents
+
+SNIPPETS = [
+    "Fix *foo bar.",
+    "Uses ``inline`` and *emphasis*.",
+    "Unknown :foo:`bar` role.",
+    "Multi\nline *emphasis\nacross lines",
+    "First paragraph.\n\nSecond paragraph with `unterminated",
+    "",
+    "Some **strong",
+    "`link <https://example.com>`_",
+    "foo_ bar",
+    "x |y|",
+    "Title\n*****",
+    "- a\n- b",
+    "1. first",
+    "Foo::",
+    "Term\n  definition",
+    "``unterminated",
+    "Fix ``a_`` thing.",
+]
+
+
+@pytest.mark.parametrize(
+    "contents",
+    [
+        [],
+        SNIPPETS[:1],
+        SNIPPETS,
+        list(reversed(SNIPPETS)),
+        SNIPPETS[::2] + SNIPPETS[1::2],
+    ],
+)
+def test_check_rst_contents(contents):
+    assert check_rst_contents(contents) == [
+        check_rst_content(content) for content in contents
+    ]
+
+
+def test_check_rst_contents_batched():
+    contents = ["Fix *foo.", "Correct.", "Fix **bar.", "Multi\n\nline `foo"]
+    with mock.patch(
+        "antsibull_changelog.rstcheck.check_rst_content",
+        wraps=rstcheck.check_rst_content,
+    ) as check:
+        result = check_rst_contents(contents)
+    assert check.call_count == 1
+    assert result == [
+        [(1, 0, "(WARNING/2) Inline emphasis start-string without end-string.")],
+        [],
+        [(1, 0, "(WARNING/2) Inline strong start-string without end-string.")],
+        [
+            (
+                3,
+                0,
+                "(WARNING/2) Inline interpreted text or phrase reference"
+                " start-string without end-string.",
+            )
+        ],
+    ]
+
+
+def test_check_rst_contents_unassignable():
+    # Messages without line numbers cannot be assigned; check all snippets individually
+    with mock.patch(
+        "antsibull_changelog.rstcheck.check_rst_content",
+        side_effect=[[(0, 0, "message")], [], [(1, 0, "error")]],
+    ) as check:
+        result = check_rst_contents(["a", "b"])
+    assert check.call_count == 3
+    assert result == [[], [(1, 0, "error")]]
+
+
+@pytest.mark.parametrize("content", SNIPPETS)
+def test_check_rst_content_without_internals(content):
+    # Without the rstcheck-core internals, the content is checked as a file
+    expected = check_rst_content(content)
+    with mock.patch(
+        "antsibull_changelog.rstcheck._has_rstcheck_core_internals",
+        return_value=False,
+    ):
+        assert check_rst_content(content) == expected
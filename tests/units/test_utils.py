@@ -12,11 +12,18 @@ from __future__ import annotations
 import subprocess
 from unittest import mock
 
+import packaging.version
 import pytest
+import semantic_version
 
+from antsibull_changelog import utils
 from antsibull_changelog.config import ChangelogConfig, CollectionDetails, PathsConfig
 from antsibull_changelog.errors import ChangelogError
-from antsibull_changelog.utils import is_release_version
+from antsibull_changelog.utils import (
+    collect_versions,
+    get_version_constructor,
+    is_release_version,
+)
 
 
 @pytest.mark.parametrize(
@@ -87,3 +94,98 @@ def test_is_release_version_collection_fail(version):
     config = ChangelogConfig.default(paths, CollectionDetails(paths))
     with pytest.raises(ChangelogError):
         is_release_version(config, version)
+
+
+@pytest.mark.parametrize(
+    "use_semantic_versioning, version_class",
+    [
+        (True, semantic_version.Version),
+        (False, packaging.version.Version),
+    ],
+)
+def test_get_version_constructor(use_semantic_versioning, version_class):
+    paths = PathsConfig.force_collection(".")
+    config = ChangelogConfig.default(paths, CollectionDetails(paths))
+    config.use_semantic_versioning = use_semantic_versioning
+    version_constructor = get_version_constructor(config)
+    version = version_constructor("1.2.3")
+    assert isinstance(version, version_class)
+    assert version == version_class("1.2.3")
+    # Version objects are cached
+    assert version_constructor("1.2.3") is version
+    assert get_version_constructor(config)("1.2.3") is version
+    # Errors are not cached
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            version_constructor("foo")
+
+
+def test_collect_versions():
+    paths = PathsConfig.force_collection(".")
+    config = ChangelogConfig.default(paths, CollectionDetails(paths))
+    versions = ["1.0.0", "1.1.0-beta", "1.1.0", "1.2.0-a1", "1.2.0-a2", "0.1.0"]
+    assert collect_versions(versions, config) == [
+        ("1.2.0-a2", ["1.2.0-a2"]),
+        ("1.2.0-a1", ["1.2.0-a1"]),
+        ("1.1.0", ["1.1.0", "1.1.0-beta"]),
+        ("1.0.0", ["1.0.0"]),
+        ("0.1.0", ["0.1.0"]),
+    ]
+    assert collect_versions(
+        versions, config, after_version="1.0.0", until_version="1.2.0-a1"
+    ) == [
+        ("1.2.0-a1", ["1.2.0-a1"]),
+        ("1.1.0", ["1.1.0", "1.1.0-beta"]),
+    ]
+    assert collect_versions(versions, config, after_version="1.0.0", squash=True) == [
+        ("1.2.0-a2", ["1.2.0-a2", "1.2.0-a1", "1.1.0", "1.1.0-beta"]),
+    ]
+
+
+@pytest.mark.parametrize(
+    "versions",
+    [
+        [],
+        ["1.0.0"],
+        ["1.0.0-a1"],
+        ["1.0.0", "1.1.0-beta", "1.1.0", "1.2.0-a1", "1.2.0-a2", "0.1.0"],
+        ["1.0.0", "1.1.0-beta", "1.1.0-rc1", "1.1.0", "1.0.1-a1", "0.1.0"],
+        ["2.0.0", "2.0.0-rc1", "1.5.0-a1", "1.0.0", "0.9.0-b1"],
+        ["2.0.0-rc2", "2.0.0-rc1", "1.0.0"],
+    ],
+)
+def test_collect_versions_only_latest(versions):
+    paths = PathsConfig.force_collection(".")
+    config = ChangelogConfig.default(paths, CollectionDetails(paths))
+    for kwargs in [
+        {},
+        {"squash": True},
+        {"after_version": "1.0.0"},
+        {"until_version": "1.1.0"},
+    ]:
+        assert (
+            collect_versions(versions, config, only_latest=True, **kwargs)
+            == collect_versions(versions, config, **kwargs)[:1]
+        )
+
+
+def test_is_release_version_cache():
+    paths = PathsConfig.force_ansible(".")
+    config = ChangelogConfig.default(paths, CollectionDetails(paths))
+    assert config.release_tag_pattern is config.release_tag_pattern
+    with mock.patch(
+        "antsibull_changelog.utils._is_release_version",
+        wraps=utils._is_release_version,
+    ) as classify:
+        assert is_release_version(config, "2.10b1") is False
+        assert is_release_version(config, "2.10b1") is False
+        assert classify.call_count == 1
+        # Changing the configuration invalidates the cached results
+        config.pre_release_tag_re = r"(?P<pre_release>\.\d+(?:[a]|rc)+\d*)$"
+        assert is_release_version(config, "2.10b1") is True
+        assert classify.call_count == 2
+        # Errors are not cached
+        for _ in range(2):
+            with pytest.raises(ChangelogError):
+                is_release_version(config, "A")
+        assert classify.call_count == 4